@@ -0,0 +1,338 @@
+"""Benchmarks of lifelib models on synthetic model points
+
+This module measures the run time and memory usage of the models listed
+in :data:`MODELS` on synthetic portfolios of different sizes,
+and saves the results in a JSON file, so that
+the results of different releases can be compared by
+:func:`compare_results`.
+
+For each pair of a model and a number of model points,
+:func:`run_benchmarks` records:
+
+* the time to read the model,
+* the wall time to calculate the present values of the model points,
+* the peak resident set size (RSS) of the process, and
+* the time spent in each cell, measured by the call stack trace of modelx.
+
+Each measurement is made in a new process started by the ``"spawn"``
+method, so that the results are not affected by the memory used by
+previous measurements or by the process running the benchmark.
+Since the call stack trace slows down the calculation,
+the time spent in each cell is measured separately from
+the wall time.
+
+The synthetic model points are sampled with replacement
+from the :attr:`model_point_table` of each model, so they have the same
+format and the same distribution as the original model points.
+
+Example:
+    Run the benchmarks from the command line::
+
+        $ python -m lifelib.benchmark --models BasicTerm_ME BasicTerm_M --sizes 1000 10000 --output bench.json
+
+    Compare the results with those of a previous release::
+
+        >>> from lifelib.benchmark import compare_results
+
+        >>> compare_results("bench_old.json", "bench.json")
+"""
+import argparse
+import datetime
+import json
+import multiprocessing
+import os.path
+import platform
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import modelx as mx
+import numpy as np
+import pandas as pd
+
+import lifelib
+from lifelib._dirs import TEMPLATES
+from lifelib.runner import table_space_of, run_seriatim
+
+try:
+    import resource
+except ImportError:     # Windows
+    resource = None
+
+#: Models to benchmark, keyed by their names with
+#: the names of their libraries and whether they are seriatim models.
+MODELS = {
+    'BasicTerm_S': ('basiclife', True),
+    'BasicTerm_SE': ('basiclife', True),
+    'BasicTerm_M': ('basiclife', False),
+    'BasicTerm_ME': ('basiclife', False),
+    'BasicTermASL_ME': ('basiclife', False),
+    'CashValue_ME': ('savings', False)
+}
+
+SIZES = (1000, 10000, 100000)
+
+
+def model_path(name):
+    """Return the path to the model in lifelib"""
+    return os.path.join(TEMPLATES[MODELS[name][0]], name)
+
+
+def synthetic_table(table, size, seed=0):
+    """Generate synthetic model points from a model point table
+
+    Returns a DataFrame of ``size`` rows sampled with replacement
+    from ``table``. The index is renumbered from 1.
+
+    Args:
+        table(:obj:`~pandas.DataFrame`): Model points to sample from
+        size(:obj:`int`): The number of model points to generate
+        seed(:obj:`int`, optional): Seed of the random number generator.
+            Defaults to 0.
+    """
+    rng = np.random.default_rng(seed)
+    result = table.iloc[rng.integers(len(table), size=size)]
+    result.index = pd.RangeIndex(1, size + 1, name=table.index.name)
+    return result
+
+
+def peak_rss():
+    """Return the peak RSS of the current process in MB
+
+    Returns ``None`` if the platform does not provide
+    the :mod:`resource` module.
+    """
+    if resource is None:
+        return None
+
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform == 'darwin':
+        return rss / 2 ** 20    # bytes
+    else:
+        return rss / 2 ** 10    # kilobytes
+
+
+def _cell_name(key):
+    # 'BasicTerm_S.Projection[1].pv_claims()' -> 'Projection.pv_claims'
+    key = re.sub(r"\[[^\]]*\]", "", key.split(".", 1)[-1])
+    return key.split("(")[0]
+
+
+def _run(space, seriatim):
+    if seriatim:
+        return float(run_seriatim(space)['pv_net_cf'].sum())
+    else:
+        return float(np.sum(space.pv_net_cf()))
+
+
+def _trace(space, seriatim, cell_times):
+
+    def trace(target):
+        mx.start_stacktrace(maxlen=None)
+        try:
+            target.pv_net_cf()
+            summary = mx.get_stacktrace(summarize=True)
+        finally:
+            mx.stop_stacktrace()
+
+        for key, value in summary.items():
+            name = _cell_name(key)
+            cell_times[name] = cell_times.get(name, 0) + value['duration']
+
+    if seriatim:
+        # Trace model points one by one to keep the trace small
+        for i in space.model_point_table.index:
+            trace(space[i])
+            del space[i]
+    else:
+        trace(space)
+
+
+def _run_case(name, size, seed, profile):
+    start = time.perf_counter()
+    model = mx.read_model(model_path(name))
+    load_time = time.perf_counter() - start
+
+    space = model.Projection
+    table_space = table_space_of(space)
+    table_space.model_point_table = synthetic_table(
+        table_space.model_point_table, size, seed)
+
+    if profile:
+        cell_times = {}
+        _trace(space, MODELS[name][1], cell_times)
+        return {'cell_times': cell_times}
+
+    start = time.perf_counter()
+    pv_net_cf = _run(space, MODELS[name][1])
+    wall_time = time.perf_counter() - start
+
+    return {'load_time': load_time,
+            'wall_time': wall_time,
+            'peak_rss': peak_rss(),
+            'pv_net_cf': pv_net_cf}
+
+
+def run_case(name, size, seed=0, profile=True):
+    """Run the benchmark of a model on synthetic model points
+
+    Reads the model in a new process, replaces its
+    :attr:`model_point_table` with ``size`` synthetic model points
+    generated by :func:`synthetic_table`, and
+    calculates the present values of net cashflows of all
+    the model points.
+    Returns a dict of the results with the following keys:
+
+    * ``'model'``, ``'size'``: ``name`` and ``size``
+    * ``'load_time'``: Seconds to read the model
+    * ``'wall_time'``: Seconds to calculate the present values
+    * ``'peak_rss'``: The peak RSS of the process in MB
+    * ``'pv_net_cf'``: The sum of the present values, to check that
+      results of different releases are comparable
+    * ``'cell_times'``: Dict of the seconds spent in each cell, excluding
+      the time spent in the cells it calls.
+      Only included if ``profile`` is ``True``.
+
+    Args:
+        name(:obj:`str`): The name of the model in :data:`MODELS`
+        size(:obj:`int`): The number of model points
+        seed(:obj:`int`, optional): Seed to generate model points.
+            Defaults to 0.
+        profile(:obj:`bool`, optional): Whether to measure the time
+            spent in each cell. Defaults to ``True``.
+    """
+    result = {'model': name, 'size': size}
+    for pass_ in ((False, True) if profile else (False,)):
+        with ProcessPoolExecutor(
+                max_workers=1,
+                mp_context=multiprocessing.get_context("spawn")) as executor:
+            result.update(
+                executor.submit(_run_case, name, size, seed, pass_).result())
+    return result
+
+
+def run_benchmarks(models=None, sizes=SIZES, seed=0, profile=True,
+                   output=None):
+    """Run benchmarks of models at different sizes
+
+    Runs :func:`run_case` for each combination of ``models`` and ``sizes``,
+    and returns a dict of the results and the environment,
+    such as the versions of lifelib, modelx, NumPy and Python.
+    If ``output`` is given, the dict is also saved in the file in JSON.
+
+    Args:
+        models(optional): Names of the models. Defaults to all
+            the models in :data:`MODELS`.
+        sizes(optional): The numbers of model points.
+            Defaults to :data:`SIZES`.
+        seed(:obj:`int`, optional): Seed to generate model points.
+            Defaults to 0.
+        profile(:obj:`bool`, optional): Whether to measure the time
+            spent in each cell. Defaults to ``True``.
+        output(:obj:`str`, optional): Path to the JSON file to save.
+    """
+    if models is None:
+        models = list(MODELS)
+
+    result = {
+        'created': datetime.datetime.now().isoformat(timespec='seconds'),
+        'environment': {
+            'lifelib': lifelib.__version__,
+            'modelx': mx.__version__,
+            'numpy': np.__version__,
+            'pandas': pd.__version__,
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'machine': platform.machine()
+        },
+        'seed': seed,
+        'results': [run_case(name, size, seed, profile)
+                    for name in models for size in sizes]
+    }
+
+    if output is not None:
+        with open(output, 'w') as f:
+            json.dump(result, f, indent=2)
+
+    return result
+
+
+def load_results(path):
+    """Load benchmark results as a DataFrame
+
+    Returns a DataFrame indexed by the model name and the size,
+    with columns ``load_time``, ``wall_time``, ``peak_rss``
+    and ``pv_net_cf``.
+
+    Args:
+        path(:obj:`str`): Path to the JSON file saved by
+            :func:`run_benchmarks`
+    """
+    with open(path) as f:
+        results = json.load(f)['results']
+
+    columns = ['model', 'size', 'load_time', 'wall_time',
+               'peak_rss', 'pv_net_cf']
+    return pd.DataFrame(
+        [{k: r.get(k) for k in columns} for r in results],
+        columns=columns).set_index(['model', 'size'])
+
+
+def compare_results(base, new):
+    """Compare two sets of benchmark results
+
+    Returns a DataFrame of ``wall_time`` and ``peak_rss`` of
+    ``base`` and ``new`` for the models and the sizes in both of them,
+    and the ratios of ``new`` to ``base``.
+    Ratios greater than 1 indicate regressions.
+
+    Args:
+        base(:obj:`str`): Path to the JSON file of the base results
+        new(:obj:`str`): Path to the JSON file of the new results
+    """
+    base = load_results(base)
+    new = load_results(new)
+    index = base.index.intersection(new.index)
+
+    data = {}
+    for name in ('wall_time', 'peak_rss'):
+        data[name + '_base'] = base.loc[index, name]
+        data[name + '_new'] = new.loc[index, name]
+        data[name + '_ratio'] = new.loc[index, name] / base.loc[index, name]
+
+    return pd.DataFrame(data, index=index)
+
+
+def get_argparser():
+    parse = argparse.ArgumentParser(
+        description="Run benchmarks of lifelib models.")
+    parse.add_argument('--models', nargs='+', default=list(MODELS),
+                       choices=list(MODELS), help="Names of models")
+    parse.add_argument('--sizes', nargs='+', type=int, default=list(SIZES),
+                       help="Numbers of model points")
+    parse.add_argument('--seed', type=int, default=0,
+                       help="Seed to generate model points")
+    parse.add_argument('--no-profile', action='store_true',
+                       help="Skip measuring the time spent in each cell")
+    parse.add_argument('--output', default='benchmark.json',
+                       help="Path to the JSON file to save the results")
+    return parse
+
+
+def main(argv=sys.argv[1:]):
+    """Run benchmarks of lifelib models."""
+
+    args = get_argparser().parse_args(argv)
+    result = run_benchmarks(args.models, args.sizes, args.seed,
+                            not args.no_profile, args.output)
+
+    for r in result['results']:
+        print("%s %d: %.3f sec, %s MB" % (
+            r['model'], r['size'], r['wall_time'], r['peak_rss']))
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
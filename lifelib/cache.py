@@ -0,0 +1,160 @@
+"""Binary cache for Excel input files of lifelib models
+
+Reading the Excel input files of the models, such as
+*model_point_table.xlsx* and *mort_table.xlsx*, takes most of the time
+of :func:`modelx.read_model` when the files have many rows.
+:func:`read_model` reads a model while caching the tables read from
+Excel files in a binary format, and reuses the cached tables
+the next time the same files are read.
+
+A cached table is identified by the path and the contents of
+the source file and the arguments passed to :func:`pandas.read_excel`,
+so the cache is invalidated when the source file is modified.
+
+The cached tables are saved in pickle files in the folder given by
+the environment variable ``LIFELIB_CACHE_DIR``, or
+*.cache/lifelib* under the home folder if the variable is not set.
+
+Example:
+    Read :mod:`~savings.CashValue_ME` using the cache::
+
+        >>> from lifelib.cache import read_model
+
+        >>> model = read_model("CashValue_ME")
+"""
+import contextlib
+import glob
+import hashlib
+import os
+import os.path
+import pickle
+import tempfile
+
+import modelx as mx
+import pandas as pd
+
+_read_excel = pd.read_excel
+
+
+def default_cache_dir():
+    """Return the path to the folder to save cached tables"""
+    return os.environ.get(
+        "LIFELIB_CACHE_DIR",
+        os.path.join(os.path.expanduser("~"), ".cache", "lifelib"))
+
+
+def _file_hash(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def cache_path(path, cache_dir=None, **kwargs):
+    """Return the path to the cache file of an Excel file
+
+    The file name consists of the name of the source file,
+    the hash of its absolute path, the hash of ``kwargs``
+    and the hash of its contents.
+    """
+    if cache_dir is None:
+        cache_dir = default_cache_dir()
+
+    path = os.path.abspath(path)
+    path_key = hashlib.sha256(path.encode()).hexdigest()[:16]
+    args_key = hashlib.sha256(
+        repr(sorted(kwargs.items())).encode()).hexdigest()[:16]
+    data_key = _file_hash(path)[:16]
+
+    stem = os.path.splitext(os.path.basename(path))[0]
+    return os.path.join(
+        cache_dir, "%s-%s-%s-%s.pickle" % (stem, path_key, args_key, data_key))
+
+
+def read_excel(path, cache_dir=None, **kwargs):
+    """Read an Excel file through the cache
+
+    Returns the table cached for ``path`` and ``kwargs`` if it exists.
+    Otherwise, reads ``path`` by :func:`pandas.read_excel`
+    passing ``kwargs``, saves the result in the cache
+    and removes the tables cached for the previous contents of ``path``
+    read with the same ``kwargs``.
+
+    The result is written to a temporary file, which then replaces
+    the cache file, so processes reading the same file at the same time
+    never see a partly written cache file.
+    A cache file that cannot be read is treated as missing.
+
+    Args:
+        path(:obj:`str`): Path to the Excel file
+        cache_dir(:obj:`str`, optional): Path to the cache folder.
+            Defaults to the value returned by :func:`default_cache_dir`.
+        kwargs: Keyword arguments passed to :func:`pandas.read_excel`
+    """
+    cached = cache_path(path, cache_dir, **kwargs)
+    try:
+        return pd.read_pickle(cached)
+    except (OSError, EOFError, pickle.UnpicklingError):
+        pass
+
+    result = _read_excel(path, **kwargs)
+
+    prefix = cached.rsplit("-", 1)[0]
+    for stale in glob.glob(glob.escape(prefix) + "-*.pickle"):
+        if stale != cached:
+            try:
+                os.remove(stale)
+            except FileNotFoundError:
+                pass
+
+    cache_dir = os.path.dirname(cached)
+    os.makedirs(cache_dir, exist_ok=True)
+    fd, temp = tempfile.mkstemp(suffix=".tmp", dir=cache_dir)
+    os.close(fd)
+    try:
+        result.to_pickle(temp)
+        os.replace(temp, cached)
+    except BaseException:
+        os.remove(temp)
+        raise
+
+    return result
+
+
+@contextlib.contextmanager
+def excel_cache(cache_dir=None):
+    """Context manager to read Excel files through the cache
+
+    Within the ``with`` block, :func:`pandas.read_excel`
+    is replaced so that Excel files given by their paths are read by
+    :func:`read_excel`. Other calls are passed to the original function.
+    """
+    def cached_read_excel(io, *args, **kwargs):
+        if (not args and isinstance(io, (str, os.PathLike))
+                and os.path.isfile(io)):
+            return read_excel(io, cache_dir=cache_dir, **kwargs)
+        else:
+            return _read_excel(io, *args, **kwargs)
+
+    pd.read_excel = cached_read_excel
+    try:
+        yield
+    finally:
+        pd.read_excel = _read_excel
+
+
+def read_model(model_path, name=None, cache_dir=None):
+    """Read a model using the cache for its Excel input files
+
+    Reads the model by :func:`modelx.read_model`
+    within :func:`excel_cache`.
+
+    Args:
+        model_path(:obj:`str`): Path to the model folder
+        name(:obj:`str`, optional): Name of the model to read as
+        cache_dir(:obj:`str`, optional): Path to the cache folder.
+            Defaults to the value returned by :func:`default_cache_dir`.
+    """
+    with excel_cache(cache_dir):
+        return mx.read_model(model_path, name=name)
@@ -0,0 +1,239 @@
+"""Streaming export of the values of Cells by step
+
+:func:`write_cells` writes the values of any set of Cells of a model
+for all the model points and all the steps to a file,
+chunk by chunk of model points, so that
+seriatim cashflows of large portfolios can be passed to
+downstream processes without holding all of them in a DataFrame.
+:func:`read_cells` reads the written file back as a DataFrame.
+
+The Cells to write take the step as their first argument, such as
+:func:`~basiclife.BasicTermASL_ME.Projection.premiums` and
+:func:`~basiclife.BasicTerm_ME.Projection.pols_if`,
+and return the values for all the model points as a Series
+indexed by the model point IDs or as a 1D array in the same order.
+Scalar values are broadcast to all the model points.
+
+The file is a long table with the columns of the model point ID,
+the step named ``step``, and the values of the Cells.
+The format is chosen by the extension of the file:
+
+* *.parquet*: Parquet file with a row group per chunk
+* *.arrow* or *.feather*: Arrow IPC file with a record batch per chunk
+* *.csv*: CSV file
+
+Parquet and Arrow files require `pyarrow`_.
+
+.. _pyarrow: https://arrow.apache.org/docs/python/
+
+Example:
+    Write the cashflows of :mod:`~basiclife.BasicTermASL_ME`
+    by 1000 model points::
+
+        >>> import modelx as mx
+        >>> from lifelib.export import write_cells, read_cells
+
+        >>> model = mx.read_model("BasicTermASL_ME")
+        >>> write_cells("cashflows.parquet", model.Projection,
+        ...             ["premiums", "claims", "expenses", "commissions"],
+        ...             chunks=1000)
+
+        >>> read_cells("cashflows.parquet")
+"""
+import os.path
+
+import numpy as np
+import pandas as pd
+
+from lifelib.runner import iter_chunks, table_space_of
+
+try:
+    import pyarrow
+    import pyarrow.ipc
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None
+
+FORMATS = {
+    '.parquet': 'parquet',
+    '.arrow': 'arrow',
+    '.feather': 'arrow',
+    '.csv': 'csv'
+}
+
+
+def format_of(path):
+    """Return the format of a file from its extension"""
+    ext = os.path.splitext(path)[1].lower()
+    if ext not in FORMATS:
+        raise ValueError("unsupported file extension: %s" % ext)
+
+    fmt = FORMATS[ext]
+    if fmt != 'csv' and pyarrow is None:
+        raise ImportError("pyarrow is required to write %s files" % fmt)
+
+    return fmt
+
+
+def column_name(cells):
+    """Return the column name of a Cells specification
+
+    ``cells`` is the name of a Cells, or a tuple of the name and
+    the arguments following the step, such as ``('pay_count', 'LAST')``.
+    The name and the arguments are joined with underscores.
+    """
+    if isinstance(cells, str):
+        return cells
+    return "_".join(str(k) for k in cells)
+
+
+class _TableWriter:
+
+    def __init__(self, path, fmt):
+        self.path = path
+        self.fmt = fmt
+        self.writer = None
+        self.schema = None
+        self.rows = 0
+
+    def write(self, df):
+        if self.fmt == 'csv':
+            df.to_csv(self.path, mode='a' if self.rows else 'w',
+                      header=not self.rows, index=False)
+        else:
+            table = pyarrow.Table.from_pandas(df, preserve_index=False)
+            if self.writer is None:
+                self.schema = table.schema
+                if self.fmt == 'parquet':
+                    self.writer = pyarrow.parquet.ParquetWriter(
+                        self.path, table.schema)
+                else:
+                    self.writer = pyarrow.ipc.new_file(
+                        self.path, table.schema)
+
+            self.writer.write_table(table.cast(self.schema))
+
+        self.rows += len(df)
+
+    def close(self):
+        if self.writer is not None:
+            self.writer.close()
+
+
+def _step_values(target, cells, step, index):
+    name, args = (cells, ()) if isinstance(cells, str) else (
+        cells[0], tuple(cells[1:]))
+
+    value = getattr(target, name)(step, *args)
+    if isinstance(value, pd.Series):
+        return value.reindex(index).to_numpy()
+    else:
+        return np.broadcast_to(np.asarray(value), (len(index),))
+
+
+def _write_chunk(writer, space, cells, chunk, table_space, params, steps):
+    # Collect the values of all the steps and write them at once,
+    # so that a chunk makes one row group instead of one per step
+    original = table_space.model_point_table
+    table_space.model_point_table = chunk
+    try:
+        # Item spaces are recreated after model_point_table is replaced
+        target = space if params is None else space[params]
+        index = chunk.index
+        id_name = index.name or 'point_id'
+        if steps is None:
+            steps = range(target.max_proj_len())
+
+        frames = []
+        for step in steps:
+            data = {id_name: index.to_numpy(),
+                    'step': np.full(len(index), step)}
+            for c in cells:
+                data[column_name(c)] = _step_values(target, c, step, index)
+
+            frames.append(pd.DataFrame(data))
+
+        if frames:
+            writer.write(pd.concat(frames, ignore_index=True))
+
+    finally:
+        table_space.model_point_table = original
+
+
+def write_cells(path, space, cells, chunks=None, table_space=None,
+                params=None, steps=None):
+    """Write the values of Cells by step to a file
+
+    Writes the values of ``cells`` of ``space`` at each step
+    for all the model points to ``path``, in the format
+    chosen by the extension of ``path``.
+    The model points are run chunk by chunk if ``chunks`` is given,
+    and the values of each chunk are written at once after
+    all the steps of the chunk are calculated.
+    Since the values of the Cells are cleared every time
+    :attr:`model_point_table` is replaced, the peak memory
+    is bounded by the size of the largest chunk, not by
+    the size of the output.
+
+    Returns the number of rows written.
+
+    Args:
+        path(:obj:`str`): Path to the output file
+        space: The space to run, such as ``Projection``.
+        cells: Names of the Cells to write. A tuple of the name and
+            the arguments following the step can be given in place of
+            a name, such as ``('pay_count', 'LAST')``.
+            The column names are given by :func:`column_name`.
+        chunks(optional): Chunk size as :obj:`int` or iterable of
+            :obj:`~pandas.DataFrame` in the same format as
+            :attr:`model_point_table`, as in
+            :func:`~lifelib.runner.run_chunked`.
+            Defaults to all the model points at once.
+        table_space(optional): The space that defines
+            :attr:`model_point_table`.
+            Defaults to the value returned by
+            :func:`~lifelib.runner.table_space_of`.
+        params(:obj:`tuple`, optional): Arguments to ``space``
+            to select an item space.
+        steps(optional): Steps to write. Defaults to
+            ``range(max_proj_len())`` of each chunk.
+    """
+    fmt = format_of(path)
+
+    if table_space is None:
+        table_space = table_space_of(space)
+
+    if chunks is None:
+        chunks = [table_space.model_point_table]
+    elif isinstance(chunks, int):
+        chunks = iter_chunks(table_space.model_point_table, chunks)
+
+    writer = _TableWriter(path, fmt)
+    try:
+        for chunk in chunks:
+            _write_chunk(writer, space, cells, chunk, table_space,
+                         params, steps)
+    finally:
+        writer.close()
+
+    return writer.rows
+
+
+def read_cells(path, columns=None):
+    """Read a file written by :func:`write_cells`
+
+    Returns a DataFrame of the values in the file.
+
+    Args:
+        path(:obj:`str`): Path to the file
+        columns(optional): Names of the columns to read.
+            Defaults to all the columns.
+    """
+    fmt = format_of(path)
+
+    if fmt == 'csv':
+        return pd.read_csv(path, usecols=columns)
+    elif fmt == 'parquet':
+        return pd.read_parquet(path, columns=columns)
+    else:
+        return pd.read_feather(path, columns=columns)
@@ -119,6 +119,29 @@ Attributes:
         The start date needs to be an end-of-month date.
         By default, '2021-12-31' is assigned.
 
+    monthly_steps: The number of monthly steps at the beginning
+        of the projection. 60 by default.
+        See :func:`offset`.
+
+    coarse_months: The number of months in each step after
+        the monthly steps. 12 by default, in which case the steps
+        end on the last days of years. Must not be greater than 12.
+        See :func:`offset`.
+
+    engine: A string to select how the numbers of policies
+        are calculated for the present values.
+        ``"cells"`` by default, in which case
+        :func:`pv_claims`, :func:`pv_pols_if` and :func:`pols_if_pay_array`
+        are calculated from the values of :func:`pols_death`,
+        :func:`pols_if` and :func:`pols_if_pay` step by step.
+        If ``"array"`` is assigned, they are calculated from
+        the arrays returned by :func:`array_sweep`, which
+        gives the same values with far fewer calls of Cells.
+
+        .. seealso::
+
+           * :func:`array_sweep`
+
 
     np: The `numpy`_ module.
     pd: The `pandas`_ module.
@@ -172,6 +195,101 @@ def age_at_entry():
     return model_point()["age_at_entry"]
 
 
+def array_sweep():
+    """Numbers of policies of all the model points by one forward sweep
+
+    Calculates the numbers of policies for all the model points
+    and all ``i`` from 0 to :func:`max_proj_len` - 1, and
+    returns them in a dict of 2D numpy arrays.
+    The first axis of the arrays is ``i``
+    and the second axis is model points.
+    The keys of the dict are the names of the Cells the arrays correspond to.
+    The values for ``"pols_if_at"``, ``"pols_death"``, ``"pols_lapse"``
+    and ``"pols_if_pay"`` are dicts keyed with the second parameters
+    of the Cells, such as ``"BEG_STEP"`` and ``"LAST"``.
+    The array of ``"BEG_STEP"`` has one more row than the others,
+    for ``i`` equal to :func:`max_proj_len`.
+
+    The decrement rates are calculated for all ``i`` at once from
+    :func:`duration_m_array`, :func:`last_part_array` and
+    :func:`payment_lag_array`, then only the numbers of policies
+    are rolled forward from ``i=0``.
+    The formulas are the vectorized counterparts of
+    :func:`mort_rate`, :func:`lapse_rate`, :func:`pols_if_at`,
+    :func:`pols_death`, :func:`pols_lapse` and :func:`pols_if_pay`,
+    and produce the same values.
+
+    This Cells is used only when ``"array"`` is assigned to :attr:`engine`.
+
+    .. seealso::
+
+        * :attr:`engine`
+        * :func:`pv_claims`
+        * :func:`pv_pols_if`
+        * :func:`pols_if_pay_array`
+
+    """
+    n = max_proj_len()
+    dur_m = duration_m_array()[:n+1]
+    dur_y = dur_m // 12
+    ages = age_at_entry().to_numpy() + dur_y
+
+    mort = table_lookup()(mort_table_array(), ages, np.minimum(dur_y, 5))
+    lapse = np.maximum(0.1 - 0.02 * dur_y, 0.02)
+
+    last = last_part_array()[:n]
+    next_ = step_calendar()["months_in_step"].to_numpy()[:n, None] - last
+    q_mort_last = 1 - (1 - mort[:n])**(last / 12)
+    q_mort_next = 1 - (1 - mort[1:])**(next_ / 12)
+    q_lapse_last = 1 - (1 - lapse[:n])**(last / 12)
+    q_lapse_next = 1 - (1 - lapse[1:])**(next_ / 12)
+
+    polt = policy_term().to_numpy() * 12
+    is_mat = (dur_m[:n] < polt) & (polt <= dur_m[1:])
+    count = model_point()["policy_count"].to_numpy()
+    new_biz = np.where((dur_m[:n] < 0) & (dur_m[1:] >= 0), count, 0)
+
+    shape = (n, len(count))
+    beg = np.empty((n + 1, len(count)))
+    death_last, death_next = np.empty(shape), np.empty(shape)
+    lapse_last, lapse_next = np.empty(shape), np.empty(shape)
+    decr_last, maturity = np.empty(shape), np.empty(shape)
+    aft_mat, aft_nb = np.empty(shape), np.empty(shape)
+
+    beg[0] = np.where(dur_m[0] >= 0, count, 0)
+    for i in range(n):
+        death_last[i] = beg[i] * q_mort_last[i]
+        lapse_last[i] = (beg[i] - death_last[i]) * q_lapse_last[i]
+        decr_last[i] = beg[i] - lapse_last[i] - death_last[i]
+        maturity[i] = is_mat[i] * decr_last[i]
+        aft_mat[i] = decr_last[i] - maturity[i]
+        aft_nb[i] = aft_mat[i] + new_biz[i]
+        death_next[i] = aft_nb[i] * q_mort_next[i]
+        lapse_next[i] = (aft_nb[i] - death_next[i]) * q_lapse_next[i]
+        beg[i+1] = aft_nb[i] - lapse_next[i] - death_next[i]
+
+    lag = payment_lag_array() / 12
+    disc = (1 - mort) * (1 - lapse)
+
+    return {
+        "pols_if_at": {
+            "BEG_STEP": beg,
+            "DECR_LAST": decr_last,
+            "AFT_MAT": aft_mat,
+            "AFT_NB": aft_nb,
+            "DECR_NEXT": beg[1:]
+        },
+        "pols_death": {"LAST": death_last, "NEXT": death_next},
+        "pols_lapse": {"LAST": lapse_last, "NEXT": lapse_next},
+        "pols_maturity": maturity,
+        "pols_new_biz": new_biz,
+        "pols_if_pay": {
+            "LAST": beg[:n] * disc[:n]**lag[:, :, 0].transpose(),
+            "NEXT": aft_nb * disc[1:]**lag[:, :, 1].transpose()
+        }
+    }
+
+
 def check_pay_count():
     """Check :func:`pay_count`.
 
@@ -250,10 +368,13 @@ def date_(i):
 
     Returns a date representing each projection step as `pandas Timestamp`_.
     ``date_(0)`` is read from :attr:`date_init`.
-    For ``i > 0``, ``date_(i)`` is defined recursively as::
+    For ``i > 0``, ``date_(i)`` is defined as::
 
         date_(i-1) + offset(i-1)
 
+    and is read from the ``date_`` column of :func:`step_calendar`
+    for the steps in it.
+
     ``date_(i)`` must always return an end-of-month date.
     The length of each projection step is specified by :func:`offset`.
     Items indexed with ``i`` and representing the change of a quantity
@@ -265,6 +386,7 @@ def date_(i):
 
         * :attr:`date_init`
         * :func:`offset`
+        * :func:`step_calendar`
         * `pandas Timestamp`_
 
     .. _pandas Timestamp:
@@ -273,6 +395,8 @@ def date_(i):
     """
     if i == 0:
         return pd.Timestamp(date_init)
+    elif i < len(step_calendar()):
+        return step_calendar()["date_"].iat[i]
     else:
         return date_(i-1) + offset(i-1)
 
@@ -323,6 +447,8 @@ def disc_factors_prem(j):
         (months_(i) + last_part(i, j) + payment_lag(i, j)) / 12
 
 
+    The values are read from :func:`disc_factors_prem_array`.
+
     Args:
         j: 'LAST' or 'NEXT'
 
@@ -332,17 +458,44 @@ def disc_factors_prem(j):
         * :func:`disc_rate`
         * :func:`max_proj_len`
         * :func:`payment_lag`
+        * :func:`disc_factors_prem_array`
 
     """
+    if j == 'LAST':
+        return disc_factors_prem_array()[:, :, 0]
+    elif j == 'NEXT':
+        return disc_factors_prem_array()[:, :, 1]
+    else:
+        raise ValueError('invalid j')
+
 
-    data = []
-    for i in range(max_proj_len()):    
+def disc_factors_prem_array():
+    """Discount factors for premiums as a 3D array
 
-        last = last_part(i) if j == 'NEXT' else 0
-        t = (months_(i) + last + payment_lag(i, j)) / 12
-        data.append((1 + disc_rate(i))**(-t))
+    Returns a 3D numpy array indexed by model point,
+    time index ``i`` from 0 to :func:`max_proj_len` - 1
+    and ``j``, where the last index is 0 for ``j='LAST'``
+    and 1 for ``j='NEXT'``.
+    The elements are the discount factors defined
+    in :func:`disc_factors_prem`, calculated at once
+    from :func:`payment_lag_array` and :func:`last_part_array`.
 
-    return np.array(data).transpose()
+    .. seealso::
+
+        * :func:`disc_factors_prem`
+        * :func:`payment_lag_array`
+        * :func:`last_part_array`
+        * :func:`disc_rate`
+    """
+    n = max_proj_len()
+    months = step_calendar()["months_"].to_numpy()[:n]
+    rates = np.array([disc_rate(i) for i in range(n)])
+
+    last = np.stack([np.zeros((n, len(model_point())), dtype=np.int64),
+                     last_part_array()[:n]], axis=2).transpose(1, 0, 2)
+
+    t = (months[None, :, None] + last + payment_lag_array()) / 12
+    return (1 + rates[None, :, None])**(-t)
 
 
 def disc_rate(i):
@@ -387,14 +540,49 @@ def duration_m(i):
     policies. For example, If the :func:`duration_m` is
     -15 at time 0, the model point is issued 15 months later.
 
+    The values are read from the row ``i`` of :func:`duration_m_array`,
+    except for ``i=0``, which is used for
+    determining the steps in :func:`step_calendar`.
+
     .. seealso:: 
 
         * :func:`issue_date`
         * :func:`date_`
+        * :func:`duration_m_array`
+    """
+    if i == 0:
+        val_m = date_(0).to_datetime64().astype('datetime64[M]')
+        iss_m = issue_date().to_numpy().astype('datetime64[M]')
+        return pd.Series((val_m - iss_m).astype(np.int64), index=model_point().index)
+    else:
+        return pd.Series(duration_m_array()[i], index=model_point().index)
+
+
+def duration_m_array():
+    """Durations of model points in months at all steps
+
+    Returns a 2D numpy array of integers
+    indexed by step and model point.
+    The element at ``[i, k]`` is the duration in months of the ``k``-th
+    model point at :func:`date_(i)<date_>`,
+    for all the steps in :func:`step_calendar`.
+    The durations are calculated at once
+    as the differences of the months of :func:`date_(i)<date_>` and
+    :func:`issue_date` represented as `numpy datetime64`_ in months.
+
+    .. seealso::
+
+        * :func:`duration_m`
+        * :func:`step_calendar`
+        * :func:`issue_date`
+
+    .. _numpy datetime64:
+       https://numpy.org/doc/stable/reference/arrays.datetime.html
     """
-    iss = issue_date()
+    val_m = step_calendar()["date_"].to_numpy().astype('datetime64[M]')
+    iss_m = issue_date().to_numpy().astype('datetime64[M]')
 
-    return  date_(i).year * 12 + date_(i).month - iss.dt.year * 12 - iss.dt.month
+    return (val_m[:, None] - iss_m[None, :]).astype(np.int64)
 
 
 def duration_y(i):
@@ -573,17 +761,63 @@ def last_part(i, freq_id='ANV'):
     If 'PREM' is given to ``freq_id``,
     the lengh of time in months till the next payment date is returned.
 
+    The values are read from the row ``i`` of :func:`last_part_array`.
+
     .. seealso::
 
         * :func:`next_part`
         * :func:`next_anniversary`
         * :func:`months_in_step`
+        * :func:`last_part_array`
 
     """
-    anv = next_anniversary(i, freq_id)
-    diff_m = anv.dt.year * 12 + anv.dt.month - date_(i).year * 12 - date_(i).month
-    stub_m = (anv.dt.day - 1) / anv.dt.days_in_month
-    return (diff_m - 1 + stub_m).mask(date_(i+1) < next_anniversary(i, freq_id), months_in_step(i))
+    return pd.Series(last_part_array(freq_id)[i], index=model_point().index)
+
+
+def last_part_array(freq_id='ANV'):
+    """Lengths of time till next anniversary in all steps
+
+    Returns a 2D numpy array indexed by step and model point.
+    The element at ``[i, k]`` is the value of
+    :func:`last_part(i, freq_id)<last_part>` for the ``k``-th model point,
+    for all the steps in :func:`step_calendar`.
+
+    The array is calculated at once from
+    the months to the next anniversaries
+    returned by :func:`next_anniversary_m` and
+    the days of :func:`issue_date`, capped at the last days of the
+    anniversary months. For each model point and step,
+    the value is defined as::
+
+        next_anniversary_m(freq_id)[i] - 1 + (day - 1) / days_in_month
+
+    where ``day`` is the day of the next anniversary date,
+    and ``days_in_month`` is the number of days in the anniversary month,
+    or :func:`months_in_step(i)<months_in_step>` if the next anniversary is
+    after :func:`date_(i+1)<date_>`.
+
+    .. seealso::
+
+        * :func:`last_part`
+        * :func:`next_anniversary_m`
+        * :func:`step_calendar`
+    """
+    offset_m = next_anniversary_m(freq_id)
+    anv_m = (step_calendar()["date_"].to_numpy().astype('datetime64[M]')[:, None]
+             + offset_m)
+
+    days_in_month = ((anv_m + 1).astype('datetime64[D]')
+                     - anv_m.astype('datetime64[D]')).astype(np.int64)
+
+    iss = issue_date().to_numpy()
+    iss_d = (iss.astype('datetime64[D]')
+             - iss.astype('datetime64[M]').astype('datetime64[D]')).astype(np.int64) + 1
+    day = np.minimum(iss_d[None, :], days_in_month)
+
+    # date_(i+1) is an end-of-month date, so the next anniversary
+    # is after date_(i+1) if and only if it is in a later month.
+    m = step_calendar()["months_in_step"].to_numpy()[:, None]
+    return np.where(m < offset_m, m, offset_m - 1 + (day - 1) / days_in_month)
 
 
 def loading_prem():
@@ -652,19 +886,20 @@ def month_to_step(m):
     For a given number of months elapsed from :func:`date_(0)<date_>`,
     returns the minimum step index such that :func:`step_to_month(i)<step_to_month>`
     is equal to or greater than ``m``.
+    The index is searched for in the ``months_`` column of
+    :func:`step_calendar`.
 
     .. see also:
 
-        * :func:`month_to_step`
+        * :func:`step_to_month`
+        * :func:`step_calendar`
     """
-    if m == 0:
-        return 0
+    months = step_calendar()["months_"].to_numpy()
+    if m <= months[-1]:
+        return int(np.searchsorted(months, m))
     else:
-        i = month_to_step(m-1)
-        while True:  
-            m_i  = step_to_month(i)
-            if m <= m_i:
-                break
+        i = len(months)
+        while step_to_month(i) < m:
             i += 1
         return i
 
@@ -674,14 +909,17 @@ def months_(i):
 
     Returns the number of elapsed months from :func:`date_(0)<date_>`
     at :func:`date_(i)<date_>`.
+    Read from the ``months_`` column of :func:`step_calendar`
+    for the steps in it.
 
     .. see also:
 
         * :func:`date_`
         * :func:`months_in_step`
+        * :func:`step_calendar`
     """
-    if i == 0:
-        return 0
+    if i < len(step_calendar()):
+        return int(step_calendar()["months_"].iat[i])
     else:
         return months_(i-1) + months_in_step(i-1)
 
@@ -691,12 +929,18 @@ def months_in_step(i):
 
     Returns the number of month between :func:`date_(i)<date_>`
     and :func:`date_(i+1)<date_>`.
+    Read from the ``months_in_step`` column of :func:`step_calendar`
+    for the steps in it.
 
     .. see also:
 
         * :func:`date_`
+        * :func:`step_calendar`
     """
-    return date_(i+1).year * 12 + date_(i+1).month - date_(i).year * 12 - date_(i).month
+    if i < len(step_calendar()):
+        return int(step_calendar()["months_in_step"].iat[i])
+    else:
+        return date_(i+1).year * 12 + date_(i+1).month - date_(i).year * 12 - date_(i).month
 
 
 def mort_rate(i):
@@ -708,17 +952,52 @@ def mort_rate(i):
 
     .. seealso::
 
-       * :func:`mort_table_reindexed`
+       * :func:`mort_table_array`
+       * :func:`table_lookup`
        * :func:`model_point`
     """
-    mi = pd.MultiIndex.from_arrays([age(i), np.minimum(duration_y(i), 5)])
-    return mort_table_reindexed().reindex(
-        mi, fill_value=0).set_axis(model_point().index)
+    # ``mort_table_array()`` holds the mortality rates in a 2D array
+    # indexed by age and duration. The rates for all the model points
+    # are picked up at once by :func:`table_lookup` with
+    # the ages and the policy years at i capped at 5.
+    # Ages and durations out of the table, such as negative durations
+    # of future new business, result in 0.
+
+    x, d = age(i).to_numpy(), np.minimum(duration_y(i), 5).to_numpy()
+    return pd.Series(table_lookup()(mort_table_array(), x, d),
+                     index=model_point().index)
+
+
+def mort_table_array():
+    """Mortality table as a 2D array
+
+    Returns the mortality rates in :attr:`mort_table` as a 2D numpy array
+    whose row indices are ages and column indices are durations,
+    so that the rate for age ``x`` and duration ``d`` is
+    ``mort_table_array()[x, d]``.
+    Rows for the ages not in :attr:`mort_table` are filled with 0.
+
+    .. seealso::
+
+       * :attr:`mort_table`
+       * :func:`mort_rate`
+
+    """
+    ages = mort_table.index.to_numpy()
+    durs = mort_table.columns.astype(int).to_numpy()
+
+    result = np.zeros((ages.max() + 1, durs.max() + 1))
+    result[np.ix_(ages, durs)] = mort_table.to_numpy()
+    return result
 
 
 def mort_table_reindexed():
     """MultiIndexed mortality table
 
+    .. note::
+       This cells is not used by default.
+       :func:`mort_rate` uses :func:`mort_table_array` instead.
+
     Returns a Series of mortlity rates reshaped from :attr:`mort_table`.
     The returned Series is indexed by age and duration capped at 5.
 
@@ -773,32 +1052,60 @@ def next_anniversary(i, freq_id='ANV'):
     based on the premium payment cycle calculated
     from :func:`payment_freq` and :func:`issue_date`.
 
+    The month of the next anniversary date is
+    :func:`next_anniversary_m(freq_id)<next_anniversary_m>` months
+    after the month of :func:`date_(i)<date_>`, and its day is
+    the day of :func:`issue_date` capped at the last day of the month.
+
     .. seealso::
 
         * :func:`date_`
         * :func:`issue_date`
         * :func:`payment_freq`
+        * :func:`next_anniversary_m`
+
+    """
+    anv_m = date_(i).to_datetime64().astype('datetime64[M]') + next_anniversary_m(freq_id)[i]
+    days_in_month = (anv_m + 1).astype('datetime64[D]') - anv_m.astype('datetime64[D]')
+
+    iss = issue_date().to_numpy()
+    iss_d = iss.astype('datetime64[D]') - iss.astype('datetime64[M]').astype('datetime64[D]')
+    res = anv_m.astype('datetime64[D]') + np.minimum(iss_d, days_in_month - 1)
+
+    return pd.Series(res.astype('datetime64[ns]'), index=model_point().index)
+
+
+def next_anniversary_m(freq_id='ANV'):
+    """Months to next anniversaries in all steps
+
+    Returns a 2D numpy array of integers
+    indexed by step and model point.
+    The element at ``[i, k]`` is the number of months from
+    the month of :func:`date_(i)<date_>` to the month of
+    :func:`next_anniversary(i, freq_id)<next_anniversary>`
+    for the ``k``-th model point,
+    for all the steps in :func:`step_calendar`.
+    Defined as::
 
+        interval - duration_m_array() % interval
+
+    where ``interval`` is 12 if ``freq_id`` is 'ANV',
+    or ``12 // payment_freq()`` if ``freq_id`` is 'PREM'.
+
+    .. seealso::
+
+        * :func:`next_anniversary`
+        * :func:`last_part_array`
+        * :func:`duration_m_array`
     """
     if freq_id == 'ANV':
-        freq = 1
+        interval = 12
     elif freq_id == 'PREM':
-        freq = payment_freq()
+        interval = 12 // payment_freq().to_numpy()[None, :]
     else:
         raise ValueError('invalid freq_id')
 
-    iss = issue_date()
-    iss_y, iss_m = iss.dt.year, iss.dt.month
-    val_y, val_m = date_(i).year, date_(i).month
-
-    diff_m = (val_y - iss_y) * 12 + val_m - iss_m
-    offset_m = (12 // freq) - (diff_m % (12 // freq))
-
-    m = (date_(i).to_period('M') + offset_m).astype('Period[M]')
-    d = np.minimum(issue_date().dt.day, m.dt.days_in_month)
-    res = m.dt.to_timestamp().dt.to_period('D') - 1 + d
-
-    return res.dt.to_timestamp()
+    return interval - duration_m_array() % interval
 
 
 def next_part(i):
@@ -839,15 +1146,24 @@ def offset(i):
     offset(i) should return ``pd.offsets.Year(1)``.
 
     By default, the formula is set so that the model
-    projects monthly for the first 60 months (5 years) then
-    annually after that.
+    projects monthly for the first :attr:`monthly_steps` months then
+    by :attr:`coarse_months` months after that.
+    By default, :attr:`monthly_steps` is 60 and :attr:`coarse_months` is 12,
+    so the model projects monthly for the first 60 months (5 years)
+    then annually after that.
 
     :func:`offset` is defined as::
 
-        if i < 60:
+        if i < monthly_steps:
             return pd.offsets.MonthEnd(1)
-        else:
+        elif coarse_months == 12:
             return pd.offsets.YearEnd(1)
+        else:
+            return pd.offsets.MonthEnd(coarse_months)
+
+    :func:`lifelib.steps.choose_steps` chooses
+    :attr:`monthly_steps` and :attr:`coarse_months` for
+    a given tolerance on :func:`pv_net_cf`.
 
     .. seealso::
 
@@ -862,10 +1178,12 @@ def offset(i):
     .. _YearEnd:
         https://pandas.pydata.org/docs/reference/api/pandas.tseries.offsets.YearEnd.html
     """
-    if i < 60:
+    if i < monthly_steps:
         return pd.offsets.MonthEnd(1)
-    else:
+    elif coarse_months == 12:
         return pd.offsets.YearEnd(1)
+    else:
+        return pd.offsets.MonthEnd(coarse_months)
 
 
 def pay_count(i, j=None):
@@ -895,17 +1213,63 @@ def pay_count(i, j=None):
     if j is None:
         return pay_count(i, 'LAST') + pay_count(i, 'NEXT')
 
+    elif j == 'LAST':
+        return pd.Series(pay_count_array()[:, i, 0], index=model_point().index)
+
+    elif j == 'NEXT':
+        return pd.Series(pay_count_array()[:, i, 1], index=model_point().index)
+
     else:
+        raise ValueError('invalid j')
+
+
+def pay_count_array():
+    """Numbers of premium payments as a 3D array
+
+    Returns a 3D numpy array of integers indexed by model point,
+    time index ``i`` from 0 to :func:`max_proj_len` - 1
+    and ``j``, where the last index is 0 for ``j='LAST'``
+    and 1 for ``j='NEXT'``.
+    The elements are the numbers of premium payments
+    defined in :func:`pay_count`, calculated at once from
+    :func:`duration_m_array`.
+
+    For each ``i``, the numbers of payments are calculated as::
+
         paid_next = (duration_m(i+1) % 12) // (12 // payment_freq()) + 1
 
-        if j == 'LAST':
-            paid_last = (duration_m(i) % 12) // (12 // payment_freq()) + 1
-            paid_next = paid_next.where(duration_y(i) == duration_y(i+1), payment_freq())
+    and for ``j='LAST'``::
+
+        paid_last = (duration_m(i) % 12) // (12 // payment_freq()) + 1
+        paid_next = paid_next.where(duration_y(i) == duration_y(i+1), payment_freq())
+
+        is_paying(i) * (paid_next - paid_last)
+
+    and for ``j='NEXT'``::
+
+        is_paying(i+1) * paid_next.where(duration_y(i) != duration_y(i+1), 0)
+
+    .. seealso::
+
+        * :func:`pay_count`
+        * :func:`duration_m_array`
+        * :func:`is_paying`
+    """
+    n = max_proj_len()
+    dur = duration_m_array()[:n+1].transpose()
+    freq = payment_freq().to_numpy()[:, None]
+    interval = 12 // freq
+
+    limit = np.minimum(policy_term().to_numpy(), payment_term().to_numpy())[:, None] * 12
+    paying = (0 <= dur) & (dur < limit)
 
-            return is_paying(i) * (paid_next - paid_last)
+    same_year = (dur[:, :-1] // 12) == (dur[:, 1:] // 12)
+    paid_last = (dur[:, :-1] % 12) // interval + 1
+    paid_next = (dur[:, 1:] % 12) // interval + 1
 
-        elif j == 'NEXT':
-            return is_paying(i+1) * paid_next.where(duration_y(i) != duration_y(i+1), 0)
+    return np.stack(
+        [paying[:, :-1] * (np.where(same_year, paid_next, freq) - paid_last),
+         paying[:, 1:] * np.where(same_year, 0, paid_next)], axis=2)
 
 
 def payment_freq():
@@ -941,19 +1305,42 @@ def payment_lag(i, j):
         * :func:`last_part`
         * :func:`payment_freq`
     """
-    max = np.maximum
-    pay_interval = 12 // payment_freq()
-
     if j == 'LAST':
-        return last_part(i, freq_id='PREM') + max(pay_count(i, 'LAST') - 1, 0) * pay_interval / 2
+        return pd.Series(payment_lag_array()[:, i, 0], index=model_point().index)
 
     elif j == 'NEXT':
-        return max(pay_count(i, 'NEXT') - 1, 0) * pay_interval / 2
+        return pd.Series(payment_lag_array()[:, i, 1], index=model_point().index)
 
     else:
         raise ValueError('invalid j')
 
 
+def payment_lag_array():
+    """Average timing of premium payments as a 3D array
+
+    Returns a 3D numpy array indexed by model point,
+    time index ``i`` from 0 to :func:`max_proj_len` - 1
+    and ``j``, where the last index is 0 for ``j='LAST'``
+    and 1 for ``j='NEXT'``.
+    The elements are the average timings of premium payments
+    defined in :func:`payment_lag`, calculated at once from
+    :func:`last_part_array` and :func:`pay_count_array`.
+
+    .. seealso::
+
+        * :func:`payment_lag`
+        * :func:`last_part_array`
+        * :func:`pay_count_array`
+    """
+    n = max_proj_len()
+    pay_interval = (12 // payment_freq().to_numpy())[:, None, None]
+
+    lag = np.maximum(pay_count_array() - 1, 0) * pay_interval / 2
+    lag[:, :, 0] += last_part_array('PREM')[:n].transpose()
+
+    return lag
+
+
 def payment_term():
     """Premium payment period in years
 
@@ -1145,6 +1532,30 @@ def pols_if_pay(i, j):
         raise ValueError('invalid j')
 
 
+def pols_if_pay_array():
+    """Number of policies in-force for premium payment as a 3D array
+
+    Returns a 3D numpy array indexed by model point,
+    time index ``i`` from 0 to :func:`max_proj_len` - 1
+    and ``j``, where the last index is 0 for ``j='LAST'``
+    and 1 for ``j='NEXT'``.
+    The elements are the values of :func:`pols_if_pay`.
+
+    .. seealso::
+
+        * :func:`pols_if_pay`
+        * :func:`array_sweep`
+    """
+    if engine == "array":
+        pols = array_sweep()["pols_if_pay"]
+        return np.stack(
+            [pols[j].transpose() for j in ('LAST', 'NEXT')], axis=2)
+
+    return np.stack(
+        [np.array([pols_if_pay(i, j) for i in range(max_proj_len())]).transpose()
+         for j in ('LAST', 'NEXT')], axis=2)
+
+
 def pols_lapse(i, j=None):
     """Number of lapse in step ``i``
 
@@ -1289,7 +1700,14 @@ def pv_claims():
 
         * :func:`claims`
         * :func:`disc_factors`
+        * :func:`array_sweep`
     """
+    if engine == "array":
+        death = array_sweep()["pols_death"]
+        cl = (np.array(list(claim_pp(t) for t in range(max_proj_len())))
+              * (death["LAST"] + death["NEXT"])).transpose()
+        return cl @ disc_factors()[:max_proj_len()]
+
     cl = np.array(list(claims(t) for t in range(max_proj_len()))).transpose()
 
     return cl @ disc_factors()[:max_proj_len()]
@@ -1348,7 +1766,17 @@ def pv_pols_if():
 
     .. note::
        This cells is not used by default.
+
+    .. seealso::
+
+        * :func:`pols_if`
+        * :func:`disc_factors`
+        * :func:`array_sweep`
     """
+    if engine == "array":
+        result = array_sweep()["pols_if_at"]["BEG_STEP"][:max_proj_len()].transpose()
+        return result @ disc_factors()[:max_proj_len()]
+
     result = np.array(list(pols_if(i) for i in range(max_proj_len()))).transpose()
 
     return result @ disc_factors()[:max_proj_len()]
@@ -1360,41 +1788,37 @@ def pv_pols_if_pay():
     Calculated for 'LAST' and 'NEXT' separately, as
     :func:`pay_count` times :func:`pols_if_pay` discounted
     by :func:`disc_factors_prem`.
+    The 3D arrays by model point, time index and ``j``
+    are multiplied and summed at once.
 
     .. seealso::
 
-        * :func:`pay_count`
-        * :func:`pols_if_pay`
-        * :func:`disc_factors_prem`
+        * :func:`pay_count_array`
+        * :func:`pols_if_pay_array`
+        * :func:`disc_factors_prem_array`
     """
-    def pols(j):
-        data = []
-        for i in range(max_proj_len()):    
-            data.append(pay_count(i, j) * pols_if_pay(i, j))
-
-        return np.array(data).transpose()
-
-    dprems = pols('LAST') * disc_factors_prem('LAST') + pols('NEXT') * disc_factors_prem('NEXT')
+    dprems = pay_count_array() * pols_if_pay_array() * disc_factors_prem_array()
 
-    return dprems.sum(axis=1)
+    return dprems.sum(axis=2).sum(axis=1)
 
 
 def pv_premiums():
     """Present value of premiums
 
     Returns a Numpy array of the presenet values of premiums.
+    Calculated in the same way as :func:`pv_pols_if_pay`,
+    with :func:`pay_count_array` multiplied by :func:`premium_pp`.
 
     .. seealso::
 
         * :func:`premiums`
-        * :func:`disc_factors_prem`
+        * :func:`pay_count_array`
+        * :func:`pols_if_pay_array`
+        * :func:`disc_factors_prem_array`
     """
-    last_y = np.array(list(premiums(i, 'LAST') for i in range(max_proj_len()))).transpose()
-    next_y = np.array(list(premiums(i, 'NEXT') for i in range(max_proj_len()))).transpose()
-
-    total = last_y * disc_factors_prem('LAST') + next_y * disc_factors_prem('NEXT')
+    prems = premium_pp().to_numpy()[:, None, None] * pay_count_array() * pols_if_pay_array()
 
-    return total.sum(axis=1)
+    return (prems * disc_factors_prem_array()).sum(axis=2).sum(axis=1)
 
 
 def result_cells(name, point_id=None, j=None):
@@ -1405,6 +1829,10 @@ def result_cells(name, point_id=None, j=None):
     If ``point_id`` is specified, returns the values only of the model point.
     If 'LAST' or 'NEXT' is passed to ``j``, only the values of the 'LAST' or 'NEXT'
     part of ``name`` are aggregated.
+
+    All the values are held in memory. To write the values of
+    many model points to a file step by step, use
+    :func:`lifelib.export.write_cells` instead.
     """
     args = () if j is None else (j,)
     res = pd.DataFrame({i: getattr(_space, name)(i, *args) for i in range(max_proj_len())})
@@ -1497,20 +1925,92 @@ def sex():
     return model_point()["sex"]
 
 
+def step_calendar(months=None):
+    """Calendar of the projection steps
+
+    Returns a DataFrame indexed by the step index ``i``
+    with the following columns:
+
+    * ``date_``: :func:`date_(i)<date_>`
+    * ``months_``: :func:`months_(i)<months_>`
+    * ``months_in_step``: :func:`months_in_step(i)<months_in_step>`
+
+    The dates are calculated once by adding
+    :func:`offset(i)<offset>` to the date of the previous step,
+    starting from :attr:`date_init`,
+    and the numbers of months are calculated from the dates at once.
+    The steps cover ``months`` months. If ``months`` is omitted,
+    the steps cover the maximum of :func:`proj_len` plus 12 months,
+    so the calendar has all the steps up to :func:`max_proj_len` and
+    at least one step after that.
+
+    :func:`date_`, :func:`months_`, :func:`months_in_step`,
+    :func:`step_to_month` and :func:`month_to_step` read their values
+    from ``step_calendar()``, instead of calculating them recursively.
+    For steps beyond the calendar, they
+    calculate their values from the previous steps.
+
+    Args:
+        months(:obj:`int`, optional): The number of months to cover
+
+    .. code-block::
+
+        >>> BasicTermASL_ME.Projection.step_calendar()
+                date_  months_  months_in_step
+        0  2021-12-31        0               1
+        1  2022-01-31        1               1
+        2  2022-02-28        2               1
+        3  2022-03-31        3               1
+        4  2022-04-30        4               1
+        ..        ...      ...             ...
+        76 2042-12-31      252              12
+        77 2043-12-31      264              12
+        78 2044-12-31      276              12
+        79 2045-12-31      288              12
+        80 2046-12-31      300              12
+
+        [81 rows x 3 columns]
+
+    .. seealso::
+
+        * :func:`date_`
+        * :func:`offset`
+        * :func:`months_`
+        * :func:`months_in_step`
+        * :func:`month_to_step`
+    """
+    target = max(proj_len()) + 12 if months is None else months
+
+    dates = [pd.Timestamp(date_init)]
+    months = 0
+    while months < target:
+        d = dates[-1] + offset(len(dates) - 1)
+        months += (d.year - dates[-1].year) * 12 + d.month - dates[-1].month
+        dates.append(d)
+    dates.append(dates[-1] + offset(len(dates) - 1))
+
+    dates = pd.DatetimeIndex(dates)
+    months = dates.year * 12 + dates.month
+    months = np.asarray(months - months[0])
+
+    return pd.DataFrame(
+        {"date_": dates[:-1],
+         "months_": months[:-1],
+         "months_in_step": np.diff(months)})
+
+
 def step_to_month(i):
     """Returns the number of months for step ``i``
 
     Return the number of months from :func:`date_(0)<date_>`
-    to :func:`date_(i)<date_>`.
+    to :func:`date_(i)<date_>`. Same as :func:`months_(i)<months_>`.
 
     .. seealso::
 
+        * :func:`months_`
         * :func:`months_in_step`
     """
-    if i == 0:
-        return 0
-    else:
-        return step_to_month(i-1) + months_in_step(i-1)
+    return months_(i)
 
 
 def sum_assured():
@@ -1522,6 +2022,30 @@ def sum_assured():
     return model_point()["sum_assured"]
 
 
+def table_lookup():
+    """Function to look up 2D tables by pairs of indices
+
+    Returns a function ``lookup(table, x, d, fill=0)`` that takes
+    a 2D numpy array ``table`` and two integer numpy arrays
+    ``x`` and ``d`` of the same shape, and returns
+    the elements ``table[x, d]`` as an array of the same shape.
+    The elements for the pairs of indices out of ``table``,
+    such as negative durations of future new business, are ``fill``.
+
+    The function is shared by :func:`mort_rate` and :func:`array_sweep`.
+    A function is returned in place of taking the arrays as
+    the parameters of this Cells, as the parameters of Cells
+    must be hashable.
+    """
+    def lookup(table, x, d, fill=0):
+        in_table = ((0 <= x) & (x < table.shape[0])
+                    & (0 <= d) & (d < table.shape[1]))
+        values = table[np.where(in_table, x, 0), np.where(in_table, d, 0)]
+        return np.where(in_table, values, fill)
+
+    return lookup
+
+
 # ---------------------------------------------------------------------------
 # References
 
@@ -1535,4 +2059,10 @@ pd = ("Module", "pandas")
 
 model_point_table = ("DataSpec", 1596822034176, 1596820957792)
 
-date_init = "2021-12-31"
\ No newline at end of file
+date_init = "2021-12-31"
+
+monthly_steps = 60
+
+coarse_months = 12
+
+engine = "cells"
\ No newline at end of file
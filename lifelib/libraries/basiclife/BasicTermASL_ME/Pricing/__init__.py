@@ -7,6 +7,29 @@ the issue ages read from
 so that all the model points become new business issued the day after
 :func:`date_(0)<basiclife.BasicTermASL_ME.Base.date_>`.
 
+The values that depend neither on the issue dates nor on premiums are
+shared with :mod:`~basiclife.BasicTermASL_ME.Projection`.
+:func:`mort_table_array`, :func:`step_calendar`, :func:`disc_rate`
+and :func:`disc_factors` are overridden to return the values calculated in
+:mod:`~basiclife.BasicTermASL_ME.Projection`, so they are
+calculated only once when both the spaces are calculated.
+The values that depend on the issue dates, such as
+:func:`~basiclife.BasicTermASL_ME.Base.duration_m`
+and :func:`~basiclife.BasicTermASL_ME.Base.last_part`,
+are calculated separately in each space.
+
+Since the values in this space are cleared every time
+:attr:`~basiclife.BasicTermASL_ME.Base.model_point_table` is replaced,
+sharing these values also saves recalculating them
+when premiums are calculated repeatedly for different model points.
+
+Attributes:
+
+    projection_disc_factors: :func:`Projection.disc_factors<basiclife.BasicTermASL_ME.Base.disc_factors>`
+    projection_disc_rate: :func:`Projection.disc_rate<basiclife.BasicTermASL_ME.Base.disc_rate>`
+    projection_mort_table_array: :func:`Projection.mort_table_array<basiclife.BasicTermASL_ME.Base.mort_table_array>`
+    projection_step_calendar: :func:`Projection.step_calendar<basiclife.BasicTermASL_ME.Base.step_calendar>`
+
 """
 
 from modelx.serialize.jsonvalues import *
@@ -24,6 +47,42 @@ _spaces = []
 # ---------------------------------------------------------------------------
 # Cells
 
+def disc_factors():
+    """Discount factors.
+
+    The same array as ``disc_factors`` in ``Projection`` space,
+    read through :attr:`projection_disc_factors`,
+    if it covers :func:`~basiclife.BasicTermASL_ME.Base.max_proj_len`
+    in this space. The array can be longer than
+    :func:`~basiclife.BasicTermASL_ME.Base.max_proj_len`.
+    Otherwise, the discount factors are calculated
+    in the same way as ``Projection``.
+    """
+    factors = projection_disc_factors()
+    if len(factors) >= max_proj_len():
+        return factors
+
+    return np.array(list((1 + disc_rate(i))**(-months_(i)/12) for i in range(max_proj_len())))
+
+
+def disc_rate(i):
+    """Discount rate for period ``i``
+
+    The same rate as ``disc_rate`` in ``Projection`` space,
+    read through :attr:`projection_disc_rate`.
+    """
+    return projection_disc_rate(i)
+
+
+def mort_table_array():
+    """Mortality table as a 2D array
+
+    The same array as ``mort_table_array`` in ``Projection`` space,
+    read through :attr:`projection_mort_table_array`.
+    """
+    return projection_mort_table_array()
+
+
 def model_point():
     """Target model points
 
@@ -75,3 +134,34 @@ def premium_pp():
     return np.round_((1 + loading_prem()) * (sum_assured() / 1000) * net_premium_rate(), 2)
 
 
+def step_calendar(months=None):
+    """Calendar of the projection steps
+
+    The calendar of ``Projection`` space,
+    read through :attr:`projection_step_calendar`.
+    The calendar is shared if it covers ``months``, or
+    the maximum of :func:`~basiclife.BasicTermASL_ME.Base.proj_len`
+    in this space plus 12 months if ``months`` is omitted.
+    Otherwise, a calendar covering the months is taken from
+    ``Projection`` by passing the months.
+    """
+    if months is None:
+        months = max(proj_len()) + 12
+
+    calendar = projection_step_calendar()
+    if calendar["months_"].iat[-1] < months:
+        calendar = projection_step_calendar(months)
+
+    return calendar
+
+
+# ---------------------------------------------------------------------------
+# References
+
+projection_disc_factors = ("Interface", ("..", "Projection", "disc_factors"), "auto")
+
+projection_disc_rate = ("Interface", ("..", "Projection", "disc_rate"), "auto")
+
+projection_mort_table_array = ("Interface", ("..", "Projection", "mort_table_array"), "auto")
+
+projection_step_calendar = ("Interface", ("..", "Projection", "step_calendar"), "auto")
\ No newline at end of file
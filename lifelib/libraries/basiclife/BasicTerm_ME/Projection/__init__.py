@@ -168,6 +168,39 @@ Attributes:
            * :func:`mort_rate`
            * :func:`mort_rate_mth`
 
+    engine: A string to select how the projection is carried out.
+        ``"cells"`` by default.
+
+        When ``"cells"`` is assigned, the values of the Cells
+        such as :func:`pols_if_at`, :func:`claims` and :func:`premiums`
+        are calculated for each ``t`` recursively,
+        and :func:`proj_array` stacks them into 2D arrays.
+
+        When ``"array"`` is assigned, :func:`proj_array`
+        reads the values from :func:`array_sweep`, which calculates
+        the values for all the model points and all ``t``
+        in one forward sweep. The results are the same
+        in both modes::
+
+            >>> Projection.engine = "array"
+
+        When ``"stream"`` is assigned, the present values and
+        the totals over the model points are read from
+        :func:`stream_sweep`, which accumulates them step by step
+        without keeping the values for all ``t``, so memory usage
+        is proportional to the number of model points.
+        The results are the same as the other modes up to
+        floating-point rounding, but :func:`proj_array`
+        is not available in this mode.
+
+        .. seealso::
+
+           * :func:`proj_array`
+           * :func:`proj_total`
+           * :func:`pv_array`
+           * :func:`array_sweep`
+           * :func:`stream_sweep`
+
     np: The `numpy`_ module.
     pd: The `pandas`_ module.
 
@@ -220,6 +253,100 @@ def age_at_entry():
     return model_point()["age_at_entry"]
 
 
+def array_sweep():
+    """Projected values of all the model points by one forward sweep
+
+    Calculates the numbers of policies and the cashflows
+    for all the model points and all ``t``
+    from 0 to :func:`max_proj_len` - 1, and
+    returns them in a dict of 2D numpy arrays.
+    The first axis of the arrays is ``t``
+    and the second axis is model points.
+    The keys of the dict are the names of the Cells the arrays correspond to,
+    such as ``"premiums"`` and ``"pols_death"``.
+    The value for ``"pols_if_at"`` is a dict keyed with the timings
+    (``"BEF_MAT"``, ``"BEF_NB"`` and ``"BEF_DECR"``).
+
+    The items that do not depend on the number of policies, such as
+    the durations and the decrement rates, are calculated for all ``t`` at once,
+    then only the number of policies are rolled forward from ``t=0``.
+    The formulas are the vectorized counterparts of
+    :func:`duration_mth`, :func:`mort_rate_mth`, :func:`lapse_rate`,
+    :func:`pols_if_at` and the Cells of the cashflows,
+    and produce the same values.
+    The assumptions are calculated by the same functions as the Cells,
+    :func:`mort_rate_func`, :func:`lapse_rate_func` and
+    :func:`commission_rate_func`, so changes to them
+    are reflected in this Cells.
+
+    This Cells is used by :func:`proj_array` only when
+    ``"array"`` is assigned to :attr:`engine`.
+
+    .. seealso::
+
+        * :attr:`engine`
+        * :func:`proj_array`
+
+    """
+    t_len = max_proj_len()
+    t_ = np.arange(t_len)[:, np.newaxis]
+
+    dur_mth = duration_mth(0).values + t_
+    dur = dur_mth // 12
+    ages = age_at_entry().values + dur
+
+    mort_mth = 1-(1- mort_rate_func()(ages, dur))**(1/12)
+    lapse_mth = 1-(1 - lapse_rate_func()(dur))**(1/12)
+
+    is_mat = (dur_mth == policy_term().values * 12)
+    new_biz = np.where(dur_mth == 0, model_point()['policy_count'].values, 0)
+
+    bef_mat = np.empty(dur.shape)
+    bef_nb = np.empty(dur.shape)
+    bef_decr = np.empty(dur.shape)
+    maturity = np.empty(dur.shape)
+    death = np.empty(dur.shape)
+    lapse = np.empty(dur.shape)
+
+    for t in range(t_len):
+
+        if t == 0:
+            bef_mat[t] = pols_if_init().values
+        else:
+            bef_mat[t] = bef_decr[t-1] - lapse[t-1] - death[t-1]
+
+        maturity[t] = is_mat[t] * bef_mat[t]
+        bef_nb[t] = bef_mat[t] - maturity[t]
+        bef_decr[t] = bef_nb[t] + new_biz[t]
+        death[t] = bef_decr[t] * mort_mth[t]
+        lapse[t] = (bef_decr[t] - death[t]) * lapse_mth[t]
+
+    infl = np.array([inflation_factor(t) for t in range(t_len)])[:, np.newaxis]
+
+    prems = premium_pp().values * bef_decr
+    clms = np.array([claim_pp(t) for t in range(t_len)]) * death
+    exps = expense_acq() * new_biz + bef_decr * expense_maint()/12 * infl
+    comms = commission_rate_func()(dur) * prems
+
+    return {
+        "pols_if": bef_mat,
+        "pols_if_at": {
+            "BEF_MAT": bef_mat,
+            "BEF_NB": bef_nb,
+            "BEF_DECR": bef_decr
+        },
+        "pols_maturity": maturity,
+        "pols_new_biz": new_biz,
+        "pols_death": death,
+        "pols_lapse": lapse,
+        "premiums": prems,
+        "claims": clms,
+        "expenses": exps,
+        "commissions": comms,
+        "net_cf": prems - clms - exps - comms
+    }
+
+
 def claim_pp(t):
     """Claim per policy
 
@@ -244,18 +371,40 @@ def claims(t):
     return claim_pp(t) * pols_death(t)
 
 
+def commission_rate_func():
+    """Function to calculate commission rates from durations
+
+    Returns a function that takes durations as an integer numpy array
+    or Series and returns the commission rates per premium for them
+    as a numpy array.
+    By default, the rate is 1 for the first year and 0 otherwise.
+
+    The function is used by :func:`commissions`, :func:`array_sweep`
+    and :func:`stream_sweep`,
+    so changes to the function are reflected in all the engines.
+
+    .. seealso::
+
+        * :func:`commissions`
+
+    """
+    return lambda dur: np.where(dur == 0, 1.0, 0.0)
+
+
 def commissions(t):
     """Commissions
 
     By default, 100% premiums for the first year, 0 otherwise.
+    The rates are given by :func:`commission_rate_func`.
 
     .. seealso::
 
         * :func:`premiums`
         * :func:`duration`
+        * :func:`commission_rate_func`
 
     """
-    return (duration(t) == 0) * premiums(t)
+    return commission_rate_func()(duration(t)) * premiums(t)
 
 
 def disc_factors():
@@ -380,12 +529,36 @@ def lapse_rate(t):
 
         max(0.1 - 0.02 * duration(t), 0.02)
 
+    The formula is defined by :func:`lapse_rate_func`.
+
     .. seealso::
 
-        :func:`duration`
+        * :func:`duration`
+        * :func:`lapse_rate_func`
 
     """
-    return np.maximum(0.1 - 0.02 * duration(t), 0.02)
+    return lapse_rate_func()(duration(t))
+
+
+def lapse_rate_func():
+    """Function to calculate lapse rates from durations
+
+    Returns a function that takes durations as an integer numpy array
+    or Series and returns the annual lapse rates for them.
+    By default, the lapse rate assumption is defined by duration as::
+
+        max(0.1 - 0.02 * duration, 0.02)
+
+    The function is used by :func:`lapse_rate`, :func:`array_sweep`
+    and :func:`stream_sweep`,
+    so changes to the function are reflected in all the engines.
+
+    .. seealso::
+
+        * :func:`lapse_rate`
+
+    """
+    return lambda dur: np.maximum(0.1 - 0.02 * dur, 0.02)
 
 
 def loading_prem():
@@ -455,22 +628,43 @@ def mort_rate(t):
 
     .. seealso::
 
-       * :func:`mort_table_reindexed`
+       * :func:`mort_rate_func`
        * :func:`mort_rate_mth`
        * :func:`model_point`
 
     """
 
-    # mi is a MultiIndex whose values are
-    # pairs of age at t and duration at t capped at 5 for all the model points.
+    # The rates for all the model points are calculated at once
+    # by :func:`mort_rate_func` from the ages and the durations at t.
 
-    # ``mort_table_reindexed().reindex(mi, fill_value=0)`` returns
-    # a Series of mortality rates whose indexes match the MultiIndex values.
-    # The ``set_axis`` method replace the MultiIndex with ``point_id``
+    x, d = age(t).to_numpy(), duration(t).to_numpy()
+    return pd.Series(mort_rate_func()(x, d), index=model_point().index)
 
-    mi = pd.MultiIndex.from_arrays([age(t), np.minimum(duration(t), 5)])
-    return mort_table_reindexed().reindex(
-        mi, fill_value=0).set_axis(model_point().index)
+
+def mort_rate_func():
+    """Function to calculate mortality rates from ages and durations
+
+    Returns a function that takes ages and durations as
+    integer numpy arrays of the same shape and returns
+    the annual mortality rates for them.
+    By default, the rates are looked up from :func:`mort_table_array`
+    by :func:`table_lookup` with the ages and the durations capped at 5.
+    Ages and durations out of the table, such as negative durations
+    of future new business, result in 0.
+
+    The function is used by :func:`mort_rate`, :func:`array_sweep`
+    and :func:`stream_sweep`,
+    so changes to the function are reflected in all the engines.
+
+    .. seealso::
+
+        * :func:`mort_rate`
+        * :func:`mort_table_array`
+        * :func:`table_lookup`
+
+    """
+    lookup, table = table_lookup(), mort_table_array()
+    return lambda x, dur: lookup(table, x, np.minimum(dur, 5))
 
 
 def mort_rate_mth(t):
@@ -485,9 +679,36 @@ def mort_rate_mth(t):
     return 1-(1- mort_rate(t))**(1/12)
 
 
+def mort_table_array():
+    """Mortality table as a 2D array
+
+    Returns the mortality rates in :attr:`mort_table` as a 2D numpy array
+    whose row indices are ages and column indices are durations,
+    so that the rate for age ``x`` and duration ``d`` is
+    ``mort_table_array()[x, d]``.
+    Rows for the ages not in :attr:`mort_table` are filled with 0.
+
+    .. seealso::
+
+       * :attr:`mort_table`
+       * :func:`mort_rate`
+
+    """
+    ages = mort_table.index.to_numpy()
+    durs = mort_table.columns.astype(int).to_numpy()
+
+    result = np.zeros((ages.max() + 1, durs.max() + 1))
+    result[np.ix_(ages, durs)] = mort_table.to_numpy()
+    return result
+
+
 def mort_table_reindexed():
     """MultiIndexed mortality table
 
+    .. note::
+       This cells is not used by default.
+       :func:`mort_rate` uses :func:`mort_table_array` instead.
+
     Returns a Series of mortlity rates reshaped from :attr:`mort_table`.
     The returned Series is indexed by age and duration capped at 5.
 
@@ -688,30 +909,56 @@ def premium_pp():
         np.around(sum_assured() * prem_rates, 2)
 
     where the ``prem_rates`` is a Series of premium rates
-    retrieved from :attr:`premium_table`.
+    looked up from :func:`premium_table_array` by
+    :func:`age_at_entry` and :func:`policy_term`.
 
     .. seealso::
 
         * :attr:`premium_table`
+        * :func:`premium_table_array`
+        * :func:`table_lookup`
         * :func:`model_point`
         * :func:`age_at_entry`
         * :func:`policy_term`
 
     """
 
-    # mi is a MultiIndex whose values are
-    # pairs of issue ages and policy terms for all the model points.
-
-    # ``premium_table.reindex(mi)`` returns
-    # a Series of premium rates whose indexes match the MultiIndex values.
-    # The ``set_axis`` method replace the MultiIndex with ``point_id``
+    # ``premium_table_array()`` holds the premium rates in a 2D array
+    # indexed by issue age and policy term. The rates for all the
+    # model points are picked up at once by :func:`table_lookup` with
+    # the issue ages and the policy terms.
+    # Pairs not in :attr:`premium_table` result in NaN.
 
-    mi = pd.MultiIndex.from_arrays([age_at_entry(), policy_term()])
-    prem_rates = premium_table.reindex(mi).set_axis(
-        model_point().index)
+    x, n = age_at_entry().to_numpy(), policy_term().to_numpy()
+    prem_rates = pd.Series(
+        table_lookup()(premium_table_array(), x, n, fill=np.nan),
+        index=model_point().index)
     return np.around(sum_assured() * prem_rates, 2)
 
 
+def premium_table_array():
+    """Premium rate table as a 2D array
+
+    Returns the premium rates in :attr:`premium_table` as a 2D numpy array
+    whose row indices are issue ages and column indices are policy terms,
+    so that the rate for issue age ``x`` and policy term ``n`` is
+    ``premium_table_array()[x, n]``.
+    Elements for the pairs not in :attr:`premium_table` are filled with NaN.
+
+    .. seealso::
+
+       * :attr:`premium_table`
+       * :func:`premium_pp`
+
+    """
+    ages = premium_table.index.get_level_values(0).to_numpy()
+    terms = premium_table.index.get_level_values(1).to_numpy()
+
+    result = np.full((ages.max() + 1, terms.max() + 1), np.nan)
+    result[ages, terms] = premium_table.to_numpy()
+    return result
+
+
 def premiums(t):
     """Premium income
 
@@ -751,6 +998,94 @@ def proj_len():
     return np.maximum(12 * policy_term() - duration_mth(0) + 1, 0)
 
 
+def proj_array(name, timing=None):
+    """Values of a Cells for all model points and all ``t`` as a 2D array
+
+    Returns a 2D numpy array of the values of the Cells
+    specified by ``name``, such as ``"claims"`` or ``"pols_death"``.
+    The rows of the array are model points, and the columns
+    are ``t`` from 0 to :func:`max_proj_len` - 1.
+    ``timing`` is passed to the Cells as the second argument if given,
+    such as ``proj_array("pols_if_at", "BEF_DECR")``.
+
+    If :attr:`engine` is ``"cells"``, the array is constructed
+    by calling the Cells for each ``t``.
+    If :attr:`engine` is ``"array"``, the array is read from
+    :func:`array_sweep`.
+    If :attr:`engine` is ``"stream"``, an error is raised
+    as the values for all ``t`` are not kept in that mode.
+
+    .. seealso::
+
+        * :attr:`engine`
+        * :func:`array_sweep`
+
+    """
+    if engine == "cells":
+        args = () if timing is None else (timing,)
+        cells = getattr(_space, name)
+        return np.array(list(cells(t, *args) for t in range(max_proj_len()))).transpose()
+
+    elif engine == "array":
+        result = array_sweep()[name]
+        return (result if timing is None else result[timing]).transpose()
+
+    elif engine == "stream":
+        raise ValueError("proj_array is not available in stream engine")
+
+    else:
+        raise ValueError("invalid engine")
+
+
+def proj_total(name):
+    """Totals of a Cells over all model points by ``t``
+
+    Returns a 1D numpy array of the sums of the values of the Cells
+    specified by ``name`` over all the model points
+    for ``t`` from 0 to :func:`max_proj_len` - 1.
+
+    If :attr:`engine` is ``"stream"``, the totals are read from
+    :func:`stream_sweep`. Otherwise, the totals are calculated from
+    :func:`proj_array`.
+
+    .. seealso::
+
+        * :attr:`engine`
+        * :func:`result_cf`
+        * :func:`result_pols`
+
+    """
+    if engine == "stream":
+        return stream_sweep()["total"][name]
+    else:
+        return proj_array(name).sum(axis=0)
+
+
+def pv_array(name, timing=None):
+    """Present values of a Cells for all model points
+
+    Returns a 1D numpy array of the present values of the Cells
+    specified by ``name``, such as ``"claims"``, by model point.
+    ``timing`` is interpreted in the same way as :func:`proj_array`.
+
+    If :attr:`engine` is ``"stream"``, the present values are read from
+    :func:`stream_sweep`. Otherwise, the present values are calculated
+    by multiplying :func:`proj_array` by :func:`disc_factors`.
+
+    .. seealso::
+
+        * :attr:`engine`
+        * :func:`proj_array`
+        * :func:`stream_sweep`
+
+    """
+    if engine == "stream":
+        result = stream_sweep()["pv"][name]
+        return result if timing is None else result[timing]
+    else:
+        return proj_array(name, timing) @ disc_factors()[:max_proj_len()]
+
+
 def pv_claims():
     """Present value of claims
 
@@ -759,9 +1094,7 @@ def pv_claims():
         * :func:`claims`
 
     """
-    cl = np.array(list(claims(t) for t in range(max_proj_len()))).transpose()
-
-    return cl @ disc_factors()[:max_proj_len()]
+    return pv_array("claims")
 
 
 def pv_commissions():
@@ -772,9 +1105,7 @@ def pv_commissions():
         * :func:`expenses`
 
     """
-    result = np.array(list(commissions(t) for t in range(max_proj_len()))).transpose()
-
-    return result @ disc_factors()[:max_proj_len()]
+    return pv_array("commissions")
 
 
 def pv_expenses():
@@ -785,9 +1116,7 @@ def pv_expenses():
         * :func:`expenses`
 
     """
-    result = np.array(list(expenses(t) for t in range(max_proj_len()))).transpose()
-
-    return result @ disc_factors()[:max_proj_len()]
+    return pv_array("expenses")
 
 
 def pv_net_cf():
@@ -818,9 +1147,7 @@ def pv_pols_if():
     It is used as the annuity factor for calculating :func:`net_premium_pp`.
 
     """
-    result = np.array(list(pols_if_at(t, "BEF_DECR") for t in range(max_proj_len()))).transpose()
-
-    return result @ disc_factors()[:max_proj_len()]
+    return pv_array("pols_if_at", "BEF_DECR")
 
 
 def pv_premiums():
@@ -831,9 +1158,7 @@ def pv_premiums():
         * :func:`premiums`
 
     """
-    result = np.array(list(premiums(t) for t in range(max_proj_len()))).transpose()
-
-    return result @ disc_factors()[:max_proj_len()]
+    return pv_array("premiums")
 
 
 def result_cf():
@@ -852,11 +1177,11 @@ def result_cf():
     t_len = range(max_proj_len())
 
     data = {
-        "Premiums": [sum(premiums(t)) for t in t_len],
-        "Claims": [sum(claims(t)) for t in t_len],
-        "Expenses": [sum(expenses(t)) for t in t_len],
-        "Commissions": [sum(commissions(t)) for t in t_len],
-        "Net Cashflow": [sum(net_cf(t)) for t in t_len]
+        "Premiums": proj_total("premiums"),
+        "Claims": proj_total("claims"),
+        "Expenses": proj_total("expenses"),
+        "Commissions": proj_total("commissions"),
+        "Net Cashflow": proj_total("net_cf")
     }
 
     return pd.DataFrame(data, index=t_len)
@@ -878,11 +1203,11 @@ def result_pols():
     t_len = range(max_proj_len())
 
     data = {
-        "pols_if": [sum(pols_if(t)) for t in t_len],
-        "pols_maturity": [sum(pols_maturity(t)) for t in t_len],
-        "pols_new_biz": [sum(pols_new_biz(t)) for t in t_len],
-        "pols_death": [sum(pols_death(t)) for t in t_len],
-        "pols_lapse": [sum(pols_lapse(t)) for t in t_len]
+        "pols_if": proj_total("pols_if"),
+        "pols_maturity": proj_total("pols_maturity"),
+        "pols_new_biz": proj_total("pols_new_biz"),
+        "pols_death": proj_total("pols_death"),
+        "pols_lapse": proj_total("pols_lapse")
     }
 
     return pd.DataFrame(data, index=t_len)
@@ -925,6 +1250,110 @@ def sex():
     return model_point()["sex"]
 
 
+def stream_sweep():
+    """Present values and totals of all the model points by one forward sweep
+
+    Rolls the numbers of policies and the cashflows of all the model points
+    forward from ``t=0`` to :func:`max_proj_len` - 1 in the same way as
+    :func:`array_sweep`, but instead of keeping the values for all ``t``,
+    accumulates at each ``t`` the present values by model point
+    and the totals over the model points.
+    The memory required is proportional to the number of model points.
+    As in :func:`array_sweep`, the assumptions are calculated by
+    :func:`mort_rate_func`, :func:`lapse_rate_func` and
+    :func:`commission_rate_func`.
+
+    The values at each ``t`` are the same as those of the other engines,
+    but the present values and the totals may differ from them
+    by floating-point rounding, as they are summed up
+    in a different order: the other engines calculate them from
+    the values for all ``t`` by the matrix product with
+    :func:`disc_factors` and by :meth:`numpy.ndarray.sum`.
+
+    Returns a dict with the two keys, ``"pv"`` and ``"total"``.
+    The value for ``"pv"`` is a dict of 1D arrays of the present values
+    by model point keyed with the names of the Cells, such as
+    ``"premiums"``. As in :func:`array_sweep`, the value for
+    ``"pols_if_at"`` is a dict keyed with the timings.
+    The value for ``"total"`` is a dict of 1D arrays
+    of the totals by ``t`` keyed with the names of the Cells.
+
+    This Cells is used by :func:`pv_array` and :func:`proj_total`
+    only when ``"stream"`` is assigned to :attr:`engine`.
+
+    .. seealso::
+
+        * :attr:`engine`
+        * :func:`pv_array`
+        * :func:`proj_total`
+        * :func:`array_sweep`
+
+    """
+    t_len = max_proj_len()
+    disc = disc_factors()[:t_len]
+    mort_rate_ = mort_rate_func()
+    lapse_rate_ = lapse_rate_func()
+    comm_rate = commission_rate_func()
+
+    dur_mth_init = duration_mth(0).values
+    entry_age = age_at_entry().values
+    term_mth = policy_term().values * 12
+    pols_nb = model_point()['policy_count'].values
+    prem_pp = premium_pp().values
+
+    names = ["pols_if", "pols_maturity", "pols_new_biz", "pols_death",
+             "pols_lapse", "premiums", "claims", "expenses", "commissions",
+             "net_cf"]
+    timings = ["BEF_MAT", "BEF_NB", "BEF_DECR"]
+
+    pv = {name: np.zeros(len(entry_age)) for name in names}
+    pv["pols_if_at"] = {timing: np.zeros(len(entry_age)) for timing in timings}
+    total = {name: [] for name in names}
+
+    for t in range(t_len):
+
+        dur_mth = dur_mth_init + t
+        dur = dur_mth // 12
+        ages = entry_age + dur
+
+        mort_mth = 1-(1- mort_rate_(ages, dur))**(1/12)
+        lapse_mth = 1-(1 - lapse_rate_(dur))**(1/12)
+
+        if t == 0:
+            bef_mat = pols_if_init().values
+        else:
+            bef_mat = bef_decr - lapse - death
+
+        maturity = (dur_mth == term_mth) * bef_mat
+        bef_nb = bef_mat - maturity
+        new_biz = np.where(dur_mth == 0, pols_nb, 0)
+        bef_decr = bef_nb + new_biz
+        death = bef_decr * mort_mth
+        lapse = (bef_decr - death) * lapse_mth
+
+        prems = prem_pp * bef_decr
+        clms = claim_pp(t).values * death
+        exps = (expense_acq() * new_biz
+                + bef_decr * expense_maint()/12 * inflation_factor(t))
+        comms = comm_rate(dur) * prems
+
+        values = dict(zip(names, [
+            bef_mat, maturity, new_biz, death, lapse,
+            prems, clms, exps, comms, prems - clms - exps - comms]))
+
+        for name in names:
+            pv[name] += values[name] * disc[t]
+            total[name].append(values[name].sum())
+
+        for timing, value in zip(timings, [bef_mat, bef_nb, bef_decr]):
+            pv["pols_if_at"][timing] += value * disc[t]
+
+    return {
+        "pv": pv,
+        "total": {name: np.array(total[name]) for name in names}
+    }
+
+
 def sum_assured():
     """The sum assured of the model points
 
@@ -934,6 +1363,30 @@ def sum_assured():
     return model_point()["sum_assured"]
 
 
+def table_lookup():
+    """Function to look up 2D tables by pairs of indices
+
+    Returns a function ``lookup(table, x, d, fill=0)`` that takes
+    a 2D numpy array ``table`` and two integer numpy arrays
+    ``x`` and ``d`` of the same shape, and returns
+    the elements ``table[x, d]`` as an array of the same shape.
+    The elements for the pairs of indices out of ``table``,
+    such as negative durations of future new business, are ``fill``.
+
+    The function is shared by :func:`mort_rate_func` and :func:`premium_pp`.
+    A function is returned in place of taking the arrays as
+    the parameters of this Cells, as the parameters of Cells
+    must be hashable.
+    """
+    def lookup(table, x, d, fill=0):
+        in_table = ((0 <= x) & (x < table.shape[0])
+                    & (0 <= d) & (d < table.shape[1]))
+        values = table[np.where(in_table, x, 0), np.where(in_table, d, 0)]
+        return np.where(in_table, values, fill)
+
+    return lookup
+
+
 # ---------------------------------------------------------------------------
 # References
 
@@ -947,4 +1400,6 @@ pd = ("Module", "pandas")
 
 model_point_table = ("DataClient", 2506395652680)
 
-premium_table = ("DataClient", 2506414290888)
\ No newline at end of file
+premium_table = ("DataClient", 2506414290888)
+
+engine = "cells"
\ No newline at end of file
@@ -34,6 +34,14 @@ Attributes:
             >>> Projection[2]
             <ItemSpace BasicTerm_S.Projection[2]>
 
+        The item spaces hold the values of their Cells until deleted.
+        To run many model points, :func:`lifelib.runner.run_seriatim`
+        deletes each item space as soon as its results are taken::
+
+            >>> from lifelib.runner import run_seriatim
+
+            >>> run_seriatim(Projection, range(1, 1001))['pv_net_cf']
+
         .. seealso::
 
            * :attr:`model_point_table`
@@ -34,6 +34,14 @@ Attributes:
             >>> Projection[2]
             <ItemSpace BasicTerm_SE.Projection[2]>
 
+        The item spaces hold the values of their Cells until deleted.
+        To run many model points, :func:`lifelib.runner.run_seriatim`
+        deletes each item space as soon as its results are taken::
+
+            >>> from lifelib.runner import run_seriatim
+
+            >>> run_seriatim(Projection, range(1, 1001))['pv_net_cf']
+
         .. seealso::
 
            * :attr:`model_point_table`
@@ -194,6 +202,31 @@ Attributes:
 
            * :func:`mort_rate`
            * :func:`mort_rate_mth`
+           * :func:`mort_table_array`
+
+    engine: A string to select how the projection is carried out.
+        ``"cells"`` by default.
+
+        When ``"cells"`` is assigned, the values of the Cells
+        such as :func:`pols_if_at`, :func:`claims` and :func:`premiums`
+        are calculated for each ``t`` recursively,
+        and the present values are calculated from them.
+
+        When ``"scalar"`` is assigned, the present values are read from
+        :func:`scalar_sweep`, which reads the attributes of
+        the model point once and rolls the numbers of policies and
+        the cashflows forward in plain Python floats.
+        The results are the same in both modes,
+        but the values of the Cells for each ``t`` are not calculated
+        in the ``"scalar"`` mode, which makes it much faster
+        to project one model point at a time::
+
+            >>> Projection.engine = "scalar"
+
+        .. seealso::
+
+           * :func:`scalar_sweep`
+           * :func:`pv_claims`
 
     np: The `numpy`_ module.
     pd: The `pandas`_ module.
@@ -291,18 +324,38 @@ def claims(t):
     return claim_pp(t) * pols_death(t)
 
 
+def commission_rate_func():
+    """Function to calculate commission rates from durations
+
+    Returns a function that takes a duration and returns
+    the commission rate per premium for it.
+    By default, the rate is 1 for the first year and 0 otherwise.
+
+    The function is used by :func:`commissions` and :func:`scalar_sweep`,
+    so changes to the function are reflected in both the engines.
+
+    .. seealso::
+
+        * :func:`commissions`
+
+    """
+    return lambda dur: 1 if dur == 0 else 0
+
+
 def commissions(t): 
     """Commissions
 
     By default, 100% premiums for the first year, 0 otherwise.
+    The rates are given by :func:`commission_rate_func`.
 
     .. seealso::
 
         * :func:`premiums`
         * :func:`duration`
+        * :func:`commission_rate_func`
 
     """
-    return premiums(t) if duration(t) == 0 else 0
+    return commission_rate_func()(duration(t)) * premiums(t)
 
 
 def disc_factors():
@@ -315,7 +368,8 @@ def disc_factors():
 
         :func:`disc_rate_mth`
     """
-    return np.array(list((1 + disc_rate_mth()[t])**(-t) for t in range(proj_len())))
+    rates = disc_rate_mth()
+    return np.array(list((1 + rates[t])**(-t) for t in range(proj_len())))
 
 
 def disc_rate_mth():
@@ -331,7 +385,8 @@ def disc_rate_mth():
         :func:`disc_rate_ann`
 
     """
-    return np.array(list((1 + disc_rate_ann[t//12])**(1/12) - 1 for t in range(proj_len())))
+    rates = dict(zip(disc_rate_ann.index, disc_rate_ann.to_numpy()))
+    return np.array(list((1 + rates[t//12])**(1/12) - 1 for t in range(proj_len())))
 
 
 def duration(t):
@@ -427,12 +482,35 @@ def lapse_rate(t):
 
         max(0.1 - 0.02 * duration(t), 0.02)
 
+    The formula is defined by :func:`lapse_rate_func`.
+
     .. seealso::
 
-        :func:`duration`
+        * :func:`duration`
+        * :func:`lapse_rate_func`
 
     """
-    return max(0.1 - 0.02 * duration(t), 0.02)
+    return lapse_rate_func()(duration(t))
+
+
+def lapse_rate_func():
+    """Function to calculate lapse rates from durations
+
+    Returns a function that takes a duration and returns
+    the annual lapse rate for it.
+    By default, the lapse rate assumption is defined by duration as::
+
+        max(0.1 - 0.02 * duration, 0.02)
+
+    The function is used by :func:`lapse_rate` and :func:`scalar_sweep`,
+    so changes to the function are reflected in both the engines.
+
+    .. seealso::
+
+        * :func:`lapse_rate`
+
+    """
+    return lambda dur: max(0.1 - 0.02 * dur, 0.02)
 
 
 def loading_prem():
@@ -492,13 +570,43 @@ def model_point():
 def mort_rate(t):
     """Mortality rate to be applied at time t
 
+    Ages and durations out of :attr:`mort_table`, such as
+    negative durations of future new business, result in 0.
+    The rate is calculated by :func:`mort_rate_func`.
+
     .. seealso::
 
        * :attr:`mort_table`
+       * :func:`mort_rate_func`
        * :func:`mort_rate_mth`
 
     """
-    return mort_table[str(max(min(5, duration(t)),0))][age(t)]
+    return mort_rate_func()(age(t), duration(t))
+
+
+def mort_rate_func():
+    """Function to calculate mortality rates from ages and durations
+
+    Returns a function that takes an age and a duration and returns
+    the annual mortality rate for them.
+    By default, the rate is looked up from :func:`mort_table_array`
+    by :func:`table_lookup`
+    with the age and the duration capped at 5.
+    Ages and durations out of the table, such as negative durations
+    of future new business, result in 0.
+
+    The function is used by :func:`mort_rate` and :func:`scalar_sweep`,
+    so changes to the function are reflected in both the engines.
+
+    .. seealso::
+
+        * :func:`mort_rate`
+        * :func:`mort_table_array`
+        * :func:`table_lookup`
+
+    """
+    lookup, table = table_lookup(), mort_table_array()
+    return lambda x, dur: lookup(table, x, min(5, dur))
 
 
 def mort_rate_mth(t):
@@ -513,6 +621,29 @@ def mort_rate_mth(t):
     return 1-(1- mort_rate(t))**(1/12)
 
 
+def mort_table_array():
+    """Mortality table as a 2D array
+
+    Returns the mortality rates in :attr:`mort_table` as a 2D numpy array
+    whose row indices are ages and column indices are durations,
+    so that the rate for age ``x`` and duration ``d`` is
+    ``mort_table_array()[x, d]``.
+    Rows for the ages not in :attr:`mort_table` are filled with 0.
+
+    .. seealso::
+
+       * :attr:`mort_table`
+       * :func:`scalar_sweep`
+
+    """
+    ages = mort_table.index.to_numpy()
+    durs = mort_table.columns.astype(int).to_numpy()
+
+    result = np.zeros((ages.max() + 1, durs.max() + 1))
+    result[np.ix_(ages, durs)] = mort_table.to_numpy()
+    return result
+
+
 def net_cf(t):
     """Net cashflow
 
@@ -705,18 +836,50 @@ def premium_pp():
 
     Monthly premium amount per policy defined as::
 
-        round(sum_assured() * premium_table[age_at_entry(), policy_term()], 2)
+        round(sum_assured() * prem_rate, 2)
+
+    where ``prem_rate`` is the premium rate looked up from
+    :func:`premium_table_array` by :func:`table_lookup`
+    with :func:`age_at_entry` and :func:`policy_term`.
+    A pair not in :attr:`premium_table` results in NaN.
 
     .. seealso::
 
         * :attr:`premium_table`
+        * :func:`premium_table_array`
+        * :func:`table_lookup`
         * :func:`sum_assured`
         * :func:`age_at_entry`
         * :func:`policy_term`
 
 
     """
-    return round(sum_assured() * premium_table[age_at_entry(), policy_term()], 2)
+    prem_rate = table_lookup()(
+        premium_table_array(), age_at_entry(), policy_term(), fill=np.nan)
+    return round(sum_assured() * prem_rate, 2)
+
+
+def premium_table_array():
+    """Premium rate table as a 2D array
+
+    Returns the premium rates in :attr:`premium_table` as a 2D numpy array
+    whose row indices are issue ages and column indices are policy terms,
+    so that the rate for issue age ``x`` and policy term ``n`` is
+    ``premium_table_array()[x, n]``.
+    Elements for the pairs not in :attr:`premium_table` are filled with NaN.
+
+    .. seealso::
+
+       * :attr:`premium_table`
+       * :func:`premium_pp`
+
+    """
+    ages = premium_table.index.get_level_values(0).to_numpy()
+    terms = premium_table.index.get_level_values(1).to_numpy()
+
+    result = np.full((ages.max() + 1, terms.max() + 1), np.nan)
+    result[ages, terms] = premium_table.to_numpy()
+    return result
 
 
 def premiums(t):
@@ -757,8 +920,12 @@ def pv_claims():
     .. seealso::
 
         * :func:`claims`
+        * :func:`scalar_sweep`
 
     """
+    if engine == "scalar":
+        return scalar_sweep()["claims"]
+
     return sum(list(claims(t) for t in range(proj_len())) * disc_factors()[:proj_len()])
 
 
@@ -768,8 +935,12 @@ def pv_commissions():
     .. seealso::
 
         * :func:`expenses`
+        * :func:`scalar_sweep`
 
     """
+    if engine == "scalar":
+        return scalar_sweep()["commissions"]
+
     return sum(list(commissions(t) for t in range(proj_len())) * disc_factors()[:proj_len()])
 
 
@@ -779,8 +950,12 @@ def pv_expenses():
     .. seealso::
 
         * :func:`expenses`
+        * :func:`scalar_sweep`
 
     """
+    if engine == "scalar":
+        return scalar_sweep()["expenses"]
+
     return sum(list(expenses(t) for t in range(proj_len())) * disc_factors()[:proj_len()])
 
 
@@ -813,6 +988,9 @@ def pv_pols_if():
     It is used as the annuity factor for calculating :func:`net_premium_pp`.
 
     """
+    if engine == "scalar":
+        return scalar_sweep()["pols_if"]
+
     return sum(list(pols_if(t) for t in range(proj_len())) * disc_factors()[:proj_len()])
 
 
@@ -822,8 +1000,12 @@ def pv_premiums():
     .. seealso::
 
         * :func:`premiums`
+        * :func:`scalar_sweep`
 
     """
+    if engine == "scalar":
+        return scalar_sweep()["premiums"]
+
     return sum(list(premiums(t) for t in range(proj_len())) * disc_factors()[:proj_len()])
 
 
@@ -900,6 +1082,81 @@ def result_pv():
             orient='index')
 
 
+def scalar_sweep():
+    """Present values of the selected model point by one forward sweep
+
+    Reads the attributes of the selected model point, such as
+    :func:`age_at_entry` and :func:`premium_pp`, once
+    and rolls the number of policies and the cashflows
+    forward from ``t=0`` to :func:`proj_len` - 1 in plain Python floats,
+    without calling the Cells for each ``t``.
+    The mortality, lapse and commission rates are calculated by
+    :func:`mort_rate_func`, :func:`lapse_rate_func` and
+    :func:`commission_rate_func` as in the Cells.
+    The other formulas of the Cells, such as :func:`claim_pp`,
+    are inlined, so changes to them are not reflected in this mode.
+
+    Returns a dict of the present values keyed with the names of the Cells,
+    ``"premiums"``, ``"claims"``, ``"expenses"``, ``"commissions"``
+    and ``"pols_if"``. The present values are the same as those
+    calculated from the Cells.
+
+    This Cells is used by the present value Cells, such as :func:`pv_claims`,
+    only when ``"scalar"`` is assigned to :attr:`engine`.
+
+    .. seealso::
+
+        * :attr:`engine`
+        * :func:`mort_table_array`
+
+    """
+    mort_rate_ = mort_rate_func()
+    lapse_rate_ = lapse_rate_func()
+    comm_rate = commission_rate_func()
+    disc = disc_factors()
+
+    entry_age = age_at_entry()
+    dur_mth_init = duration_mth(0)
+    term_mth = policy_term() * 12
+    pols_nb = model_point()['policy_count']
+    prem_pp = premium_pp()
+    claim = sum_assured()
+    exp_acq = expense_acq()
+    exp_maint = expense_maint()
+    infl = 1 + inflation_rate()
+
+    names = ["premiums", "claims", "expenses", "commissions", "pols_if"]
+    pv = dict.fromkeys(names, 0)
+
+    for t in range(proj_len()):
+
+        dur_mth = dur_mth_init + t
+        dur = dur_mth // 12
+        mort = mort_rate_(entry_age + dur, dur)
+
+        if t == 0:
+            bef_mat = pols_if_init()
+        else:
+            bef_mat = bef_decr - lapse - death
+
+        maturity = bef_mat if dur_mth == term_mth else 0
+        new_biz = pols_nb if dur_mth == 0 else 0
+        bef_decr = bef_mat - maturity + new_biz
+        death = bef_decr * (1-(1- mort)**(1/12))
+        lapse = (bef_decr - death) * (1-(1 - lapse_rate_(dur))**(1/12))
+
+        prems = prem_pp * bef_decr
+        exps = exp_acq * new_biz + bef_decr * exp_maint/12 * infl**(t/12)
+
+        pv["premiums"] += prems * disc[t]
+        pv["claims"] += claim * death * disc[t]
+        pv["expenses"] += exps * disc[t]
+        pv["commissions"] += comm_rate(dur) * prems * disc[t]
+        pv["pols_if"] += bef_mat * disc[t]
+
+    return pv
+
+
 def sex(): 
     """The sex of the selected model point
 
@@ -921,6 +1178,32 @@ def sum_assured():
     return model_point()["sum_assured"]
 
 
+def table_lookup():
+    """Function to look up 2D tables by a pair of indices
+
+    Returns a function ``lookup(table, x, d, fill=0)`` that takes
+    a 2D numpy array ``table`` and two integers ``x`` and ``d``,
+    and returns the element ``table[x, d]``.
+    ``fill`` is returned if the pair is out of ``table``,
+    such as a negative duration of future new business,
+    instead of an element counted from the end of ``table``.
+
+    The function is used by :func:`mort_rate_func` and :func:`premium_pp`.
+
+    .. seealso::
+
+        * :func:`mort_table_array`
+        * :func:`premium_table_array`
+
+    """
+    def lookup(table, x, d, fill=0):
+        if 0 <= x < table.shape[0] and 0 <= d < table.shape[1]:
+            return table[x, d]
+        return fill
+
+    return lookup
+
+
 # ---------------------------------------------------------------------------
 # References
 
@@ -936,4 +1219,6 @@ pd = ("Module", "pandas")
 
 point_id = 1
 
+engine = "cells"
+
 premium_table = ("DataClient", 2160336367816)
\ No newline at end of file
@@ -455,22 +455,23 @@ def mort_rate(t):
 
     .. seealso::
 
-       * :func:`mort_table_reindexed`
+       * :func:`mort_table_array`
+       * :func:`table_lookup`
        * :func:`mort_rate_mth`
        * :func:`model_point`
 
     """
 
-    # mi is a MultiIndex whose values are
-    # pairs of age at t and duration at t capped at 5 for all the model points.
+    # ``mort_table_array()`` holds the mortality rates in a 2D array
+    # indexed by age and duration. The rates for all the model points
+    # are picked up at once by :func:`table_lookup` with
+    # the ages at t and the durations at t capped at 5.
+    # Ages and durations out of the table, such as negative durations
+    # of future new business, result in 0.
 
-    # ``mort_table_reindexed().reindex(mi, fill_value=0)`` returns
-    # a Series of mortality rates whose indexes match the MultiIndex values.
-    # The ``set_axis`` method replace the MultiIndex with ``point_id``
-
-    mi = pd.MultiIndex.from_arrays([age(t), np.minimum(duration(t), 5)])
-    base_mort = mort_table_reindexed().reindex(
-        mi, fill_value=0).set_axis(model_point().index, inplace=False)
+    x, d = age(t).to_numpy(), np.minimum(duration(t), 5).to_numpy()
+    base_mort = pd.Series(table_lookup()(mort_table_array(), x, d),
+                          index=model_point().index)
     return mort_rate_mult * base_mort
 
 
@@ -486,9 +487,36 @@ def mort_rate_mth(t):
     return 1-(1- mort_rate(t))**(1/12)
 
 
+def mort_table_array():
+    """Mortality table as a 2D array
+
+    Returns the mortality rates in :attr:`mort_table` as a 2D numpy array
+    whose row indices are ages and column indices are durations,
+    so that the rate for age ``x`` and duration ``d`` is
+    ``mort_table_array()[x, d]``.
+    Rows for the ages not in :attr:`mort_table` are filled with 0.
+
+    .. seealso::
+
+       * :attr:`mort_table`
+       * :func:`mort_rate`
+
+    """
+    ages = mort_table.index.to_numpy()
+    durs = mort_table.columns.astype(int).to_numpy()
+
+    result = np.zeros((ages.max() + 1, durs.max() + 1))
+    result[np.ix_(ages, durs)] = mort_table.to_numpy()
+    return result
+
+
 def mort_table_reindexed():
     """MultiIndexed mortality table
 
+    .. note::
+       This cells is not used by default.
+       :func:`mort_rate` uses :func:`mort_table_array` instead.
+
     Returns a Series of mortlity rates reshaped from :attr:`mort_table`.
     The returned Series is indexed by age and duration capped at 5.
 
@@ -689,30 +717,56 @@ def premium_pp():
         np.around(sum_assured() * prem_rates, 2)
 
     where the ``prem_rates`` is a Series of premium rates
-    retrieved from :attr:`premium_table`.
+    looked up from :func:`premium_table_array` by
+    :func:`age_at_entry` and :func:`policy_term`.
 
     .. seealso::
 
         * :attr:`premium_table`
+        * :func:`premium_table_array`
+        * :func:`table_lookup`
         * :func:`model_point`
         * :func:`age_at_entry`
         * :func:`policy_term`
 
     """
 
-    # mi is a MultiIndex whose values are
-    # pairs of issue ages and policy terms for all the model points.
-
-    # ``premium_table.reindex(mi)`` returns
-    # a Series of premium rates whose indexes match the MultiIndex values.
-    # The ``set_axis`` method replace the MultiIndex with ``point_id``
+    # ``premium_table_array()`` holds the premium rates in a 2D array
+    # indexed by issue age and policy term. The rates for all the
+    # model points are picked up at once by :func:`table_lookup` with
+    # the issue ages and the policy terms.
+    # Pairs not in :attr:`premium_table` result in NaN.
 
-    mi = pd.MultiIndex.from_arrays([age_at_entry(), policy_term()])
-    prem_rates = premium_table.reindex(mi).set_axis(
-        model_point().index, inplace=False)
+    x, n = age_at_entry().to_numpy(), policy_term().to_numpy()
+    prem_rates = pd.Series(
+        table_lookup()(premium_table_array(), x, n, fill=np.nan),
+        index=model_point().index)
     return np.around(sum_assured() * prem_rates, 2)
 
 
+def premium_table_array():
+    """Premium rate table as a 2D array
+
+    Returns the premium rates in :attr:`premium_table` as a 2D numpy array
+    whose row indices are issue ages and column indices are policy terms,
+    so that the rate for issue age ``x`` and policy term ``n`` is
+    ``premium_table_array()[x, n]``.
+    Elements for the pairs not in :attr:`premium_table` are filled with NaN.
+
+    .. seealso::
+
+       * :attr:`premium_table`
+       * :func:`premium_pp`
+
+    """
+    ages = premium_table.index.get_level_values(0).to_numpy()
+    terms = premium_table.index.get_level_values(1).to_numpy()
+
+    result = np.full((ages.max() + 1, terms.max() + 1), np.nan)
+    result[ages, terms] = premium_table.to_numpy()
+    return result
+
+
 def premiums(t):
     """Premium income
 
@@ -914,6 +968,134 @@ def result_pv():
     return pd.DataFrame(data, index=model_point().index)
 
 
+def result_pv_sens(lapse_rate_mults, mort_rate_mults):
+    """Result table of present values for a grid of sensitivities
+
+    Returns the present values of the cashflows for all the combinations
+    of the elements in ``lapse_rate_mults`` and ``mort_rate_mults``
+    in one DataFrame. The DataFrame has the same columns
+    as :func:`result_pv`, and is indexed with
+    ``lapse_rate_mult``, ``mort_rate_mult`` and the index of
+    :func:`model_point`.
+    The values are the same as those of :func:`result_pv`
+    in the dynamic spaces, such as ``Projection[1.5, 1]``, up to
+    floating-point rounding, but all the combinations
+    are calculated at once by :func:`sens_sweep`
+    without creating the dynamic spaces.
+
+    ``lapse_rate_mults`` and ``mort_rate_mults`` must be tuples,
+    as the arguments of Cells must be hashable::
+
+        >>> Projection.result_pv_sens((0.5, 1, 1.5), (0.9, 1, 1.1))
+
+    .. seealso::
+
+       * :func:`result_pv`
+       * :func:`sens_sweep`
+
+    """
+    pv = sens_sweep(lapse_rate_mults, mort_rate_mults)
+
+    index = pd.MultiIndex.from_product(
+        [lapse_rate_mults, mort_rate_mults, model_point().index],
+        names=["lapse_rate_mult", "mort_rate_mult", model_point().index.name])
+
+    data = {
+        "pv_premiums": pv["premiums"].ravel(),
+        "pv_claims": pv["claims"].ravel(),
+        "pv_expenses": pv["expenses"].ravel(),
+        "pv_commissions": pv["commissions"].ravel(),
+        "pv_net_cf": (pv["premiums"] - pv["claims"]
+                      - pv["expenses"] - pv["commissions"]).ravel()
+    }
+
+    return pd.DataFrame(data, index=index)
+
+
+def sens_sweep(lapse_rate_mults, mort_rate_mults):
+    """Present values for a grid of sensitivities by one forward sweep
+
+    Projects the numbers of policies and the cashflows
+    for all the combinations of the elements in ``lapse_rate_mults``
+    and ``mort_rate_mults`` at once, by adding to the model points
+    the axis of the combinations. The combinations are ordered
+    as in :func:`itertools.product`, i.e. the elements of
+    ``mort_rate_mults`` vary fastest.
+
+    The projection is rolled forward from ``t=0``
+    to :func:`max_proj_len` - 1, and only the values at the current ``t``
+    and the accumulated present values are kept.
+    The formulas are the vectorized counterparts of
+    :func:`mort_rate`, :func:`lapse_rate`, :func:`pols_if_at`
+    and the Cells of the cashflows.
+
+    Returns a dict of 2D arrays of the present values
+    keyed with ``"premiums"``, ``"claims"``, ``"expenses"`` and
+    ``"commissions"``. The first axis of the arrays is
+    the combinations of the multipliers
+    and the second axis is model points.
+
+    .. seealso::
+
+       * :func:`result_pv_sens`
+
+    """
+    t_len = max_proj_len()
+    disc = disc_factors()[:t_len]
+    lookup = table_lookup()
+    table = mort_table_array()
+
+    lapse_mult = np.repeat(lapse_rate_mults, len(mort_rate_mults))
+    mort_mult = np.tile(mort_rate_mults, len(lapse_rate_mults))
+    lapse_mult, mort_mult = lapse_mult[:, np.newaxis], mort_mult[:, np.newaxis]
+
+    dur_mth_init = duration_mth(0).values
+    entry_age = age_at_entry().values
+    term_mth = policy_term().values * 12
+    pols_nb = model_point()['policy_count'].values
+    prem_pp = premium_pp().values
+    claim = sum_assured().values
+
+    names = ["premiums", "claims", "expenses", "commissions"]
+    shape = (len(lapse_mult), len(entry_age))
+    pv = {name: np.zeros(shape) for name in names}
+
+    bef_mat = np.tile(pols_if_init().values, (shape[0], 1))
+
+    for t in range(t_len):
+
+        dur_mth = dur_mth_init + t
+        dur = dur_mth // 12
+
+        mort = lookup(table, entry_age + dur, np.minimum(dur, 5))
+
+        mort_mth = 1-(1- mort_mult * mort)**(1/12)
+        lapse_ann = lapse_mult * np.maximum(0.2 - 0.02 * dur, 0.02)
+        lapse_mth = 1-(1 - lapse_ann)**(1/12)
+
+        maturity = (dur_mth == term_mth) * bef_mat
+        bef_nb = bef_mat - maturity
+        new_biz = np.where(dur_mth == 0, pols_nb, 0)
+        bef_decr = bef_nb + new_biz
+        death = bef_decr * mort_mth
+        lapse = (bef_decr - death) * lapse_mth
+
+        prems = prem_pp * bef_decr
+        values = {
+            "premiums": prems,
+            "claims": claim * death,
+            "expenses": (expense_acq() * new_biz
+                         + bef_decr * expense_maint()/12 * inflation_factor(t)),
+            "commissions": (dur == 0) * prems
+        }
+        for name in names:
+            pv[name] += values[name] * disc[t]
+
+        bef_mat = bef_decr - lapse - death
+
+    return pv
+
+
 def sex():
     """The sex of the model points
 
@@ -935,6 +1117,31 @@ def sum_assured():
     return model_point()["sum_assured"]
 
 
+def table_lookup():
+    """Function to look up 2D tables by pairs of indices
+
+    Returns a function ``lookup(table, x, d, fill=0)`` that takes
+    a 2D numpy array ``table`` and two integer numpy arrays
+    ``x`` and ``d`` of the same shape, and returns
+    the elements ``table[x, d]`` as an array of the same shape.
+    The elements for the pairs of indices out of ``table``,
+    such as negative durations of future new business, are ``fill``.
+
+    The function is shared by :func:`mort_rate`, :func:`premium_pp`
+    and :func:`sens_sweep`.
+    A function is returned in place of taking the arrays as
+    the parameters of this Cells, as the parameters of Cells
+    must be hashable.
+    """
+    def lookup(table, x, d, fill=0):
+        in_table = ((0 <= x) & (x < table.shape[0])
+                    & (0 <= d) & (d < table.shape[1]))
+        values = table[np.where(in_table, x, 0), np.where(in_table, d, 0)]
+        return np.where(in_table, values, fill)
+
+    return lookup
+
+
 def net_cf_annual():
     data = {}
     for m in range(0, max_proj_len(), 12):
@@ -11,6 +11,10 @@ Attributes:
 
     scen_size: Number of scenarios. 1000 by default.
 
+    scen_offset: Number of scenarios to skip. 0 by default.
+        The scenarios from ``scen_offset`` to ``scen_offset + scen_size - 1``
+        counting from 0 are generated. See :meth:`std_norm_rand`.
+
     np: numpy module.
 
     step_size: Number of time steps. 360 by default.
@@ -375,16 +379,21 @@ def std_norm_rand(seed=1234):
 
     Returns a numpy array shaped :attr:`scen_size` x :attr:`step_size`.
     The elements are random numbers drawn from the standard normal distribution.
-    """
-
-    size = (scen_size, step_size)
 
-    if hasattr(np.random, 'default_rng'):
-        gen = np.random.default_rng(seed)
-        return gen.standard_normal(size)
-    else:
-        np.random.seed(seed)
-        return np.random.standard_normal(size)
+    The numbers of the ``i``-th row are drawn from its own stream,
+    the generator seeded by
+    ``SeedSequence(seed, spawn_key=(scen_offset + i,))``,
+    the same as the ``(scen_offset + i)``-th child of
+    ``SeedSequence(seed).spawn``.
+    The numbers of each scenario are therefore the same
+    regardless of :attr:`scen_offset` and :attr:`scen_size`, and
+    subsets of the scenarios can be generated in separate processes.
+    """
+    return np.array([
+        np.random.default_rng(
+            np.random.SeedSequence(seed, spawn_key=(scen_offset + i,))
+        ).standard_normal(step_size)
+        for i in range(scen_size)])
 
 
 t_ = lambda i: i * time_len / step_size
@@ -423,4 +432,6 @@ seed1 = 1234
 
 seed2 = 5678
 
-scen_size = 1000
\ No newline at end of file
+scen_size = 1000
+
+scen_offset = 0
\ No newline at end of file
@@ -193,6 +193,32 @@ Attributes:
             C              LEVEL            False            NaN            0.10   True
             D              LEVEL             True         type_3            0.05   True
 
+    engine: A string to select how the projection is carried out.
+        ``"cells"`` by default.
+
+        When ``"cells"`` is assigned, the values of the Cells
+        such as :func:`pols_if_at`, :func:`av_pp_at` and :func:`claims`
+        are calculated and kept for all ``t``,
+        and the Cells whose names start with ``pv_`` and ``result_``
+        read the values through :func:`pv_array` and :func:`proj_total`.
+
+        When ``"stream"`` is assigned, :func:`pv_array` and
+        :func:`proj_total` read the present values and
+        the totals over the model points from :func:`stream_sweep`,
+        which rolls the projection forward step by step and keeps only
+        the values at the current ``t`` and the accumulated results.
+        The memory required is proportional to the number of model points
+        regardless of the projection length.
+        The results are the same as the ``"cells"`` mode
+        up to floating-point rounding::
+
+            >>> Projection.engine = "stream"
+
+        .. seealso::
+
+           * :func:`pv_array`
+           * :func:`proj_total`
+           * :func:`stream_sweep`
 
     np: The `numpy`_ module.
     pd: The `pandas`_ module.
@@ -676,15 +702,54 @@ def coi_rate(t):
 
     The cost of insuranc rate per account value per month.
     By default, it is set to 1.1 times the monthly mortality rate.
+    The formula is defined by :func:`coi_rate_func`.
 
     .. seealso::
 
         * :func:`mort_rate_mth`
         * :func:`coi_pp`
+        * :func:`coi_rate_func`
+
+    """
+    return coi_rate_func()(mort_rate_mth(t))
+
+
+def coi_rate_func():
+    """Function to calculate cost of insurance rates
+
+    Returns a function that takes monthly mortality rates
+    as a numpy array or Series and returns the cost of insurance rates
+    per month for them.
+    By default, the rates are 1.1 times the monthly mortality rates.
+
+    The function is used by :func:`coi_rate` and :func:`stream_sweep`,
+    so changes to the function are reflected in all the engines.
+
+    .. seealso::
+
         * :func:`coi_rate`
 
     """
-    return 1.1 * mort_rate_mth(t)
+    return lambda mort_mth: 1.1 * mort_mth
+
+
+def commission_rate_func():
+    """Function to calculate commission rates from durations
+
+    Returns a function that takes durations as an integer numpy array
+    or Series and returns the commission rates per premium for them
+    as a numpy array.
+    By default, the rate is 5% for all durations.
+
+    The function is used by :func:`commissions` and :func:`stream_sweep`,
+    so changes to the function are reflected in all the engines.
+
+    .. seealso::
+
+        * :func:`commissions`
+
+    """
+    return lambda dur: np.full(np.shape(dur), 0.05)
 
 
 def commissions(t):
@@ -696,9 +761,10 @@ def commissions(t):
 
         * :func:`premiums`
         * :func:`duration`
+        * :func:`commission_rate_func`
 
     """
-    return 0.05 * premiums(t)
+    return commission_rate_func()(duration(t)) * premiums(t)
 
 
 def disc_factors():
@@ -947,12 +1013,35 @@ def lapse_rate(t):
 
         max(0.1 - 0.02 * duration(t), 0.02)
 
+    The formula is defined by :func:`lapse_rate_func`.
+
     .. seealso::
 
-        :func:`duration`
+        * :func:`duration`
+        * :func:`lapse_rate_func`
 
     """
-    return np.maximum(0.1 - 0.02 * duration(t), 0.02)
+    return lapse_rate_func()(duration(t))
+
+
+def lapse_rate_func():
+    """Function to calculate lapse rates from durations
+
+    Returns a function that takes durations as an integer numpy array
+    or Series and returns the annual lapse rates for them.
+    By default, the lapse rate assumption is defined by duration as::
+
+        max(0.1 - 0.02 * duration, 0.02)
+
+    The function is used by :func:`lapse_rate` and :func:`stream_sweep`,
+    so changes to the function are reflected in all the engines.
+
+    .. seealso::
+
+        * :func:`lapse_rate`
+
+    """
+    return lambda dur: np.maximum(0.1 - 0.02 * dur, 0.02)
 
 
 def load_prem_rate():
@@ -1133,22 +1222,42 @@ def mort_rate(t):
 
     .. seealso::
 
-       * :func:`mort_table_reindexed`
+       * :func:`mort_rate_func`
        * :func:`mort_rate_mth`
        * :func:`model_point`
 
     """
 
-    # mi is a MultiIndex whose values are
-    # pairs of age at t and duration at t capped at 5 for all the model points.
+    # The rates for all the model points are calculated at once
+    # by :func:`mort_rate_func` from the ages and the durations at t.
+
+    x, d = age(t).to_numpy(), duration(t).to_numpy()
+    return pd.Series(mort_rate_func()(x, d), index=model_point().index)
 
-    # ``mort_table_reindexed().reindex(mi, fill_value=0)`` returns
-    # a Series of mortality rates whose indexes match the MultiIndex values.
-    # The ``set_axis`` method replace the MultiIndex with ``point_id``
 
-    mi = pd.MultiIndex.from_arrays([age(t), np.minimum(duration(t), 5)])
-    return mort_table_reindexed().reindex(
-        mi, fill_value=0).set_axis(model_point().index)
+def mort_rate_func():
+    """Function to calculate mortality rates from ages and durations
+
+    Returns a function that takes ages and durations as
+    integer numpy arrays of the same shape and returns
+    the annual mortality rates for them.
+    By default, the rates are looked up from :func:`mort_table_array`
+    by :func:`table_lookup` with the ages and the durations capped at 5.
+    Ages and durations out of the table, such as negative durations
+    of future new business, result in 0.
+
+    The function is used by :func:`mort_rate` and :func:`stream_sweep`,
+    so changes to the function are reflected in all the engines.
+
+    .. seealso::
+
+        * :func:`mort_rate`
+        * :func:`mort_table_array`
+        * :func:`table_lookup`
+
+    """
+    lookup, table = table_lookup(), mort_table_array()
+    return lambda x, dur: lookup(table, x, np.minimum(dur, 5))
 
 
 def mort_rate_mth(t):
@@ -1163,6 +1272,29 @@ def mort_rate_mth(t):
     return 1-(1- mort_rate(t))**(1/12)
 
 
+def mort_table_array():
+    """Mortality table as a 2D array
+
+    Returns the mortality rates in :attr:`mort_table` as a 2D numpy array
+    whose row indices are ages and column indices are durations,
+    so that the rate for age ``x`` and duration ``d`` is
+    ``mort_table_array()[x, d]``.
+    Rows for the ages not in :attr:`mort_table` are filled with 0.
+
+    .. seealso::
+
+       * :attr:`mort_table`
+       * :func:`mort_rate`
+
+    """
+    ages = mort_table.index.to_numpy()
+    durs = mort_table.columns.astype(int).to_numpy()
+
+    result = np.zeros((ages.max() + 1, durs.max() + 1))
+    result[np.ix_(ages, durs)] = mort_table.to_numpy()
+    return result
+
+
 def mort_table_last_age():
     """The last age of mortality tables
 
@@ -1185,6 +1317,10 @@ def mort_table_last_age():
 def mort_table_reindexed():
     """MultiIndexed mortality table
 
+    .. note::
+       This cells is not used by default.
+       :func:`mort_rate` uses :func:`mort_table_array` instead.
+
     Returns a Series of mortlity rates reshaped from :attr:`mort_table`.
     The returned Series is indexed by age and duration capped at 5.
 
@@ -1490,6 +1626,41 @@ def proj_len():
     return np.maximum(12 * policy_term() - duration_mth(0) + 1, 0)
 
 
+def pv_array(name, arg=None):
+    """Present values of a Cells for all model points
+
+    Returns a 1D numpy array of the present values of the Cells
+    specified by ``name``, such as ``"premiums"``, by model point.
+    ``arg`` is passed to the Cells as the second argument if given,
+    such as ``pv_array("claims", "DEATH")``.
+
+    If :attr:`engine` is ``"cells"``, the present values are calculated
+    by multiplying the values of the Cells for all ``t``
+    by :func:`disc_factors`.
+    If :attr:`engine` is ``"stream"``, the present values are read from
+    :func:`stream_sweep`.
+
+    .. seealso::
+
+        * :attr:`engine`
+        * :func:`stream_sweep`
+        * :func:`disc_factors`
+
+    """
+    if engine == "cells":
+        args = () if arg is None else (arg,)
+        cells = getattr(_space, name)
+        result = np.array(list(cells(t, *args) for t in range(max_proj_len()))).transpose()
+        return result @ disc_factors()[:max_proj_len()]
+
+    elif engine == "stream":
+        result = stream_sweep()["pv"][name]
+        return result[arg] if isinstance(result, dict) else result
+
+    else:
+        raise ValueError("invalid engine")
+
+
 def pv_av_change():
     """Present value of change in account value
 
@@ -1500,9 +1671,7 @@ def pv_av_change():
         * :func:`proj_len`
 
     """
-    result = np.array(list(av_change(t) for t in range(max_proj_len()))).transpose()
-
-    return result @ disc_factors()[:max_proj_len()]
+    return pv_array("av_change")
 
 
 def pv_claims(kind=None):
@@ -1518,9 +1687,7 @@ def pv_claims(kind=None):
 
 
     """
-    cl = np.array(list(claims(t, kind) for t in range(max_proj_len()))).transpose()
-
-    return cl @ disc_factors()[:max_proj_len()]
+    return pv_array("claims", kind)
 
 
 def pv_commissions():
@@ -1533,9 +1700,7 @@ def pv_commissions():
         * :func:`disc_factors`
 
     """
-    result = np.array(list(commissions(t) for t in range(max_proj_len()))).transpose()
-
-    return result @ disc_factors()[:max_proj_len()]
+    return pv_array("commissions")
 
 
 def pv_expenses():
@@ -1548,9 +1713,7 @@ def pv_expenses():
         * :func:`disc_factors`
 
     """
-    result = np.array(list(expenses(t) for t in range(max_proj_len()))).transpose()
-
-    return result @ disc_factors()[:max_proj_len()]
+    return pv_array("expenses")
 
 
 def pv_inv_income():
@@ -1565,9 +1728,7 @@ def pv_inv_income():
         * :func:`disc_factors`
 
     """
-    result = np.array(list(inv_income(t) for t in range(max_proj_len()))).transpose()
-
-    return result @ disc_factors()[:max_proj_len()]
+    return pv_array("inv_income")
 
 
 def pv_net_cf():
@@ -1604,9 +1765,7 @@ def pv_pols_if():
     It is used as the annuity factor for calculating :func:`net_premium_pp`.
 
     """
-    result = np.array(list(pols_if_at(t, "BEF_DECR") for t in range(max_proj_len()))).transpose()
-
-    return result @ disc_factors()[:max_proj_len()]
+    return pv_array("pols_if_at", "BEF_DECR")
 
 
 def pv_premiums():
@@ -1619,9 +1778,37 @@ def pv_premiums():
         * :func:`disc_factors`
 
     """
-    result = np.array(list(premiums(t) for t in range(max_proj_len()))).transpose()
+    return pv_array("premiums")
+
 
-    return result @ disc_factors()[:max_proj_len()]
+def proj_total(name):
+    """Totals of a Cells over all model points by ``t``
+
+    Returns a list of the sums of the values of the Cells
+    specified by ``name`` over all the model points
+    for ``t`` from 0 to :func:`max_proj_len` - 1.
+
+    If :attr:`engine` is ``"cells"``, the totals are calculated
+    from the values of the Cells.
+    If :attr:`engine` is ``"stream"``, the totals are read from
+    :func:`stream_sweep`.
+
+    .. seealso::
+
+        * :attr:`engine`
+        * :func:`result_cf`
+        * :func:`result_pols`
+
+    """
+    if engine == "cells":
+        cells = getattr(_space, name)
+        return [sum(cells(t)) for t in range(max_proj_len())]
+
+    elif engine == "stream":
+        return stream_sweep()["total"][name]
+
+    else:
+        raise ValueError("invalid engine")
 
 
 def result_cf():
@@ -1640,11 +1827,11 @@ def result_cf():
     t_len = range(max_proj_len())
 
     data = {
-        "Premiums": [sum(premiums(t)) for t in t_len],
-        "Claims": [sum(claims(t)) for t in t_len],
-        "Expenses": [sum(expenses(t)) for t in t_len],
-        "Commissions": [sum(commissions(t)) for t in t_len],
-        "Net Cashflow": [sum(net_cf(t)) for t in t_len]
+        "Premiums": proj_total("premiums"),
+        "Claims": proj_total("claims"),
+        "Expenses": proj_total("expenses"),
+        "Commissions": proj_total("commissions"),
+        "Net Cashflow": proj_total("net_cf")
     }
 
     return pd.DataFrame(data, index=t_len)
@@ -1666,11 +1853,11 @@ def result_pols():
     t_len = range(max_proj_len())
 
     data = {
-        "pols_if": [sum(pols_if(t)) for t in t_len],
-        "pols_maturity": [sum(pols_maturity(t)) for t in t_len],
-        "pols_new_biz": [sum(pols_new_biz(t)) for t in t_len],
-        "pols_death": [sum(pols_death(t)) for t in t_len],
-        "pols_lapse": [sum(pols_lapse(t)) for t in t_len]
+        "pols_if": proj_total("pols_if"),
+        "pols_maturity": proj_total("pols_maturity"),
+        "pols_new_biz": proj_total("pols_new_biz"),
+        "pols_death": proj_total("pols_death"),
+        "pols_lapse": proj_total("pols_lapse")
     }
 
     return pd.DataFrame(data, index=t_len)
@@ -1716,6 +1903,171 @@ def sex():
     return model_point()["sex"]
 
 
+def stream_sweep():
+    """Present values and totals of all the model points by one forward sweep
+
+    Rolls the numbers of policies and the account values
+    of all the model points forward from ``t=0``
+    to :func:`max_proj_len` - 1, and at each ``t``,
+    accumulates the present values of the cashflows by model point
+    and the totals of the cashflows and the numbers of policies
+    over the model points.
+    Only the values at the current ``t`` are kept during the sweep,
+    so the memory required does not grow with the projection length.
+
+    The formulas are the vectorized counterparts of
+    :func:`pols_if_at`, :func:`av_pp_at`, :func:`claims`,
+    :func:`inv_income`, :func:`av_change` and the other Cells
+    they refer to, and produce the same values.
+    Changes to the formulas of those Cells are not reflected in
+    this Cells, except for :func:`inv_return_mth`,
+    :func:`inflation_factor`, :func:`expense_acq`, :func:`expense_maint`
+    and :func:`maint_fee_rate`, which are called from this Cells, and
+    the assumptions calculated by :func:`mort_rate_func`,
+    :func:`lapse_rate_func`, :func:`coi_rate_func` and
+    :func:`commission_rate_func`, which are shared with the Cells.
+
+    Returns a dict with the two keys, ``"pv"`` and ``"total"``.
+    The value for ``"pv"`` is a dict of 1D arrays of the present values
+    by model point keyed with the names of the Cells, such as
+    ``"premiums"``. The values for ``"claims"`` and ``"pols_if_at"``
+    are dicts keyed with the second arguments to the Cells.
+    The value for ``"total"`` is a dict of lists
+    of the totals by ``t`` keyed with the names of the Cells.
+
+    This Cells is used by :func:`pv_array` and :func:`proj_total`
+    only when ``"stream"`` is assigned to :attr:`engine`.
+
+    .. seealso::
+
+        * :attr:`engine`
+        * :func:`pv_array`
+        * :func:`proj_total`
+
+    """
+    t_len = max_proj_len()
+    disc = disc_factors()[:t_len]
+    size = len(model_point())
+
+    dur_mth_init = duration_mth(0).values
+    entry_age = age_at_entry().values
+    term_mth = policy_term().values * 12
+    pols_nb = model_point()['policy_count'].values
+    sum_assured_ = sum_assured().values
+    prem_pp = model_point()['premium_pp'].values
+    is_single = (premium_type() == 'SINGLE').values
+    is_level = (premium_type() == 'LEVEL').values
+    load_rate = load_prem_rate().values
+
+    # Surrender charge rates indexed by the position of surr_charge_id
+    # in the columns of surr_charge_table and duration.
+    # The position is -1 for the model points without surrender charge.
+    surr_table = np.zeros((len(surr_charge_table.columns),
+                           surr_charge_table.index.max() + 1))
+    surr_table[:, surr_charge_table.index] = surr_charge_table.to_numpy().T
+    surr_id = np.where(
+        has_surr_charge().values.astype(bool),
+        surr_charge_table.columns.get_indexer(surr_charge_id()), -1)
+
+    lookup = table_lookup()
+    mort_rate_ = mort_rate_func()
+    lapse_rate_ = lapse_rate_func()
+    coi_rate_ = coi_rate_func()
+    comm_rate = commission_rate_func()
+
+    totals = ["pols_if", "pols_maturity", "pols_new_biz", "pols_death",
+              "pols_lapse", "premiums", "claims", "expenses", "commissions",
+              "net_cf"]
+    total = {name: [] for name in totals}
+
+    pv = {name: np.zeros(size) for name in [
+        "premiums", "expenses", "commissions", "inv_income", "av_change"]}
+    pv["claims"] = {kind: np.zeros(size)
+                    for kind in [None, "DEATH", "LAPSE", "MATURITY"]}
+    pv["pols_if_at"] = {timing: np.zeros(size)
+                        for timing in ["BEF_MAT", "BEF_NB", "BEF_DECR"]}
+
+    bef_mat = pols_if_init().values     # pols_if_at(t, "BEF_MAT")
+    av_pp = av_pp_init().values         # av_pp_at(t, "BEF_PREM")
+
+    for t in range(t_len):
+
+        dur_mth = dur_mth_init + t
+        dur = dur_mth // 12
+
+        mort_mth = 1-(1- mort_rate_(entry_age + dur, dur))**(1/12)
+        lapse_mth = 1-(1 - lapse_rate_(dur))**(1/12)
+        surr_rate = lookup(
+            surr_table, surr_id, np.minimum(dur, surr_charge_max_idx()))
+
+        # Number of policies
+        maturity = (dur_mth == term_mth) * bef_mat
+        bef_nb = bef_mat - maturity
+        new_biz = np.where(dur_mth == 0, pols_nb, 0)
+        bef_decr = bef_nb + new_biz
+        death = bef_decr * mort_mth
+        lapse = (bef_decr - death) * lapse_mth
+        next_bef_mat = bef_decr - lapse - death
+
+        # Account value per policy
+        prem = (np.where(is_single & (dur_mth == 0), prem_pp, 0)
+                + np.where(is_level & (dur_mth < term_mth), prem_pp, 0))
+        av_pp_bef_fee = av_pp + (1 - load_rate) * prem
+        coi = coi_rate_(mort_mth) * np.maximum(sum_assured_ - av_pp_bef_fee, 0)
+        av_pp_bef_inv = (av_pp_bef_fee
+                         - maint_fee_rate() * av_pp_bef_fee - coi)
+        inv_income_pp_ = inv_return_mth(t) * av_pp_bef_inv
+        av_pp_mid = av_pp_bef_inv + 0.5 * inv_income_pp_
+        next_av_pp = av_pp_bef_inv + inv_income_pp_
+
+        # Cashflows
+        prems = prem * bef_decr
+        clms = {
+            "DEATH": np.maximum(sum_assured_, av_pp_mid) * death,
+            "LAPSE": av_pp_mid * lapse - surr_rate * av_pp_mid * lapse,
+            "MATURITY": av_pp * maturity
+        }
+        clms[None] = clms["DEATH"] + clms["LAPSE"] + clms["MATURITY"]
+        exps = (expense_acq() * new_biz
+                + bef_decr * expense_maint()/12 * inflation_factor(t))
+        comms = comm_rate(dur) * prems
+        inv_inc = (inv_income_pp_ * next_bef_mat
+                   + 0.5 * inv_income_pp_ * (death + lapse))
+        av_chg = next_av_pp * next_bef_mat - av_pp * bef_mat
+
+        values = {
+            "premiums": prems,
+            "expenses": exps,
+            "commissions": comms,
+            "inv_income": inv_inc,
+            "av_change": av_chg
+        }
+        for name, value in values.items():
+            pv[name] += value * disc[t]
+        for kind, value in clms.items():
+            pv["claims"][kind] += value * disc[t]
+        for timing, value in zip(["BEF_MAT", "BEF_NB", "BEF_DECR"],
+                                 [bef_mat, bef_nb, bef_decr]):
+            pv["pols_if_at"][timing] += value * disc[t]
+
+        values.update({
+            "pols_if": bef_mat,
+            "pols_maturity": maturity,
+            "pols_new_biz": new_biz,
+            "pols_death": death,
+            "pols_lapse": lapse,
+            "claims": clms[None],
+            "net_cf": prems + inv_inc - clms[None] - exps - comms - av_chg
+        })
+        for name in totals:
+            total[name].append(values[name].sum())
+
+        bef_mat = next_bef_mat
+        av_pp = next_av_pp
+
+    return {"pv": pv, "total": total}
+
+
 def sum_assured():
     """The sum assured of the model points
 
@@ -1810,6 +2162,30 @@ def surr_charge_table_stacked():
     return surr_charge_table.stack().reorder_levels([1, 0]).sort_index()
 
 
+def table_lookup():
+    """Function to look up 2D tables by pairs of indices
+
+    Returns a function ``lookup(table, x, d, fill=0)`` that takes
+    a 2D numpy array ``table`` and two integer numpy arrays
+    ``x`` and ``d`` of the same shape, and returns
+    the elements ``table[x, d]`` as an array of the same shape.
+    The elements for the pairs of indices out of ``table``,
+    such as negative durations of future new business, are ``fill``.
+
+    The function is shared by :func:`mort_rate_func` and :func:`stream_sweep`.
+    A function is returned in place of taking the arrays as
+    the parameters of this Cells, as the parameters of Cells
+    must be hashable.
+    """
+    def lookup(table, x, d, fill=0):
+        in_table = ((0 <= x) & (x < table.shape[0])
+                    & (0 <= d) & (d < table.shape[1]))
+        values = table[np.where(in_table, x, 0), np.where(in_table, d, 0)]
+        return np.where(in_table, values, fill)
+
+    return lookup
+
+
 # ---------------------------------------------------------------------------
 # References
 
@@ -1833,4 +2209,6 @@ scen_id = 1
 
 model_point_10000 = ("DataClient", 1882837472592)
 
-model_point_table = ("DataClient", 1882838121440)
\ No newline at end of file
+model_point_table = ("DataClient", 1882838121440)
+
+engine = "cells"
\ No newline at end of file
@@ -161,6 +161,39 @@ Attributes:
         :attr:`scen_id` is referenced in by :func:`inv_return_mth`
         as one of the keys to select a scenario from :attr:`std_norm_rand`.
 
+    scen_size: The number of scenarios to run
+
+        10000 by default. The scenarios from ``scen_offset + 1`` to
+        ``scen_offset + scen_size`` are run. See :func:`scen_index`.
+
+    scen_offset: The number of scenarios to skip
+
+        0 by default. Scenarios can be run in subsets by changing
+        :attr:`scen_offset` and :attr:`scen_size`, as
+        the random numbers of each scenario do not depend on the others.
+        See :func:`std_norm_rand`.
+
+    scen_method: The method to generate the random numbers
+
+        ``"plain"`` by default. ``"antithetic"`` for antithetic pairs of
+        scenarios, or ``"sobol"`` for scrambled Sobol points
+        with the Brownian bridge. See :func:`std_norm_rand`.
+
+    sobol_size: The number of Sobol points in a block
+
+        256 by default. Used only when :attr:`scen_method` is ``"sobol"``.
+        A power of 2 keeps the balance properties of the Sobol points.
+        See :func:`sobol_rand`.
+
+    sobol_dim: The number of dimensions of the Sobol points
+
+        242 by default. Used only when :attr:`scen_method` is ``"sobol"``.
+        The Brownian bridge is constructed over :attr:`sobol_dim` steps
+        regardless of the model points, so that the random numbers of
+        a scenario do not depend on the model points run with it.
+        Must not be less than :func:`max_proj_len_ext`.
+        See :func:`sobol_rand`.
+
     surr_charge_table: Surrender charge rates by duration
 
         A DataFrame of multiple patterns of surrender charge rates by duration.
@@ -193,6 +226,37 @@ Attributes:
             C              LEVEL            False            NaN            0.10   True
             D              LEVEL             True         type_3            0.05   True
 
+    engine: A string to select how the projection is carried out.
+        ``"cells"`` by default.
+
+        When ``"cells"`` is assigned, :func:`model_point` repeats
+        each model point for all the scenarios, and
+        the values of the Cells such as :func:`pols_if_at`
+        and :func:`av_pp_at` are calculated and kept for all ``t``
+        and all the pairs of model points and scenarios.
+        The Cells whose names start with ``pv_`` read
+        the values through :func:`pv_array`.
+
+        When ``"broadcast"`` is assigned, :func:`pv_array`
+        reads the present values from :func:`broadcast_sweep`,
+        which keeps the model point attributes by model point and
+        the investment returns by scenario, and broadcasts them
+        to model points by scenarios only where the values depend on both,
+        such as the account values.
+        Only the values at the current ``t`` and the accumulated
+        present values are kept, and :func:`model_point` is not calculated,
+        so the memory required is a fraction of that in the
+        ``"cells"`` mode.
+        The results are the same as the ``"cells"`` mode
+        up to floating-point rounding::
+
+            >>> Projection.engine = "broadcast"
+
+        .. seealso::
+
+           * :func:`pv_array`
+           * :func:`broadcast_sweep`
+           * :func:`model_point_index`
 
     np: The `numpy`_ module.
     pd: The `pandas`_ module.
@@ -407,6 +471,214 @@ def av_pp_init():
     return model_point()["av_pp_init"]
 
 
+def bridge_schedule(n):
+    """Construction order of the Brownian bridge over ``n`` steps
+
+    Returns a list of tuples of 3 integers ``(left, mid, right)``,
+    indicating that the value of the Brownian motion at step ``mid``
+    is interpolated from its values at steps ``left`` and ``right``.
+    The value at step ``n`` is constructed first, then
+    the midpoints are constructed breadth first,
+    so the earlier the random number is in the list,
+    the larger the part of the path it determines.
+    Used by :func:`sobol_rand`.
+
+    .. seealso::
+
+        * :func:`sobol_rand`
+    """
+    result = []
+    intervals = [(0, n)]
+    while intervals:
+        children = []
+        for left, right in intervals:
+            if right - left > 1:
+                mid = (left + right) // 2
+                result.append((left, mid, right))
+                children.extend([(left, mid), (mid, right)])
+        intervals = children
+
+    return result
+
+
+def broadcast_sweep():
+    """Present values by model point and scenario by one forward sweep
+
+    Rolls the numbers of policies and the account values
+    of all the model points in all the scenarios forward from ``t=0``
+    to :func:`max_proj_len` - 1, and at each ``t``,
+    accumulates the present values of the cashflows.
+
+    The model point attributes, such as the policy terms and
+    the premiums, are 1D arrays by model point
+    read from :func:`model_point_table_ext`,
+    and the investment returns from :func:`inv_return_mth`
+    are 1D arrays by scenario.
+    The numbers of policies are 2D arrays of
+    model points by scenarios only if the lapse rates depend on
+    the account values (i.e. if :func:`is_lapse_dynamic` is ``True``),
+    otherwise they are kept by model point.
+    The account values are 2D arrays of model points by scenarios.
+    Only the values at the current ``t`` are kept during the sweep.
+
+    The formulas are the vectorized counterparts of
+    :func:`pols_if_at`, :func:`av_pp_at`, :func:`claims`,
+    :func:`claims_from_av`, :func:`inv_income`, :func:`av_change`
+    and the other Cells they refer to, and produce the same values.
+    Changes to the formulas of those Cells are not reflected in
+    this Cells, except for :func:`inv_return_mth`,
+    :func:`inflation_factor`, :func:`expense_acq`, :func:`expense_maint`,
+    :func:`maint_fee_rate`, :func:`coi_rate` and the simulation
+    parameters such as :func:`has_lapse`, which are called from this Cells.
+
+    Returns a dict of the present values keyed with the names of the Cells,
+    such as ``"premiums"``. Each value is a 2D array whose
+    first axis is model points and second axis is scenarios,
+    or a 2D array of one column if the values are the same
+    in all the scenarios.
+    The values for ``"claims"``, ``"claims_from_av"``,
+    ``"claims_over_av"`` and ``"pols_if_at"``
+    are dicts keyed with the second arguments to the Cells.
+
+    This Cells is used by :func:`pv_array`
+    only when ``"broadcast"`` is assigned to :attr:`engine`.
+
+    .. seealso::
+
+        * :attr:`engine`
+        * :func:`pv_array`
+
+    """
+    mps = model_point_table_ext()
+    dur_mth_init = mps['duration_mth'].to_numpy()[:, None]
+    entry_age = mps['age_at_entry'].to_numpy()[:, None]
+    is_wl_ = mps['is_wl'].to_numpy()[:, None]
+    term_mth = (is_wl_ * (mort_table_last_age() - entry_age)
+                + (is_wl_ == False) * mps['policy_term'].to_numpy()[:, None]) * 12
+    pols_nb = mps['policy_count'].to_numpy()[:, None]
+    sum_assured_ = mps['sum_assured'].to_numpy()[:, None]
+    prem_pp = mps['premium_pp'].to_numpy()[:, None]
+    is_single = (mps['premium_type'] == 'SINGLE').to_numpy()[:, None]
+    is_level = (mps['premium_type'] == 'LEVEL').to_numpy()[:, None]
+    load_rate = mps['load_prem_rate'].to_numpy()[:, None]
+
+    t_len = max_proj_len_ext()
+    disc = np.array(list(
+        (1 + ((1 + disc_rate_ann[t//12])**(1/12) - 1))**(-t) for t in range(t_len)))
+
+    mort_table_ = mort_table_array()
+
+    # Surrender charge rates indexed by the position of surr_charge_id
+    # in the columns of surr_charge_table and duration.
+    # The position is -1 for the model points without surrender charge.
+    surr_table = np.zeros((len(surr_charge_table.columns),
+                           surr_charge_table.index.max() + 1))
+    surr_table[:, surr_charge_table.index] = surr_charge_table.to_numpy().T
+    surr_id = np.where(
+        mps['has_surr_charge'].to_numpy().astype(bool),
+        surr_charge_table.columns.get_indexer(mps['surr_charge_id']), -1)[:, None]
+
+    lookup = table_lookup()
+
+    kinds = ["DEATH", "LAPSE", "MATURITY"]
+    pv = {name: 0 for name in [
+        "premiums", "expenses", "commissions", "inv_income", "av_change",
+        "maint_fee"]}
+    pv["claims"] = {kind: 0 for kind in [None] + kinds}
+    pv["claims_from_av"] = {kind: 0 for kind in kinds}
+    pv["claims_over_av"] = {kind: 0 for kind in kinds}
+    pv["pols_if_at"] = {timing: 0 for timing in ["BEF_MAT", "BEF_NB", "BEF_DECR"]}
+
+    # pols_if_at(t, "BEF_MAT")
+    bef_mat = np.where(dur_mth_init > 0, pols_nb, 0)
+    # av_pp_at(t, "BEF_PREM")
+    av_pp = np.broadcast_to(
+        mps['av_pp_init'].to_numpy()[:, None], (len(mps), len(scen_index())))
+
+    for t in range(t_len):
+
+        dur_mth = dur_mth_init + t
+        dur = dur_mth // 12
+
+        if has_mortality():
+            mort = lookup(mort_table_, entry_age + dur, np.minimum(dur, 5))
+        else:
+            mort = np.zeros(dur.shape)
+        mort_mth = 1-(1- mort)**(1/12)
+        surr_rate = lookup(
+            surr_table, surr_id, np.minimum(dur, surr_charge_max_idx()))
+
+        # Account value per policy
+        prem = (np.where(is_single & (dur_mth == 0), prem_pp, 0)
+                + np.where(is_level & (dur_mth < term_mth), prem_pp, 0))
+        av_pp_bef_fee = av_pp + (1 - load_rate) * prem
+        maint_fee_pp_ = maint_fee_rate() * av_pp_bef_fee
+        coi_pp_ = coi_rate(t) * np.maximum(sum_assured_ - av_pp_bef_fee, 0)
+        av_pp_bef_inv = av_pp_bef_fee - maint_fee_pp_ - coi_pp_
+        inv_income_pp_ = inv_return_mth(t).to_numpy() * av_pp_bef_inv
+        av_pp_mid = av_pp_bef_inv + 0.5 * inv_income_pp_
+        next_av_pp = av_pp_bef_inv + inv_income_pp_
+
+        if has_lapse():
+            if is_lapse_dynamic():
+                factor = (1 - surr_rate) * av_pp_mid / sum_assured_
+            else:
+                factor = 1
+            lapse_rate_ = factor * np.maximum(0.1 - 0.01 * dur, 0.02)
+        else:
+            lapse_rate_ = np.zeros(dur.shape)
+
+        # Number of policies
+        maturity = (dur_mth == term_mth) * bef_mat
+        bef_nb = bef_mat - maturity
+        new_biz = np.where(dur_mth == 0, pols_nb, 0)
+        bef_decr = bef_nb + new_biz
+        death = bef_decr * mort_mth
+        lapse = (bef_decr - death) * (1-(1 - lapse_rate_)**(1/12))
+        next_bef_mat = bef_decr - lapse - death
+
+        # Cashflows
+        prems = prem * bef_decr
+        from_av = {
+            "DEATH": av_pp_mid * death,
+            "LAPSE": av_pp_mid * lapse,
+            "MATURITY": av_pp * maturity
+        }
+        clms = {
+            "DEATH": np.maximum(sum_assured_, av_pp_mid) * death,
+            "LAPSE": from_av["LAPSE"] - surr_rate * av_pp_mid * lapse,
+            "MATURITY": np.maximum(sum_assured_, av_pp) * maturity
+        }
+        values = {
+            "premiums": prems,
+            "expenses": (expense_acq() * new_biz
+                         + bef_decr * expense_maint()/12 * inflation_factor(t)),
+            "commissions": 0.05 * prems,
+            "inv_income": (inv_income_pp_ * next_bef_mat
+                           + 0.5 * inv_income_pp_ * (death + lapse)),
+            "av_change": next_av_pp * next_bef_mat - av_pp * bef_mat,
+            "maint_fee": maint_fee_pp_ * bef_decr
+        }
+        for name, value in values.items():
+            pv[name] = pv[name] + value * disc[t]
+        for kind in kinds:
+            pv["claims"][kind] = pv["claims"][kind] + clms[kind] * disc[t]
+            pv["claims_from_av"][kind] = (
+                pv["claims_from_av"][kind] + from_av[kind] * disc[t])
+            pv["claims_over_av"][kind] = (
+                pv["claims_over_av"][kind] + (clms[kind] - from_av[kind]) * disc[t])
+        pv["claims"][None] = pv["claims"][None] + (
+            clms["DEATH"] + clms["LAPSE"] + clms["MATURITY"]) * disc[t]
+        for timing, value in zip(["BEF_MAT", "BEF_NB", "BEF_DECR"],
+                                 [bef_mat, bef_nb, bef_decr]):
+            pv["pols_if_at"][timing] = pv["pols_if_at"][timing] + value * disc[t]
+
+        bef_mat = next_bef_mat
+        av_pp = next_av_pp
+
+    return pv
+
+
 def check_av_roll_fwd():
     """Check account value roll-forward
 
@@ -834,8 +1106,8 @@ def formula_option_put(t):
     mps = mps.loc[cond]
 
     T = t / 12
-    S = av_at(0, 'BEF_FEE')[:, 1][cond]
-    X = (sum_assured() * pols_maturity(t))[:, 1][cond]
+    S = av_at(0, 'BEF_FEE')[:, scen_index()[0]][cond]
+    X = (sum_assured() * pols_maturity(t))[:, scen_index()[0]][cond]
     sigma = 0.03
     r = 0.02
     q = 0.01
@@ -1141,6 +1413,29 @@ Defined as ``max(proj_len())``
     :func:`proj_len`
 """
 
+def max_proj_len_ext():
+    """The max of all projection lengths by model point
+
+    The same value as :attr:`max_proj_len`, calculated from
+    :func:`model_point_table_ext` by model point
+    instead of from :func:`proj_len` by model point and scenario.
+    Used by :func:`std_norm_rand` and :func:`broadcast_sweep`,
+    so that they do not need :func:`model_point`.
+
+    .. seealso::
+
+        * :attr:`max_proj_len`
+        * :func:`proj_len`
+    """
+    mps = model_point_table_ext()
+    is_wl_ = mps['is_wl'].to_numpy()
+    term_mth = (is_wl_ * (mort_table_last_age() - mps['age_at_entry'].to_numpy())
+                + (is_wl_ == False) * mps['policy_term'].to_numpy()) * 12
+
+    return int(np.maximum(
+        term_mth - mps['duration_mth'].to_numpy() + 1, 0).max())
+
+
 def model_point():
     """Target model points
 
@@ -1176,17 +1471,16 @@ def model_point():
     Be careful not to accidentally change the original table
     held in :func:`model_point_table_ext`.
 
+    Each model point is repeated for all the scenarios, and
+    the returned DataFrame is indexed with :func:`model_point_index`.
+
     .. seealso::
 
         * :func:`model_point_table_ext`
 
     """
     mps = model_point_table_ext()
-
-    idx = pd.MultiIndex.from_product(
-            [mps.index, scen_index()],
-            names = mps.index.names + scen_index().names
-            )
+    idx = model_point_index()
 
     res = pd.DataFrame(
             np.repeat(mps.values, len(scen_index()), axis=0),
@@ -1197,6 +1491,27 @@ def model_point():
     return res.astype(mps.dtypes)
 
 
+def model_point_index():
+    """Index of model points and scenarios
+
+    Returns a MultiIndex of all the pairs of
+    the model point IDs in :func:`model_point_table_ext`
+    and the scenario IDs in :func:`scen_index`.
+    The index of :func:`model_point` and the results such as
+    :func:`result_pv`.
+
+    .. seealso::
+
+        * :func:`model_point`
+        * :func:`scen_index`
+    """
+    mps = model_point_table_ext()
+    return pd.MultiIndex.from_product(
+            [mps.index, scen_index()],
+            names = mps.index.names + scen_index().names
+            )
+
+
 def model_point_table_ext():
     """Extended model point table
 
@@ -1226,7 +1541,7 @@ def monte_carlo():
          'GMxB Total': death + mat,
          'PV Fees': fee
          }, 
-        index=model_point().index).groupby(level='point_id').mean()
+        index=model_point_index()).groupby(level='point_id').mean()
 
     result['Coverage Ratio'] = result['PV Fees'] / result['GMxB Total']
 
@@ -1242,24 +1557,25 @@ def mort_rate(t):
 
     .. seealso::
 
-       * :func:`mort_table_reindexed`
+       * :func:`mort_table_array`
+       * :func:`table_lookup`
        * :func:`mort_rate_mth`
        * :func:`model_point`
 
     """
 
-    # mi is a MultiIndex whose values are
-    # pairs of age at t and duration at t capped at 5 for all the model points.
-
-    # ``mort_table_reindexed().reindex(mi, fill_value=0)`` returns
-    # a Series of mortality rates whose indexes match the MultiIndex values.
-    # The ``set_axis`` method replace the MultiIndex with ``point_id``
+    # ``mort_table_array()`` holds the mortality rates in a 2D array
+    # indexed by age and duration. The rates for all the model points
+    # are picked up at once by :func:`table_lookup` with
+    # the ages at t and the durations at t capped at 5.
+    # Ages and durations out of the table, such as negative durations
+    # of future new business, result in 0.
 
     if has_mortality():
 
-        mi = pd.MultiIndex.from_arrays([age(t), np.minimum(duration(t), 5)])
-        return mort_table_reindexed().reindex(
-            mi, fill_value=0).set_axis(model_point().index)
+        x, d = age(t).to_numpy(), np.minimum(duration(t), 5).to_numpy()
+        return pd.Series(table_lookup()(mort_table_array(), x, d),
+                         index=model_point().index)
 
     else:
         return pd.Series(0, index=model_point().index)
@@ -1277,6 +1593,29 @@ def mort_rate_mth(t):
     return 1-(1- mort_rate(t))**(1/12)
 
 
+def mort_table_array():
+    """Mortality table as a 2D array
+
+    Returns the mortality rates in :attr:`mort_table` as a 2D numpy array
+    whose row indices are ages and column indices are durations,
+    so that the rate for age ``x`` and duration ``d`` is
+    ``mort_table_array()[x, d]``.
+    Rows for the ages not in :attr:`mort_table` are filled with 0.
+
+    .. seealso::
+
+       * :attr:`mort_table`
+       * :func:`mort_rate`
+
+    """
+    ages = mort_table.index.to_numpy()
+    durs = mort_table.columns.astype(int).to_numpy()
+
+    result = np.zeros((ages.max() + 1, durs.max() + 1))
+    result[np.ix_(ages, durs)] = mort_table.to_numpy()
+    return result
+
+
 def mort_table_last_age():
     """The last age of mortality tables
 
@@ -1299,6 +1638,10 @@ def mort_table_last_age():
 def mort_table_reindexed():
     """MultiIndexed mortality table
 
+    .. note::
+       This cells is not used by default.
+       :func:`mort_rate` uses :func:`mort_table_array` instead.
+
     Returns a Series of mortlity rates reshaped from :attr:`mort_table`.
     The returned Series is indexed by age and duration capped at 5.
 
@@ -1346,6 +1689,71 @@ def net_cf(t):
             + inv_income(t) - claims(t) - expenses(t) - commissions(t) - av_change(t))
 
 
+def option_put_payoff():
+    """Discounted payoffs of the put options by scenario
+
+    The payoffs at maturity of the put options valued by
+    :func:`formula_option_put` for each model point, discounted at
+    the same rate of 2% as in :func:`formula_option_put`.
+    The price of the underlying asset at ``t`` is
+    the strike price ``S`` in :func:`formula_option_put` accumulated by
+    :func:`inv_return_mth` from 0 to ``t-1`` and reduced by
+    the dividend yield of 1% in :func:`formula_option_put`.
+
+    The mean of the payoffs over the scenarios converges to
+    :func:`option_put_value`, so the payoffs can be used
+    as a control variate to reduce the variance of the values of
+    the guarantees, such as ``pv_claims_over_av("MATURITY")``.
+    See :func:`lifelib.montecarlo.run_batches`.
+
+    Returns a 1D array in the same order as :func:`model_point`.
+
+    .. seealso::
+
+        * :func:`option_put_value`
+        * :func:`formula_option_put`
+    """
+    mps = model_point_table_ext()
+    terms = mps['policy_term'].to_numpy() * 12
+    growth = np.cumprod(
+        1 + inv_return_table().to_numpy().reshape(len(scen_index()), -1),
+        axis=1)
+    r = 0.02
+    q = 0.01
+
+    result = np.zeros((len(mps), len(scen_index())))
+    for t in np.unique(terms):
+        cond = terms == t
+        S = av_at(0, 'BEF_FEE').to_numpy().reshape(len(mps), -1)[cond, :1]
+        X = (sum_assured() * pols_maturity(t)).to_numpy().reshape(
+            len(mps), -1)[cond, :1]
+        result[cond] = np.exp(-r * t / 12) * np.maximum(
+            X - S * growth[:, t-1] * np.exp(-q * t / 12), 0)
+
+    return result.ravel()
+
+
+def option_put_value():
+    """Values of the put options by model point
+
+    :func:`formula_option_put` at the maturity of each model point,
+    as a 1D array by model point.
+    The expected values of :func:`option_put_payoff`.
+
+    .. seealso::
+
+        * :func:`option_put_payoff`
+        * :func:`formula_option_put`
+    """
+    terms = model_point_table_ext()['policy_term'].to_numpy() * 12
+
+    result = np.zeros(len(terms))
+    for t in np.unique(terms):
+        result[terms == t] = formula_option_put(t)
+
+    return result
+
+
 def policy_term():
     """The policy term of the model points.
 
@@ -1604,6 +2012,44 @@ def proj_len():
     return np.maximum(12 * policy_term() - duration_mth(0) + 1, 0)
 
 
+def pv_array(name, arg=None):
+    """Present values of a Cells for all model points and scenarios
+
+    Returns a 1D numpy array of the present values of the Cells
+    specified by ``name``, such as ``"premiums"``,
+    in the order of :func:`model_point_index`.
+    ``arg`` is passed to the Cells as the second argument if given,
+    such as ``pv_array("claims", "DEATH")``.
+
+    If :attr:`engine` is ``"cells"``, the present values are calculated
+    by multiplying the values of the Cells for all ``t``
+    by :func:`disc_factors`.
+    If :attr:`engine` is ``"broadcast"``, the present values are read from
+    :func:`broadcast_sweep`.
+
+    .. seealso::
+
+        * :attr:`engine`
+        * :func:`broadcast_sweep`
+        * :func:`disc_factors`
+
+    """
+    if engine == "cells":
+        args = () if arg is None else (arg,)
+        cells = getattr(_space, name)
+        result = np.array(list(cells(t, *args) for t in range(max_proj_len()))).transpose()
+        return result @ disc_factors()[:max_proj_len()]
+
+    elif engine == "broadcast":
+        result = broadcast_sweep()[name]
+        result = result[arg] if isinstance(result, dict) else result
+        shape = (len(model_point_table_ext()), len(scen_index()))
+        return np.broadcast_to(result, shape).ravel()
+
+    else:
+        raise ValueError("invalid engine")
+
+
 def pv_av_change():
     """Present value of change in account value
 
@@ -1614,9 +2060,7 @@ def pv_av_change():
         * :func:`proj_len`
 
     """
-    result = np.array(list(av_change(t) for t in range(max_proj_len()))).transpose()
-
-    return result @ disc_factors()[:max_proj_len()]
+    return pv_array("av_change")
 
 
 def pv_claims(kind=None):
@@ -1632,9 +2076,7 @@ def pv_claims(kind=None):
 
 
     """
-    cl = np.array(list(claims(t, kind) for t in range(max_proj_len()))).transpose()
-
-    return cl @ disc_factors()[:max_proj_len()]
+    return pv_array("claims", kind)
 
 
 def pv_claims_from_av(kind=None):
@@ -1650,9 +2092,7 @@ def pv_claims_from_av(kind=None):
 
 
     """
-    cl = np.array(list(claims_from_av(t, kind) for t in range(max_proj_len()))).transpose()
-
-    return cl @ disc_factors()[:max_proj_len()]
+    return pv_array("claims_from_av", kind)
 
 
 def pv_claims_over_av(kind=None):
@@ -1668,9 +2108,7 @@ def pv_claims_over_av(kind=None):
 
 
     """
-    cl = np.array(list(claims_over_av(t, kind) for t in range(max_proj_len()))).transpose()
-
-    return cl @ disc_factors()[:max_proj_len()]
+    return pv_array("claims_over_av", kind)
 
 
 def pv_commissions():
@@ -1683,9 +2121,7 @@ def pv_commissions():
         * :func:`disc_factors`
 
     """
-    result = np.array(list(commissions(t) for t in range(max_proj_len()))).transpose()
-
-    return result @ disc_factors()[:max_proj_len()]
+    return pv_array("commissions")
 
 
 def pv_expenses():
@@ -1698,9 +2134,7 @@ def pv_expenses():
         * :func:`disc_factors`
 
     """
-    result = np.array(list(expenses(t) for t in range(max_proj_len()))).transpose()
-
-    return result @ disc_factors()[:max_proj_len()]
+    return pv_array("expenses")
 
 
 def pv_inv_income():
@@ -1715,15 +2149,11 @@ def pv_inv_income():
         * :func:`disc_factors`
 
     """
-    result = np.array(list(inv_income(t) for t in range(max_proj_len()))).transpose()
-
-    return result @ disc_factors()[:max_proj_len()]
+    return pv_array("inv_income")
 
 
 def pv_maint_fee():
-    result = np.array(list(maint_fee(t) for t in range(max_proj_len()))).transpose()
-
-    return result @ disc_factors()[:max_proj_len()]
+    return pv_array("maint_fee")
 
 
 def pv_net_cf():
@@ -1760,9 +2190,7 @@ def pv_pols_if():
     It is used as the annuity factor for calculating :func:`net_premium_pp`.
 
     """
-    result = np.array(list(pols_if_at(t, "BEF_DECR") for t in range(max_proj_len()))).transpose()
-
-    return result @ disc_factors()[:max_proj_len()]
+    return pv_array("pols_if_at", "BEF_DECR")
 
 
 def pv_premiums():
@@ -1775,9 +2203,7 @@ def pv_premiums():
         * :func:`disc_factors`
 
     """
-    result = np.array(list(premiums(t) for t in range(max_proj_len()))).transpose()
-
-    return result @ disc_factors()[:max_proj_len()]
+    return pv_array("premiums")
 
 
 def result_cf():
@@ -1857,11 +2283,51 @@ def result_pv():
             "Net Cashflow": pv_net_cf()
         }
 
-    return pd.DataFrame(data, index=model_point().index)
+    return pd.DataFrame(data, index=model_point_index())
 
 
 def scen_index():
-    return std_norm_rand()[:, 0].index
+    """Index of the scenarios to run
+
+    The scenario IDs from ``scen_offset + 1`` to
+    ``scen_offset + scen_size`` as an Index named ``scen_id``.
+
+    .. seealso::
+
+        * :attr:`scen_offset`
+        * :attr:`scen_size`
+    """
+    return pd.Index(range(scen_offset + 1, scen_offset + scen_size + 1),
+                    name='scen_id')
+
+
+def scen_block_size():
+    """The number of scenarios in a block of dependent scenarios
+
+    The scenarios are generated in blocks of this size.
+    The scenarios in different blocks are independent,
+    while those in the same block are not.
+    1 if :attr:`scen_method` is ``"plain"``,
+    2 if ``"antithetic"`` and :attr:`sobol_size` if ``"sobol"``.
+    The standard errors of the means over the scenarios are
+    estimated from the means of the blocks by
+    :func:`lifelib.montecarlo.run_batches`.
+
+    .. seealso::
+
+        * :attr:`scen_method`
+        * :func:`std_norm_rand`
+    """
+    if scen_method == "plain":
+        return 1
+    elif scen_method == "antithetic":
+        return 2
+    elif scen_method == "sobol":
+        if max_proj_len_ext() > sobol_dim:
+            raise ValueError("sobol_dim is less than the projection length")
+        return sobol_size
+    else:
+        raise ValueError("invalid scen_method")
 
 
 def sex():
@@ -1876,23 +2342,105 @@ def sex():
     return model_point()["sex"]
 
 
+def sobol_rand(block):
+    """Random numbers of a block of scrambled Sobol points
+
+    Returns a 2D array of :attr:`sobol_size` rows by ``t`` from 0 to
+    :attr:`sobol_dim` - 1. Row ``i`` is the random numbers of
+    the scenario whose ID is ``block * sobol_size + i + 1``.
+
+    The first :attr:`sobol_size` points of the Sobol sequence of
+    :attr:`sobol_dim` dimensions are scrambled by the generator seeded by
+    ``SeedSequence(1234, spawn_key=(block,))``, and mapped to
+    the standard normal distribution by the inverse of its CDF.
+    The numbers are then used to construct Brownian motion paths
+    by the Brownian bridge in the order of :func:`bridge_schedule`,
+    and the increments of the paths are returned.
+    The first dimensions of the Sobol points, which are the most evenly
+    distributed, therefore determine the ends and the overall shapes of
+    the paths.
+
+    .. seealso::
+
+        * :func:`bridge_schedule`
+        * :func:`std_norm_rand`
+        * :attr:`sobol_size`
+        * :attr:`sobol_dim`
+    """
+    n = sobol_dim
+    sampler = stats.qmc.Sobol(n, scramble=True, seed=np.random.default_rng(
+        np.random.SeedSequence(1234, spawn_key=(block,))))
+    z = stats.norm.ppf(sampler.random(sobol_size))
+
+    w = np.zeros((sobol_size, n + 1))
+    w[:, n] = np.sqrt(n) * z[:, 0]
+    for k, (left, mid, right) in enumerate(bridge_schedule(n), 1):
+        w[:, mid] = (((right - mid) * w[:, left] + (mid - left) * w[:, right])
+                     / (right - left)
+                     + np.sqrt((mid - left) * (right - mid) / (right - left))
+                     * z[:, k])
+
+    return np.diff(w, axis=1)
+
+
 def std_norm_rand():
+    """Random numbers drawn from the standard normal distribution
+
+    Returns a Series of the random numbers indexed with ``scen_id``
+    in :func:`scen_index` and ``t`` from 0 to :func:`max_proj_len_ext` - 1.
+    The numbers of each scenario are drawn from its own stream,
+    the generator seeded by ``SeedSequence(1234, spawn_key=(scen_id,))``,
+    so the number for a scenario and ``t`` is the same
+    regardless of the other scenarios run with it.
+    Subsets of the scenarios can therefore be run in separate processes
+    by :attr:`scen_offset` and :attr:`scen_size`.
 
-    if hasattr(np.random, 'default_rng'):
+    The numbers are generated by the method given by :attr:`scen_method`:
 
-        gen = np.random.default_rng(1234)
-        rnd = gen.standard_normal(scen_size * 242)
+    * ``"plain"``: The numbers of each scenario are drawn
+      as described above.
+    * ``"antithetic"``: The numbers of each pair of scenarios
+      with IDs ``2k-1`` and ``2k`` are drawn from the stream
+      keyed by ``k``, and the numbers of the scenario ``2k`` are
+      those of ``2k-1`` with their signs reversed.
+    * ``"sobol"``: The numbers are read from :func:`sobol_rand`
+      by blocks of :attr:`sobol_size` scenarios, and the numbers
+      for ``t`` from :func:`max_proj_len_ext` on are dropped.
+
+    .. seealso::
+
+        * :func:`inv_return_table`
+        * :attr:`scen_offset`
+        * :attr:`scen_method`
+    """
+    if scen_method == "plain":
+        rnd = np.array([
+            np.random.default_rng(
+                np.random.SeedSequence(1234, spawn_key=(i,))
+            ).standard_normal(max_proj_len_ext())
+            for i in scen_index()])
+
+    elif scen_method == "antithetic":
+        rnd = np.array([
+            (1 if i % 2 else -1) * np.random.default_rng(
+                np.random.SeedSequence(1234, spawn_key=((i + 1) // 2,))
+            ).standard_normal(max_proj_len_ext())
+            for i in scen_index()])
+
+    elif scen_method == "sobol":
+        rnd = np.array([
+            sobol_rand((i - 1) // sobol_size)[(i - 1) % sobol_size, :max_proj_len_ext()]
+            for i in scen_index()])
 
     else:
-        np.random.seed(1234)
-        rnd = np.random.standard_normal(size=scen_size * 242)
+        raise ValueError("invalid scen_method")
 
     idx = pd.MultiIndex.from_product(
-            [range(1, scen_size + 1), range(242)],
+            [scen_index(), range(max_proj_len_ext())],
             names = ['scen_id', 't']
         )
 
-    return pd.Series(rnd, index=idx)
+    return pd.Series(rnd.ravel(), index=idx)
 
 
 def sum_assured():
@@ -1989,6 +2537,30 @@ def surr_charge_table_stacked():
     return surr_charge_table.stack().reorder_levels([1, 0]).sort_index()
 
 
+def table_lookup():
+    """Function to look up 2D tables by pairs of indices
+
+    Returns a function ``lookup(table, x, d, fill=0)`` that takes
+    a 2D numpy array ``table`` and two integer numpy arrays
+    ``x`` and ``d`` of the same shape, and returns
+    the elements ``table[x, d]`` as an array of the same shape.
+    The elements for the pairs of indices out of ``table``,
+    such as negative durations of future new business, are ``fill``.
+
+    The function is shared by :func:`mort_rate` and :func:`broadcast_sweep`.
+    A function is returned in place of taking the arrays as
+    the parameters of this Cells, as the parameters of Cells
+    must be hashable.
+    """
+    def lookup(table, x, d, fill=0):
+        in_table = ((0 <= x) & (x < table.shape[0])
+                    & (0 <= d) & (d < table.shape[1]))
+        values = table[np.where(in_table, x, 0), np.where(in_table, d, 0)]
+        return np.where(in_table, values, fill)
+
+    return lookup
+
+
 # ---------------------------------------------------------------------------
 # References
 
@@ -2018,4 +2590,14 @@ sim_param_table = ("DataClient", 1918484096712)
 
 model_point_table = ("DataClient", 1918484065800)
 
-sim_id = 1
\ No newline at end of file
+sim_id = 1
+
+engine = "cells"
+
+scen_offset = 0
+
+scen_method = "plain"
+
+sobol_size = 256
+
+sobol_dim = 242
\ No newline at end of file
@@ -161,6 +161,41 @@ Attributes:
         :attr:`scen_id` is referenced in by :func:`inv_return_mth`
         as one of the keys to select a scenario from :attr:`std_norm_rand`.
 
+    scen_size: The number of scenarios to run
+
+        1000 by default. The scenarios from ``scen_offset + 1`` to
+        ``scen_offset + scen_size`` are run. See :func:`scen_index`.
+
+    scen_offset: The number of scenarios to skip
+
+        0 by default. Scenarios can be run in subsets by changing
+        :attr:`scen_offset` and :attr:`scen_size`, as
+        the random numbers of each scenario do not depend on the others.
+        See :func:`std_norm_rand`.
+        :func:`lifelib.montecarlo.run_batches` runs
+        scenarios in batches in this way.
+
+    scen_method: The method to generate the random numbers
+
+        ``"plain"`` by default. ``"antithetic"`` for antithetic pairs of
+        scenarios, or ``"sobol"`` for scrambled Sobol points
+        with the Brownian bridge. See :func:`std_norm_rand`.
+
+    sobol_size: The number of Sobol points in a block
+
+        256 by default. Used only when :attr:`scen_method` is ``"sobol"``.
+        A power of 2 keeps the balance properties of the Sobol points.
+        See :func:`sobol_rand`.
+
+    sobol_dim: The number of dimensions of the Sobol points
+
+        242 by default. Used only when :attr:`scen_method` is ``"sobol"``.
+        The Brownian bridge is constructed over :attr:`sobol_dim` steps
+        regardless of the model points, so that the random numbers of
+        a scenario do not depend on the model points run with it.
+        Must not be less than :attr:`max_proj_len`.
+        See :func:`sobol_rand`.
+
     surr_charge_table: Surrender charge rates by duration
 
         A DataFrame of multiple patterns of surrender charge rates by duration.
@@ -407,6 +442,36 @@ def av_pp_init():
     return model_point()["av_pp_init"].values
 
 
+def bridge_schedule(n):
+    """Construction order of the Brownian bridge over ``n`` steps
+
+    Returns a list of tuples of 3 integers ``(left, mid, right)``,
+    indicating that the value of the Brownian motion at step ``mid``
+    is interpolated from its values at steps ``left`` and ``right``.
+    The value at step ``n`` is constructed first, then
+    the midpoints are constructed breadth first,
+    so the earlier the random number is in the list,
+    the larger the part of the path it determines.
+    Used by :func:`sobol_rand`.
+
+    .. seealso::
+
+        * :func:`sobol_rand`
+    """
+    result = []
+    intervals = [(0, n)]
+    while intervals:
+        children = []
+        for left, right in intervals:
+            if right - left > 1:
+                mid = (left + right) // 2
+                result.append((left, mid, right))
+                children.extend([(left, mid), (mid, right)])
+        intervals = children
+
+    return result
+
+
 def check_av_roll_fwd():
     """Check account value roll-forward
 
@@ -824,12 +889,12 @@ def formula_option_put(t):
 
     """
     mps = model_point_table_ext()
-    cond = mps['policy_term'] * 12 == t
+    cond = (mps['policy_term'] * 12 == t).to_numpy()
     mps = mps.loc[cond]
 
     T = t / 12
-    S = av_at(0, 'BEF_FEE')[:, 1][cond]
-    X = (sum_assured() * pols_maturity(t))[:, 1][cond]
+    S = av_at(0, 'BEF_FEE').reshape(len(cond), -1)[:, 0][cond]
+    X = (sum_assured() * pols_maturity(t)).reshape(len(cond), -1)[:, 0][cond]
     sigma = 0.03
     r = 0.02
     N = stats.norm.cdf
@@ -1289,6 +1354,67 @@ def net_cf(t):
             + inv_income(t) - claims(t) - expenses(t) - commissions(t) - av_change(t))
 
 
+def option_put_payoff():
+    """Discounted payoffs of the put options by scenario
+
+    The payoffs at maturity of the put options valued by
+    :func:`formula_option_put` for each model point, discounted at
+    the same rate of 2% as in :func:`formula_option_put`.
+    The price of the underlying asset at ``t`` is
+    the strike price ``S`` in :func:`formula_option_put` accumulated by
+    :func:`inv_return_mth` from 0 to ``t-1``.
+
+    The mean of the payoffs over the scenarios converges to
+    :func:`option_put_value`, so the payoffs can be used
+    as a control variate to reduce the variance of the values of
+    the guarantees, such as ``pv_claims_over_av("MATURITY")``.
+    See :func:`lifelib.montecarlo.run_batches`.
+
+    Returns a 1D array in the same order as :func:`model_point`.
+
+    .. seealso::
+
+        * :func:`option_put_value`
+        * :func:`formula_option_put`
+    """
+    mps = model_point_table_ext()
+    terms = mps['policy_term'].to_numpy() * 12
+    # The rows of inv_return_table for the first model point
+    growth = np.cumprod(1 + inv_return_table()[:len(scen_index())], axis=1)
+    r = 0.02
+
+    result = np.zeros((len(mps), len(scen_index())))
+    for t in np.unique(terms):
+        cond = terms == t
+        S = av_at(0, 'BEF_FEE').reshape(len(mps), -1)[cond, :1]
+        X = (sum_assured() * pols_maturity(t)).reshape(len(mps), -1)[cond, :1]
+        result[cond] = np.exp(-r * t / 12) * np.maximum(
+            X - S * growth[:, t-1], 0)
+
+    return result.ravel()
+
+
+def option_put_value():
+    """Values of the put options by model point
+
+    :func:`formula_option_put` at the maturity of each model point,
+    as a 1D array by model point.
+    The expected values of :func:`option_put_payoff`.
+
+    .. seealso::
+
+        * :func:`option_put_payoff`
+        * :func:`formula_option_put`
+    """
+    terms = model_point_table_ext()['policy_term'].to_numpy() * 12
+
+    result = np.zeros(len(terms))
+    for t in np.unique(terms):
+        result[terms == t] = formula_option_put(t)
+
+    return result
+
+
 def policy_term():
     """The policy term of the model points.
 
@@ -1777,7 +1903,47 @@ def result_pv():
 
 
 def scen_index():
-    return pd.Index(range(1, scen_size + 1), name='scen_id')
+    """Index of the scenarios to run
+
+    The scenario IDs from ``scen_offset + 1`` to
+    ``scen_offset + scen_size`` as an Index named ``scen_id``.
+
+    .. seealso::
+
+        * :attr:`scen_offset`
+        * :attr:`scen_size`
+    """
+    return pd.Index(range(scen_offset + 1, scen_offset + scen_size + 1),
+                    name='scen_id')
+
+
+def scen_block_size():
+    """The number of scenarios in a block of dependent scenarios
+
+    The scenarios are generated in blocks of this size.
+    The scenarios in different blocks are independent,
+    while those in the same block are not.
+    1 if :attr:`scen_method` is ``"plain"``,
+    2 if ``"antithetic"`` and :attr:`sobol_size` if ``"sobol"``.
+    The standard errors of the means over the scenarios are
+    estimated from the means of the blocks by
+    :func:`lifelib.montecarlo.run_batches`.
+
+    .. seealso::
+
+        * :attr:`scen_method`
+        * :func:`std_norm_rand`
+    """
+    if scen_method == "plain":
+        return 1
+    elif scen_method == "antithetic":
+        return 2
+    elif scen_method == "sobol":
+        if max_proj_len() > sobol_dim:
+            raise ValueError("sobol_dim is less than the projection length")
+        return sobol_size
+    else:
+        raise ValueError("invalid scen_method")
 
 
 def sex():
@@ -1792,20 +1958,98 @@ def sex():
     return model_point()["sex"].values
 
 
+def sobol_rand(block):
+    """Random numbers of a block of scrambled Sobol points
+
+    Returns a 2D array of :attr:`sobol_size` rows by ``t`` from 0 to
+    :attr:`sobol_dim` - 1. Row ``i`` is the random numbers of
+    the scenario whose ID is ``block * sobol_size + i + 1``.
+
+    The first :attr:`sobol_size` points of the Sobol sequence of
+    :attr:`sobol_dim` dimensions are scrambled by the generator seeded by
+    ``SeedSequence(1234, spawn_key=(block,))``, and mapped to
+    the standard normal distribution by the inverse of its CDF.
+    The numbers are then used to construct Brownian motion paths
+    by the Brownian bridge in the order of :func:`bridge_schedule`,
+    and the increments of the paths are returned.
+    The first dimensions of the Sobol points, which are the most evenly
+    distributed, therefore determine the ends and the overall shapes of
+    the paths.
+
+    .. seealso::
+
+        * :func:`bridge_schedule`
+        * :func:`std_norm_rand`
+        * :attr:`sobol_size`
+        * :attr:`sobol_dim`
+    """
+    n = sobol_dim
+    sampler = stats.qmc.Sobol(n, scramble=True, seed=np.random.default_rng(
+        np.random.SeedSequence(1234, spawn_key=(block,))))
+    z = stats.norm.ppf(sampler.random(sobol_size))
+
+    w = np.zeros((sobol_size, n + 1))
+    w[:, n] = np.sqrt(n) * z[:, 0]
+    for k, (left, mid, right) in enumerate(bridge_schedule(n), 1):
+        w[:, mid] = (((right - mid) * w[:, left] + (mid - left) * w[:, right])
+                     / (right - left)
+                     + np.sqrt((mid - left) * (right - mid) / (right - left))
+                     * z[:, k])
+
+    return np.diff(w, axis=1)
+
+
 def std_norm_rand():
+    """Random numbers drawn from the standard normal distribution
 
-    if hasattr(np.random, 'default_rng'):
+    Returns a 2D array of the random numbers for the scenarios in
+    :func:`scen_index` by ``t`` from 0 to :attr:`max_proj_len` - 1.
+    The numbers of each scenario are drawn from its own stream,
+    the generator seeded by ``SeedSequence(1234, spawn_key=(scen_id,))``,
+    so the number for a scenario and ``t`` is the same
+    regardless of the other scenarios run with it.
+    Subsets of the scenarios can therefore be run in separate processes
+    by :attr:`scen_offset` and :attr:`scen_size`.
 
-        gen = np.random.default_rng(1234)
-        rnd = gen.standard_normal((scen_size, 242))
+    The numbers are generated by the method given by :attr:`scen_method`:
 
-    else:
-        np.random.seed(1234)
-        rnd = np.random.standard_normal(size=(scen_size, 242))
+    * ``"plain"``: The numbers of each scenario are drawn
+      as described above.
+    * ``"antithetic"``: The numbers of each pair of scenarios
+      with IDs ``2k-1`` and ``2k`` are drawn from the stream
+      keyed by ``k``, and the numbers of the scenario ``2k`` are
+      those of ``2k-1`` with their signs reversed.
+    * ``"sobol"``: The numbers are read from :func:`sobol_rand`
+      by blocks of :attr:`sobol_size` scenarios, and the numbers
+      for ``t`` from :attr:`max_proj_len` on are dropped.
 
+    .. seealso::
 
+        * :func:`inv_return_table`
+        * :attr:`scen_offset`
+        * :attr:`scen_method`
+    """
+    if scen_method == "plain":
+        return np.array([
+            np.random.default_rng(
+                np.random.SeedSequence(1234, spawn_key=(i,))
+            ).standard_normal(max_proj_len())
+            for i in scen_index()])
+
+    elif scen_method == "antithetic":
+        return np.array([
+            (1 if i % 2 else -1) * np.random.default_rng(
+                np.random.SeedSequence(1234, spawn_key=((i + 1) // 2,))
+            ).standard_normal(max_proj_len())
+            for i in scen_index()])
+
+    elif scen_method == "sobol":
+        return np.array([
+            sobol_rand((i - 1) // sobol_size)[(i - 1) % sobol_size, :max_proj_len()]
+            for i in scen_index()])
 
-    return rnd
+    else:
+        raise ValueError("invalid scen_method")
 
 
 def sum_assured():
@@ -1929,4 +2173,12 @@ model_point_1 = ("DataClient", 1916615684048)
 
 model_point_moneyness = ("DataClient", 1916616522432)
 
-model_point_table = ("DataClient", 1916616522432)
\ No newline at end of file
+model_point_table = ("DataClient", 1916616522432)
+
+scen_offset = 0
+
+scen_method = "plain"
+
+sobol_size = 256
+
+sobol_dim = 242
\ No newline at end of file
@@ -169,6 +169,7 @@ Attributes:
 
            * :func:`mort_rate`
            * :func:`mort_rate_mth`
+           * :func:`mort_table_array`
 
     std_norm_rand: Random numbers drawn from the standard normal distribution.
 
@@ -214,6 +215,31 @@ Attributes:
             C              LEVEL            False            NaN            0.10   True
             D              LEVEL             True         type_3            0.05   True
 
+    engine: A string to select how the projection is carried out.
+        ``"cells"`` by default.
+
+        When ``"cells"`` is assigned, the values of the Cells
+        such as :func:`pols_if_at`, :func:`av_pp_at` and :func:`claims`
+        are calculated for each ``t`` recursively,
+        and the present values are calculated from them.
+
+        When ``"scalar"`` is assigned, the present values are read from
+        :func:`scalar_sweep`, which reads the attributes of
+        the model point once and rolls the numbers of policies,
+        the account value and the cashflows forward
+        in plain Python floats.
+        The results are the same in both modes,
+        but the values of the Cells for each ``t`` are not calculated
+        in the ``"scalar"`` mode, which makes it much faster
+        to project one model point at a time::
+
+            >>> Projection.engine = "scalar"
+
+        .. seealso::
+
+           * :func:`scalar_sweep`
+           * :func:`pv_net_cf`
+
     np: The `numpy`_ module.
     pd: The `pandas`_ module.
 
@@ -691,15 +717,34 @@ def coi_rate(t):
 
     The cost of insuranc rate per account value per month. 
     By default, it is set to 1.1 times the monthly mortality rate.
+    The formula is defined by :func:`coi_rate_func`.
 
     .. seealso::
 
         * :func:`mort_rate_mth`
         * :func:`coi_pp`
+        * :func:`coi_rate_func`
+
+    """
+    return coi_rate_func()(mort_rate_mth(t))
+
+
+def coi_rate_func():
+    """Function to calculate cost of insurance rates
+
+    Returns a function that takes a monthly mortality rate and
+    returns the cost of insurance rate per month for it.
+    By default, the rate is 1.1 times the monthly mortality rate.
+
+    The function is used by :func:`coi_rate` and :func:`scalar_sweep`,
+    so changes to the function are reflected in both the engines.
+
+    .. seealso::
+
         * :func:`coi_rate`
 
     """
-    return 1.1 * mort_rate_mth(t)
+    return lambda mort_mth: 1.1 * mort_mth
 
 
 def coi_pp(t):
@@ -718,17 +763,37 @@ def coi_pp(t):
     return coi_rate(t) * net_amt_at_risk(t)
 
 
+def commission_rate_func():
+    """Function to calculate commission rates from durations
+
+    Returns a function that takes a duration and returns
+    the commission rate per premium for it.
+    By default, the rate is 5% for all durations.
+
+    The function is used by :func:`commissions` and :func:`scalar_sweep`,
+    so changes to the function are reflected in both the engines.
+
+    .. seealso::
+
+        * :func:`commissions`
+
+    """
+    return lambda dur: 0.05
+
+
 def commissions(t): 
     """Commissions
 
     By default, 5% premiums are paid as commissions.
+    The rates are given by :func:`commission_rate_func`.
 
     .. seealso::
 
         * :func:`premiums`
+        * :func:`commission_rate_func`
 
     """
-    return 0.05 * premiums(t)
+    return commission_rate_func()(duration(t)) * premiums(t)
 
 
 def disc_factors():
@@ -741,7 +806,8 @@ def disc_factors():
 
         :func:`disc_rate_mth`
     """
-    return np.array(list((1 + disc_rate_mth()[t])**(-t) for t in range(proj_len())))
+    rates = disc_rate_mth()
+    return np.array(list((1 + rates[t])**(-t) for t in range(proj_len())))
 
 
 def disc_rate_mth():
@@ -757,7 +823,8 @@ def disc_rate_mth():
         :func:`disc_rate_ann`
 
     """
-    return np.array(list((1 + disc_rate_ann[t//12])**(1/12) - 1 for t in range(proj_len())))
+    rates = dict(zip(disc_rate_ann.index, disc_rate_ann.to_numpy()))
+    return np.array(list((1 + rates[t//12])**(1/12) - 1 for t in range(proj_len())))
 
 
 def duration(t):
@@ -977,12 +1044,35 @@ def lapse_rate(t):
 
         max(0.1 - 0.02 * duration(t), 0.02)
 
+    The formula is defined by :func:`lapse_rate_func`.
+
+    .. seealso::
+
+        * :func:`duration`
+        * :func:`lapse_rate_func`
+
+    """
+    return lapse_rate_func()(duration(t))
+
+
+def lapse_rate_func():
+    """Function to calculate lapse rates from durations
+
+    Returns a function that takes a duration and returns
+    the annual lapse rate for it.
+    By default, the lapse rate assumption is defined by duration as::
+
+        max(0.1 - 0.02 * duration, 0.02)
+
+    The function is used by :func:`lapse_rate` and :func:`scalar_sweep`,
+    so changes to the function are reflected in both the engines.
+
     .. seealso::
 
-        :func:`duration`
+        * :func:`lapse_rate`
 
     """
-    return max(0.1 - 0.02 * duration(t), 0.02)
+    return lambda dur: max(0.1 - 0.02 * dur, 0.02)
 
 
 def load_prem_rate():
@@ -1167,10 +1257,35 @@ def mort_rate(t):
     .. seealso::
 
        * :attr:`mort_table`
+       * :func:`mort_rate_func`
        * :func:`mort_rate_mth`
 
     """
-    return mort_table[str(max(min(5, duration(t)),0))][age(t)]
+    return mort_rate_func()(age(t), duration(t))
+
+
+def mort_rate_func():
+    """Function to calculate mortality rates from ages and durations
+
+    Returns a function that takes an age and a duration and returns
+    the annual mortality rate for them.
+    By default, the rate is looked up from :func:`mort_table_array`
+    by :func:`table_lookup`
+    with the age and the duration limited to between 0 and 5.
+    Ages out of the table result in 0.
+
+    The function is used by :func:`mort_rate` and :func:`scalar_sweep`,
+    so changes to the function are reflected in both the engines.
+
+    .. seealso::
+
+        * :func:`mort_rate`
+        * :func:`mort_table_array`
+        * :func:`table_lookup`
+
+    """
+    lookup, table = table_lookup(), mort_table_array()
+    return lambda x, dur: lookup(table, x, max(min(5, dur), 0))
 
 
 def mort_rate_mth(t):
@@ -1204,6 +1319,29 @@ def mort_table_last_age():
     return i
 
 
+def mort_table_array():
+    """Mortality table as a 2D array
+
+    Returns the mortality rates in :attr:`mort_table` as a 2D numpy array
+    whose row indices are ages and column indices are durations,
+    so that the rate for age ``x`` and duration ``d`` is
+    ``mort_table_array()[x, d]``.
+    Rows for the ages not in :attr:`mort_table` are filled with 0.
+
+    .. seealso::
+
+       * :attr:`mort_table`
+       * :func:`scalar_sweep`
+
+    """
+    ages = mort_table.index.to_numpy()
+    durs = mort_table.columns.astype(int).to_numpy()
+
+    result = np.zeros((ages.max() + 1, durs.max() + 1))
+    result[np.ix_(ages, durs)] = mort_table.to_numpy()
+    return result
+
+
 def net_amt_at_risk(t):
     """Net amount at risk per policy
 
@@ -1509,9 +1647,13 @@ def pv_av_change():
 
         * :func:`av_change`
         * :func:`disc_factors`
+        * :func:`scalar_sweep`
         * :func:`proj_len`
 
     """
+    if engine == "scalar":
+        return scalar_sweep()["av_change"]
+
     return sum(list(av_change(t) for t in range(proj_len())) * disc_factors()[:proj_len()])
 
 
@@ -1525,9 +1667,13 @@ def pv_claims(kind=None):
         * :func:`claims`
         * :func:`proj_len`
         * :func:`disc_factors`
+        * :func:`scalar_sweep`
 
 
     """
+    if engine == "scalar":
+        return scalar_sweep()["claims"][kind]
+
     return sum(list(claims(t, kind) for t in range(proj_len())) * disc_factors()[:proj_len()])
 
 
@@ -1539,8 +1685,12 @@ def pv_commissions():
         * :func:`expenses`
         * :func:`proj_len`
         * :func:`disc_factors`
+        * :func:`scalar_sweep`
 
     """
+    if engine == "scalar":
+        return scalar_sweep()["commissions"]
+
     return sum(list(commissions(t) for t in range(proj_len())) * disc_factors()[:proj_len()])
 
 
@@ -1552,8 +1702,12 @@ def pv_expenses():
         * :func:`expenses`
         * :func:`proj_len`
         * :func:`disc_factors`
+        * :func:`scalar_sweep`
 
     """
+    if engine == "scalar":
+        return scalar_sweep()["expenses"]
+
     return sum(list(expenses(t) for t in range(proj_len())) * disc_factors()[:proj_len()])
 
 
@@ -1567,8 +1721,12 @@ def pv_inv_income():
         * :func:`inv_income`
         * :func:`proj_len`
         * :func:`disc_factors`
+        * :func:`scalar_sweep`
 
     """
+    if engine == "scalar":
+        return scalar_sweep()["inv_income"]
+
     return sum(list(inv_income(t) for t in range(proj_len())) * disc_factors()[:proj_len()])
 
 
@@ -1606,6 +1764,9 @@ def pv_pols_if():
     It is used as the annuity factor for calculating :func:`net_premium_pp`.
 
     """
+    if engine == "scalar":
+        return scalar_sweep()["pols_if"]
+
     return sum(list(pols_if(t) for t in range(proj_len())) * disc_factors()[:proj_len()])
 
 
@@ -1617,8 +1778,12 @@ def pv_premiums():
         * :func:`premiums`
         * :func:`proj_len`
         * :func:`disc_factors`
+        * :func:`scalar_sweep`
 
     """
+    if engine == "scalar":
+        return scalar_sweep()["premiums"]
+
     return sum(list(premiums(t) for t in range(proj_len())) * disc_factors()[:proj_len()])
 
 
@@ -1712,6 +1877,141 @@ def result_pv():
             orient='index')
 
 
+def scalar_sweep():
+    """Present values of the selected model point by one forward sweep
+
+    Reads the attributes of the selected model point, such as
+    :func:`age_at_entry` and :func:`sum_assured`, once
+    and rolls the number of policies, the account value per policy
+    and the cashflows forward from ``t=0`` to :func:`proj_len` - 1
+    in plain Python floats, without calling the Cells for each ``t``.
+    The investment returns are read from :func:`inv_return_table`.
+    The mortality, lapse, cost of insurance and commission rates
+    are calculated by :func:`mort_rate_func`, :func:`lapse_rate_func`,
+    :func:`coi_rate_func` and :func:`commission_rate_func`
+    as in the Cells.
+    The other formulas of the Cells, such as :func:`claims`,
+    are inlined, so changes to them are not reflected in this mode.
+
+    Returns a dict of the present values keyed with the names of the Cells,
+    ``"premiums"``, ``"claims"``, ``"expenses"``, ``"commissions"``,
+    ``"inv_income"``, ``"av_change"`` and ``"pols_if"``.
+    The value for ``"claims"`` is a dict keyed with
+    the ``kind`` parameter of :func:`claims`, including ``None``
+    for the total. The present values are the same as those
+    calculated from the Cells.
+
+    This Cells is used by the present value Cells, such as :func:`pv_claims`,
+    only when ``"scalar"`` is assigned to :attr:`engine`.
+
+    .. seealso::
+
+        * :attr:`engine`
+        * :func:`mort_table_array`
+        * :func:`inv_return_table`
+
+    """
+    mort_rate_ = mort_rate_func()
+    lapse_rate_ = lapse_rate_func()
+    coi_rate_ = coi_rate_func()
+    comm_rate = commission_rate_func()
+    returns = inv_return_table()[scen_id].to_numpy()
+    disc = disc_factors()
+
+    entry_age = age_at_entry()
+    dur_mth_init = duration_mth(0)
+    term_mth = policy_term() * 12
+    pols_nb = model_point()['policy_count']
+    sa = sum_assured()
+    prem = model_point()['premium_pp']
+    single = {'SINGLE': True, 'LEVEL': False}[premium_type()]
+    load = load_prem_rate()
+    fee_rate = maint_fee_rate()
+    exp_acq = expense_acq()
+    exp_maint = expense_maint()
+    infl = 1 + inflation_rate()
+
+    has_surr = has_surr_charge()
+    if has_surr:
+        surr_rates = surr_charge_table[surr_charge_id()]
+        max_idx = max(surr_rates.index)
+        surr_rates = dict(zip(surr_rates.index, surr_rates.to_numpy()))
+
+    kinds = [None, 'DEATH', 'LAPSE', 'MATURITY']
+    names = ["premiums", "expenses", "commissions", "inv_income",
+             "av_change", "pols_if"]
+    pv = dict.fromkeys(names, 0)
+    pv["claims"] = dict.fromkeys(kinds, 0)
+
+    for t in range(proj_len()):
+
+        dur_mth = dur_mth_init + t
+        dur = dur_mth // 12
+
+        mort_mth = 1 - (1 - mort_rate_(entry_age + dur, dur)) ** (1 / 12)
+        lapse_mth = 1 - (1 - lapse_rate_(dur)) ** (1 / 12)
+
+        # Number of policies
+        if t == 0:
+            bef_mat = pols_if_init()
+        else:
+            bef_mat = bef_decr - lapse - death
+
+        maturity = bef_mat if dur_mth == term_mth else 0
+        new_biz = pols_nb if dur_mth == 0 else 0
+        bef_decr = bef_mat - maturity + new_biz
+        death = bef_decr * mort_mth
+        lapse = (bef_decr - death) * lapse_mth
+
+        # Account value per policy
+        if t == 0:
+            av_bef_prem = av_pp_init()
+        else:
+            av_bef_prem = av_bef_inv + inv_income_pp
+
+        if single:
+            prem_pp = prem if dur_mth == 0 else 0
+        else:
+            prem_pp = prem if dur_mth < term_mth else 0
+
+        av_bef_fee = av_bef_prem + (1 - load) * prem_pp
+        coi_pp = coi_rate_(mort_mth) * max(sa - av_bef_fee, 0)
+        av_bef_inv = av_bef_fee - fee_rate * av_bef_fee - coi_pp
+        inv_income_pp = returns[t] * av_bef_inv
+        av_mid = av_bef_inv + 0.5 * inv_income_pp
+
+        # Cashflows
+        if has_surr:
+            surr_rate = surr_rates[dur if dur <= max_idx else max_idx]
+        else:
+            surr_rate = 0
+
+        prems = prem_pp * bef_decr
+        claims_ = {
+            'DEATH': max(sa, av_mid) * death,
+            'LAPSE': av_mid * lapse - surr_rate * av_mid * lapse,
+            'MATURITY': av_bef_prem * maturity}
+        claims_[None] = sum(claims_[k] for k in kinds[1:])
+
+        pols_next = bef_decr - lapse - death
+        inv_income = (inv_income_pp * pols_next
+                      + 0.5 * inv_income_pp * (death + lapse))
+        av_change = ((av_bef_inv + inv_income_pp) * pols_next
+                     - av_bef_prem * bef_mat)
+
+        pv["premiums"] += prems * disc[t]
+        pv["expenses"] += (exp_acq * new_biz
+                           + bef_decr * exp_maint / 12 * infl ** (t / 12)) * disc[t]
+        pv["commissions"] += comm_rate(dur) * prems * disc[t]
+        pv["inv_income"] += inv_income * disc[t]
+        pv["av_change"] += av_change * disc[t]
+        pv["pols_if"] += bef_mat * disc[t]
+        for k in kinds:
+            pv["claims"][k] += claims_[k] * disc[t]
+
+    return pv
+
+
 def sex(): 
     """The sex of the selected model point
 
@@ -1791,6 +2091,31 @@ def surr_charge_id():
     return model_point()['surr_charge_id']
 
 
+def table_lookup():
+    """Function to look up 2D tables by a pair of indices
+
+    Returns a function ``lookup(table, x, d, fill=0)`` that takes
+    a 2D numpy array ``table`` and two integers ``x`` and ``d``,
+    and returns the element ``table[x, d]``.
+    ``fill`` is returned if the pair is out of ``table``,
+    such as a negative duration of future new business,
+    instead of an element counted from the end of ``table``.
+
+    The function is shared by :func:`mort_rate_func`.
+
+    .. seealso::
+
+        * :func:`mort_table_array`
+
+    """
+    def lookup(table, x, d, fill=0):
+        if 0 <= x < table.shape[0] and 0 <= d < table.shape[1]:
+            return table[x, d]
+        return fill
+
+    return lookup
+
+
 # ---------------------------------------------------------------------------
 # References
 
@@ -1814,4 +2139,6 @@ model_point_samples = ("DataClient", 2587745729360)
 
 model_point_table = ("DataClient", 2587745729360)
 
-point_id = 1
\ No newline at end of file
+point_id = 1
+
+engine = "cells"
\ No newline at end of file
@@ -0,0 +1,570 @@
+"""Monte Carlo runs of stochastic models by batches of scenarios
+
+:mod:`~savings.CashValue_ME_EX4` projects all the pairs of
+the model points and the scenarios at once, so the memory it uses
+grows with :attr:`~savings.CashValue_ME_EX4.Projection.scen_size`
+times the number of model points.
+:func:`run_batches` runs the scenarios batch by batch by changing
+:attr:`~savings.CashValue_ME_EX4.Projection.scen_offset` and
+:attr:`~savings.CashValue_ME_EX4.Projection.scen_size`, and
+accumulates the means and the standard errors of the outputs
+in :class:`ScenarioStats`, so the memory is bounded by the size
+of a batch, not by the number of scenarios.
+:mod:`~savings.CashValue_ME_EX2` can be run in the same way
+by giving the simulation ID as ``params``.
+
+The outputs are accumulated scenario by scenario in the order of
+the scenario IDs, and the random numbers of each scenario do not
+depend on the batch it is run in, so the results are
+the same regardless of the batch size.
+
+The variance of the means can be reduced in two ways,
+which can be combined:
+
+* By generating the scenarios by antithetic pairs or
+  by scrambled Sobol points, selected by
+  :attr:`~savings.CashValue_ME_EX4.Projection.scen_method`.
+  The scenarios are then dependent within each block of
+  :func:`~savings.CashValue_ME_EX4.Projection.scen_block_size`
+  scenarios, so the standard errors are estimated from
+  the means of the blocks.
+* By a control variate whose expected values are known, such as
+  :func:`~savings.CashValue_ME_EX4.Projection.option_put_payoff`,
+  whose expected values are given by the closed-form formula in
+  :func:`~savings.CashValue_ME_EX4.Projection.option_put_value`.
+  Pass :data:`OPTION_PUT` as ``control``.
+
+:func:`compare_methods` reports the means and the standard errors
+of the methods side by side.
+
+:func:`run_until` adds batches of scenarios until the standard errors
+of the outputs fall within a tolerance, instead of running
+a fixed number of scenarios, and records the convergence trace.
+
+Example:
+    Run 10000 scenarios by 500 scenarios::
+
+        >>> import modelx as mx
+        >>> from lifelib.montecarlo import run_batches, run_until, OPTION_PUT, MONTE_CARLO
+
+        >>> model = mx.read_model("CashValue_ME_EX4")
+        >>> stats = run_batches(model.Projection, 10000, 500)
+
+        >>> stats.result()
+        >>> stats.total()
+
+    Run 1024 Sobol scenarios with the control variate::
+
+        >>> model.Projection.scen_method = "sobol"
+        >>> stats = run_batches(model.Projection, 1024, 256, control=OPTION_PUT)
+
+    Run the scenarios of the simulation 5 of :mod:`~savings.CashValue_ME_EX2`
+    until the relative standard errors of the values of the guarantees
+    are 1% or less::
+
+        >>> model = mx.read_model("CashValue_ME_EX2")
+        >>> model.Projection.engine = "broadcast"
+        >>> stats = run_until(model.Projection, 0.01, 50000, 500,
+        ...                   outputs=MONTE_CARLO, params=(5,))
+
+        >>> stats.converged, stats.count
+        (True, 18500)
+
+        >>> stats.trace
+"""
+import contextlib
+import logging
+
+import numpy as np
+import pandas as pd
+
+from lifelib.export import column_name
+
+#: Default outputs of :func:`run_batches`.
+#: ``('pv_claims_over_av', 'MATURITY')`` is the value of the guaranteed
+#: maturity benefit, to be compared with
+#: :func:`~savings.CashValue_ME_EX4.Projection.formula_option_put`.
+OUTPUTS = ('pv_net_cf', 'pv_claims', ('pv_claims_over_av', 'MATURITY'))
+
+#: Names of the Cells of the control variate and its expected values
+#: in :mod:`~savings.CashValue_ME_EX2` and :mod:`~savings.CashValue_ME_EX4`
+OPTION_PUT = ('option_put_payoff', 'option_put_value')
+
+#: Values of :attr:`~savings.CashValue_ME_EX4.Projection.scen_method`
+METHODS = ('plain', 'antithetic', 'sobol')
+
+#: Outputs for the columns of
+#: :func:`~savings.CashValue_ME_EX2.Projection.monte_carlo`,
+#: i.e. the values of the guaranteed death and maturity benefits
+#: and the present values of the fees
+MONTE_CARLO = (('pv_claims_over_av', 'DEATH'),
+               ('pv_claims_over_av', 'MATURITY'),
+               'pv_maint_fee')
+
+logger = logging.getLogger(__name__)
+
+
+class _Moments:
+    # Welford's online algorithm, extended to the covariances
+    # with a control variate
+
+    def __init__(self, size):
+        self.mean = np.zeros(size)
+        self.m2 = np.zeros(size)
+        self.control_mean = np.zeros(size)
+        self.control_m2 = np.zeros(size)
+        self.cov = np.zeros(size)
+
+    def add(self, count, x, c=None):
+        delta = x - self.mean
+        self.mean += delta / count
+        self.m2 += delta * (x - self.mean)
+
+        if c is not None:
+            c_delta = c - self.control_mean
+            self.control_mean += c_delta / count
+            self.control_m2 += c_delta * (c - self.control_mean)
+            self.cov += delta * (c - self.control_mean)
+
+    def estimate(self, count, expected=None):
+        if expected is None:
+            if count < 2:
+                return self.mean, np.full_like(self.mean, np.nan)
+            return self.mean, np.sqrt(self.m2 / (count - 1) / count)
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            beta = np.where(self.control_m2 > 0,
+                            self.cov / self.control_m2, 0)
+        mean = self.mean - beta * (self.control_mean - expected)
+        if count < 3:
+            return mean, np.full_like(mean, np.nan)
+
+        resid = np.maximum(self.m2 - beta * self.cov, 0)
+        return mean, np.sqrt(resid / (count - 2) / count)
+
+
+class ScenarioStats:
+    """Means and standard errors of outputs across scenarios
+
+    Accumulates the values of outputs by model point and their totals
+    over the model points scenario by scenario,
+    by Welford's online algorithm.
+
+    If ``block_size`` is greater than 1, the values are first averaged
+    over each block of ``block_size`` scenarios, and
+    the standard errors are estimated from the means of the blocks.
+
+    If ``control`` is given, the means are adjusted by the control variate
+    and the standard errors are those of the adjusted means.
+    The coefficient of the control variate is estimated by output and
+    by model point from the same scenarios.
+
+    Args:
+        index(:obj:`~pandas.Index`): The model point IDs
+        names: The names of the outputs
+        block_size(:obj:`int`, optional): The number of scenarios
+            in each block of dependent scenarios. Defaults to 1.
+        control(optional): The expected values of the control variate
+            by model point as a 1D array. Defaults to ``None``.
+    """
+
+    def __init__(self, index, names, block_size=1, control=None):
+        self.index = index
+        self.names = list(names)
+        self.block_size = block_size
+        self.control = None if control is None else np.asarray(control)
+        self.count = 0
+        self.blocks = 0
+        self.moments = {name: _Moments(len(index)) for name in self.names}
+        self.total_moments = {name: _Moments(()) for name in self.names}
+
+    def _block_means(self, values):
+        size, scens = values.shape
+        if scens % self.block_size:
+            raise ValueError("the number of scenarios must be "
+                             "a multiple of block_size")
+        return values.reshape(
+            size, scens // self.block_size, self.block_size).mean(axis=2)
+
+    def add(self, values, control=None):
+        """Add the values of a batch of scenarios
+
+        Args:
+            values: Dict of 2D arrays keyed by the names of the outputs.
+                The rows of the arrays are the model points and
+                the columns are the scenarios.
+            control(optional): 2D array of the control variate
+                in the same shape as the arrays in ``values``.
+                Required if ``control`` is given to the constructor.
+        """
+        scens = values[self.names[0]].shape[1]
+        means = {name: self._block_means(values[name])
+                 for name in self.names}
+        totals = {name: self._block_means(values[name].sum(axis=0)[None, :])[0]
+                  for name in self.names}
+
+        if self.control is not None:
+            c_means = self._block_means(control)
+            c_totals = self._block_means(control.sum(axis=0)[None, :])[0]
+
+        for j in range(scens // self.block_size):
+            self.blocks += 1
+            for name in self.names:
+                if self.control is None:
+                    self.moments[name].add(self.blocks, means[name][:, j])
+                    self.total_moments[name].add(self.blocks, totals[name][j])
+                else:
+                    self.moments[name].add(
+                        self.blocks, means[name][:, j], c_means[:, j])
+                    self.total_moments[name].add(
+                        self.blocks, totals[name][j], c_totals[j])
+
+        self.count += scens
+
+    def estimate(self, name):
+        """Means and standard errors of an output by model point
+
+        Returns a tuple of two 1D arrays.
+        """
+        return self.moments[name].estimate(self.blocks, self.control)
+
+    def total_estimate(self, name):
+        """Mean and standard error of the total of an output
+
+        Returns a tuple of two floats.
+        """
+        mean, std_err = self.total_moments[name].estimate(
+            self.blocks, None if self.control is None else self.control.sum())
+        return float(mean), float(std_err)
+
+    def std_err(self, name):
+        """Standard errors of the means of an output by model point"""
+        return self.estimate(name)[1]
+
+    def total_std_err(self, name):
+        """Standard error of the mean of the total of an output"""
+        return self.total_estimate(name)[1]
+
+    def result(self):
+        """Means and standard errors by model point
+
+        Returns a DataFrame indexed by the model point IDs.
+        The columns are a MultiIndex of the output names and
+        ``'mean'`` or ``'std_err'``.
+        """
+        data = {}
+        for name in self.names:
+            data[(name, 'mean')], data[(name, 'std_err')] = self.estimate(name)
+
+        return pd.DataFrame(data, index=self.index)
+
+    def total(self):
+        """Means and standard errors of the totals over the model points
+
+        Returns a DataFrame indexed by the output names with
+        columns ``'mean'`` and ``'std_err'``.
+        """
+        return pd.DataFrame(
+            [self.total_estimate(n) for n in self.names],
+            columns=['mean', 'std_err'],
+            index=pd.Index(self.names, name='output'))
+
+
+def batch_values(space, outputs):
+    """Return the values of outputs for the current batch of scenarios
+
+    Returns a dict of 2D arrays keyed by the names given by
+    :func:`~lifelib.export.column_name`. The rows of the arrays
+    are the model points and the columns are the scenarios.
+
+    Args:
+        space: The space to run, such as ``Projection``.
+        outputs: Names of the Cells. A tuple of the name and
+            the arguments can be given in place of a name,
+            such as ``('pv_claims_over_av', 'MATURITY')``.
+    """
+    size = len(space.model_point_table_ext())
+    result = {}
+    for output in outputs:
+        name, args = (output, ()) if isinstance(output, str) else (
+            output[0], tuple(output[1:]))
+        value = np.asarray(getattr(space, name)(*args))
+        result[column_name(output)] = value.reshape(size, -1)
+
+    return result
+
+
+def block_size_of(space):
+    """Return the number of scenarios in a block of ``space``
+
+    Returns :func:`~savings.CashValue_ME_EX4.Projection.scen_block_size`
+    if ``space`` has it, otherwise 1.
+    """
+    if 'scen_block_size' in space.cells:
+        return space.scen_block_size()
+    return 1
+
+
+def iter_batches(space, scen_size=None, batch_size=1000, outputs=OUTPUTS,
+                 params=None, control=None):
+    """Run scenarios in batches and yield the statistics after each batch
+
+    A generator version of :func:`run_batches`.
+    Yields the same :class:`ScenarioStats` object
+    after adding each batch to it, or the empty object once
+    if ``scen_size`` is 0. The original
+    :attr:`~savings.CashValue_ME_EX4.Projection.scen_offset` and
+    :attr:`~savings.CashValue_ME_EX4.Projection.scen_size`
+    are restored when the generator is exhausted or closed.
+    See :func:`run_batches` for the parameters.
+    """
+    if batch_size < 1:
+        raise ValueError("batch_size must be a positive integer")
+
+    original = (space.scen_offset, space.scen_size)
+    if scen_size is None:
+        scen_size = original[1]
+
+    try:
+        target = space if params is None else space[params]
+        block_size = block_size_of(target)
+        if scen_size % block_size or batch_size % block_size:
+            raise ValueError(
+                "scen_size and batch_size must be multiples of %d" % block_size)
+
+        stats = ScenarioStats(
+            target.model_point_table_ext().index,
+            [column_name(o) for o in outputs], block_size,
+            None if control is None else getattr(target, control[1])())
+
+        if not scen_size:
+            yield stats
+
+        for start in range(0, scen_size, batch_size):
+            space.scen_offset = start
+            space.scen_size = min(batch_size, scen_size - start)
+            target = space if params is None else space[params]
+            if control is None:
+                stats.add(batch_values(target, outputs))
+            else:
+                stats.add(batch_values(target, outputs),
+                          batch_values(target, control[:1])[control[0]])
+            yield stats
+    finally:
+        space.scen_offset, space.scen_size = original
+
+
+def run_batches(space, scen_size=None, batch_size=1000, outputs=OUTPUTS,
+                params=None, control=None):
+    """Run scenarios in batches and accumulate the outputs
+
+    Runs the scenarios from 1 to ``scen_size`` of ``space``,
+    ``batch_size`` scenarios at a time,
+    and returns :class:`ScenarioStats` of ``outputs``.
+    Each batch is run by assigning
+    :attr:`~savings.CashValue_ME_EX4.Projection.scen_offset` and
+    :attr:`~savings.CashValue_ME_EX4.Projection.scen_size`, which
+    clears the values of the previous batch.
+    The original values of the two are restored afterwards.
+
+    ``scen_size`` and ``batch_size`` must be multiples of
+    the block size given by :func:`block_size_of`.
+
+    Args:
+        space: The space to run, such as ``Projection``.
+        scen_size(:obj:`int`, optional): The number of scenarios.
+            Defaults to :attr:`scen_size` of ``space``.
+        batch_size(:obj:`int`, optional): The number of scenarios
+            in each batch. Defaults to 1000.
+        outputs(optional): Names of the Cells to accumulate, as in
+            :func:`batch_values`. Defaults to :data:`OUTPUTS`.
+        params(:obj:`tuple`, optional): Arguments to ``space``
+            to select an item space, such as the simulation ID of
+            :mod:`~savings.CashValue_ME_EX2`.
+        control(optional): A pair of the names of the Cells of
+            a control variate and its expected values by model point,
+            such as :data:`OPTION_PUT`. Defaults to ``None``.
+    """
+    for stats in iter_batches(space, scen_size, batch_size, outputs,
+                              params, control):
+        pass
+
+    return stats
+
+
+def errors_of(stats, relative=True, by_point=False):
+    """Return the errors of the means of outputs
+
+    Returns a dict of the errors keyed by the output names.
+    The error of an output is the standard error of the mean of its total
+    over the model points, or the largest standard error of its means
+    by model point if ``by_point`` is ``True``.
+    If ``relative`` is ``True``, the standard errors are divided by
+    the absolute values of the means, and
+    the errors of the means that are 0 with no variance are 0.
+
+    Args:
+        stats(:class:`ScenarioStats`): The statistics of the outputs
+        relative(:obj:`bool`, optional): Whether to return
+            the relative errors. Defaults to ``True``.
+        by_point(:obj:`bool`, optional): Whether to return the errors
+            by model point instead of those of the totals.
+            Defaults to ``False``.
+    """
+    result = {}
+    for name in stats.names:
+        if by_point:
+            mean, std_err = stats.estimate(name)
+        else:
+            mean, std_err = map(np.asarray, stats.total_estimate(name))
+
+        if relative:
+            with np.errstate(divide='ignore', invalid='ignore'):
+                std_err = np.where(std_err == 0, 0, std_err / np.abs(mean))
+
+        result[name] = float(np.max(std_err))
+
+    return result
+
+
+def run_until(space, tol, max_scen_size, batch_size=1000, outputs=OUTPUTS,
+              params=None, control=None, relative=True, by_point=False,
+              min_blocks=10):
+    """Run scenarios in batches until the outputs converge
+
+    Runs the scenarios of ``space`` ``batch_size`` scenarios at a time
+    as :func:`run_batches` does, and after each batch,
+    checks the errors of the outputs given by :func:`errors_of`.
+    Stops when all the errors are ``tol`` or less, or
+    when ``max_scen_size`` scenarios have been run.
+    The errors are not checked until
+    ``min_blocks`` blocks of scenarios have been run, as
+    the standard errors estimated from fewer blocks are not reliable.
+
+    Returns :class:`ScenarioStats` with two additional attributes:
+
+    * ``converged``: ``True`` if the errors are within ``tol``,
+      ``False`` if ``max_scen_size`` is reached first.
+    * ``trace``: A DataFrame of the convergence trace indexed by
+      the number of scenarios run, with the columns of
+      the mean and the standard error of the total and the error of
+      each output.
+
+    Each row of the trace is also logged at the ``INFO`` level
+    by the logger named ``lifelib.montecarlo``.
+
+    Args:
+        space: The space to run, such as ``Projection``.
+        tol(:obj:`float`): Tolerance on the errors
+        max_scen_size(:obj:`int`): The maximum number of scenarios.
+            Must be a positive multiple of the block size
+            as in :func:`run_batches`.
+        batch_size(:obj:`int`, optional): The number of scenarios
+            in each batch. Defaults to 1000.
+        outputs(optional): Names of the Cells to check, as in
+            :func:`batch_values`. Defaults to :data:`OUTPUTS`.
+            :data:`MONTE_CARLO` checks the values in
+            :func:`~savings.CashValue_ME_EX2.Projection.monte_carlo`.
+        params(:obj:`tuple`, optional): Arguments to ``space``
+            to select an item space.
+        control(optional): A pair of the names of the Cells of
+            a control variate and its expected values,
+            such as :data:`OPTION_PUT`. Defaults to ``None``.
+        relative(:obj:`bool`, optional): Whether ``tol`` is on
+            the relative errors. Defaults to ``True``.
+        by_point(:obj:`bool`, optional): Whether ``tol`` is on
+            the errors by model point instead of those of the totals.
+            Defaults to ``False``.
+        min_blocks(:obj:`int`, optional): The number of blocks of
+            scenarios to run before checking the errors. Defaults to 10.
+    """
+    if max_scen_size < 1:
+        raise ValueError("max_scen_size must be a positive integer")
+
+    rows = []
+    converged = False
+    batches = iter_batches(space, max_scen_size, batch_size, outputs,
+                           params, control)
+
+    with contextlib.closing(batches):
+        for stats in batches:
+            errors = errors_of(stats, relative, by_point)
+            row = {'scen_size': stats.count}
+            for name in stats.names:
+                mean, std_err = stats.total_estimate(name)
+                row.update({(name, 'mean'): mean,
+                            (name, 'std_err'): std_err,
+                            (name, 'error'): errors[name]})
+            rows.append(row)
+
+            logger.info("%d scenarios: %s", stats.count, ", ".join(
+                "%s %.3g" % (name, errors[name]) for name in stats.names))
+
+            if (stats.blocks >= min_blocks
+                    and all(e <= tol for e in errors.values())):
+                converged = True
+                break
+
+    trace = pd.DataFrame(rows).set_index('scen_size')
+    trace.columns = pd.MultiIndex.from_tuples(trace.columns)
+
+    stats.converged = converged
+    stats.trace = trace
+    return stats
+
+
+def compare_methods(space, scen_size, batch_size=1000, outputs=OUTPUTS,
+                    params=None, control=OPTION_PUT, methods=METHODS):
+    """Compare the standard errors of variance reduction methods
+
+    Runs :func:`run_batches` for each method in ``methods``
+    assigned to :attr:`~savings.CashValue_ME_EX4.Projection.scen_method`,
+    without and with ``control`` if ``control`` is given.
+    Returns a DataFrame of the means and the standard errors of
+    the totals of ``outputs``, indexed by the method, whether
+    the control variate is used and the output.
+    The column ``efficiency`` is the squared ratio of the standard error
+    of the plain method without the control variate
+    to the standard error of each method, which estimates how many times
+    as many scenarios the plain method needs for the same accuracy.
+    :attr:`~savings.CashValue_ME_EX4.Projection.scen_method`
+    is restored afterwards.
+
+    Args:
+        space: The space to run, such as ``Projection``.
+        scen_size(:obj:`int`): The number of scenarios
+        batch_size(:obj:`int`, optional): The number of scenarios
+            in each batch. Defaults to 1000.
+        outputs(optional): Names of the Cells to accumulate.
+            Defaults to :data:`OUTPUTS`.
+        params(:obj:`tuple`, optional): Arguments to ``space``
+            to select an item space.
+        control(optional): A pair of the names of the Cells of
+            a control variate and its expected values.
+            Defaults to :data:`OPTION_PUT`.
+        methods(optional): Values of
+            :attr:`~savings.CashValue_ME_EX4.Projection.scen_method`.
+            Defaults to :data:`METHODS`.
+    """
+    original = space.scen_method
+    results = []
+    try:
+        for method in methods:
+            space.scen_method = method
+            for cv in ([None] if control is None else [None, control]):
+                total = run_batches(space, scen_size, batch_size, outputs,
+                                    params, cv).total()
+                total.index = pd.MultiIndex.from_product(
+                    [[method], [cv is not None], total.index],
+                    names=['method', 'control', 'output'])
+                results.append(total)
+    finally:
+        space.scen_method = original
+
+    result = pd.concat(results)
+    base = result.loc[(methods[0], False), 'std_err']
+    result['efficiency'] = (
+        base.reindex(result.index.get_level_values('output')).to_numpy()
+        / result['std_err']) ** 2
+
+    return result
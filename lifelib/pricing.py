@@ -0,0 +1,150 @@
+"""Pricing of new business with a model kept in memory
+
+:class:`PricingService` reads :mod:`~basiclife.BasicTermASL_ME` once and
+calculates the premiums of batches of new business model points
+in :mod:`~basiclife.BasicTermASL_ME.Pricing` one after another.
+The model points are replaced batch by batch, while the values
+that depend only on the projection steps, such as
+:func:`~basiclife.BasicTermASL_ME.Base.step_calendar`,
+:func:`~basiclife.BasicTermASL_ME.Base.mort_table_array` and
+:func:`~basiclife.BasicTermASL_ME.Base.disc_factors`, are read from
+:mod:`~basiclife.BasicTermASL_ME.Projection`, where they are calculated
+once when the service starts and kept afterwards.
+The numbers of policies are calculated by the ``"array"``
+:attr:`~basiclife.BasicTermASL_ME.Base.engine` in
+:mod:`~basiclife.BasicTermASL_ME.Pricing`,
+so a batch of a few model points is priced in milliseconds.
+
+Example:
+    Price model points as they arrive::
+
+        >>> from lifelib.pricing import PricingService
+
+        >>> service = PricingService()
+
+        >>> service.price([
+        ...     {"age_at_entry": 30, "policy_term": 10,
+        ...      "sum_assured": 500000, "payment_freq": 12, "payment_term": 10},
+        ...     {"age_at_entry": 45, "policy_term": 20,
+        ...      "sum_assured": 800000, "payment_freq": 1, "payment_term": 15}])
+        policy_id
+        1      32.34
+        2    2335.15
+        Name: sum_assured, dtype: float64
+
+        >>> service.close()
+"""
+import os.path
+
+import modelx as mx
+import pandas as pd
+
+from lifelib._dirs import TEMPLATES
+
+#: Columns of model points required by :meth:`PricingService.price`
+COLUMNS = ('age_at_entry', 'policy_term', 'sum_assured',
+           'payment_freq', 'payment_term')
+
+
+class PricingService:
+    """Calculate premiums of new business with a model kept in memory
+
+    Reads the model if ``model`` is not a model object,
+    assigns ``engine`` to
+    :attr:`~basiclife.BasicTermASL_ME.Base.engine` in ``Pricing``,
+    and calculates the values that
+    :mod:`~basiclife.BasicTermASL_ME.Pricing` reads from
+    :mod:`~basiclife.BasicTermASL_ME.Projection`,
+    so that the first call of :meth:`price` is as fast as the rest.
+
+    While the service is used,
+    :attr:`~basiclife.BasicTermASL_ME.Base.model_point_table`
+    in ``Pricing`` is the last batch priced, so
+    :mod:`~basiclife.BasicTermASL_ME.Projection`
+    should not be calculated with the model until :meth:`close` restores
+    the original table.
+
+    Args:
+        model(optional): The path to :mod:`~basiclife.BasicTermASL_ME`
+            or the model object. Defaults to the model in lifelib.
+        engine(:obj:`str`, optional): The engine to calculate
+            the numbers of policies. Defaults to ``"array"``.
+    """
+
+    def __init__(self, model=None, engine="array"):
+        if model is None:
+            model = os.path.join(TEMPLATES['basiclife'], 'BasicTermASL_ME')
+
+        self.owns_model = isinstance(model, str)
+        self.model = mx.read_model(model) if self.owns_model else model
+        self.space = self.model.Pricing
+        self.table = self.space.model_point_table
+        self.engine = self.space.engine
+        self.inherited = {
+            name: self.is_derived(name)
+            for name in ('model_point_table', 'engine')}
+        self.space.engine = engine
+        self.warm_up()
+
+    def is_derived(self, name):
+        """Check if ``Pricing`` inherits the reference ``name``"""
+        return self.space._get_object(name, as_proxy=True).is_derived()
+
+    def warm_up(self):
+        """Calculate the values shared with ``Projection``"""
+        proj = self.model.Projection
+        calendar = proj.step_calendar()
+        proj.mort_table_array()
+        proj.disc_factors()
+        for i in range(len(calendar)):
+            proj.disc_rate(i)
+
+    def price(self, model_points):
+        """Calculate premiums per policy of model points
+
+        Returns a Series of
+        :func:`~basiclife.BasicTermASL_ME.Pricing.premium_pp`
+        indexed by the model point IDs.
+
+        Args:
+            model_points: Model points as a DataFrame or
+                a list of dicts with the columns in :data:`COLUMNS`.
+                Other columns, such as ``issue_date``, are not used.
+                ``policy_count`` is 1 if omitted.
+                The index of a DataFrame is used as the model point IDs.
+                If a list is given, the IDs are numbered from 1.
+        """
+        if isinstance(model_points, pd.DataFrame):
+            table = model_points
+        else:
+            table = pd.DataFrame(list(model_points))
+            table.index = pd.RangeIndex(
+                1, len(table) + 1, name=self.table.index.name)
+
+        missing = [c for c in COLUMNS if c not in table.columns]
+        if missing:
+            raise ValueError("missing columns: %s" % ", ".join(missing))
+
+        if 'policy_count' not in table.columns:
+            table = table.assign(policy_count=1)
+
+        self.space.model_point_table = table
+        return self.space.premium_pp()
+
+    def close(self):
+        """Close the model if it was read by the service
+
+        Otherwise, restores the original model points and engine.
+        The references that ``Pricing`` inherited when the service
+        started are deleted from ``Pricing``, so that it inherits
+        them from :mod:`~basiclife.BasicTermASL_ME.Base` again.
+        """
+        if self.owns_model:
+            self.model.close()
+        else:
+            for name, value in (('model_point_table', self.table),
+                                ('engine', self.engine)):
+                if not self.inherited[name]:
+                    setattr(self.space, name, value)
+                elif not self.is_derived(name):
+                    delattr(self.space, name)
@@ -0,0 +1,435 @@
+"""Functions to run lifelib models on large portfolios
+
+The functions in this module run the ``Projection`` spaces of
+the models that take all the model points at once, such as
+:mod:`~basiclife.BasicTerm_ME`, :mod:`~basiclife.BasicTermASL_ME` and
+:mod:`~savings.CashValue_ME`, by replacing :attr:`model_point_table`
+with subsets of the model points and combining the results.
+:func:`run_chunked` runs the subsets one by one in the current process,
+while :func:`run_parallel` runs them in multiple worker processes.
+:func:`run_seriatim` runs the models that take one model point at a time,
+such as :mod:`~basiclife.BasicTerm_S` and :mod:`~basiclife.BasicTerm_SE`,
+on many model points.
+:func:`write_mmap_table` and :func:`read_mmap_table` save and load
+model points as memory-mapped arrays to be shared by the workers.
+"""
+import json
+import math
+import os
+import os.path
+from concurrent.futures import ProcessPoolExecutor
+
+import modelx as mx
+import numpy as np
+import pandas as pd
+
+import lifelib.cache
+
+PV_RESULTS = ('result_pv',)
+SUM_RESULTS = ('result_cf', 'result_pols')
+
+
+def iter_chunks(table, chunk_size):
+    """Split a DataFrame into chunks of rows
+
+    Args:
+        table(:obj:`~pandas.DataFrame`): DataFrame to split
+        chunk_size(:obj:`int`): The maximum number of rows in each chunk
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be a positive integer")
+
+    for start in range(0, len(table), chunk_size):
+        yield table.iloc[start:start + chunk_size]
+
+
+def table_space_of(space):
+    """Return the space that defines :attr:`model_point_table`
+
+    Returns ``space`` if it has no base space. Otherwise
+    follows the first base spaces up to the space
+    that has no base space, such as ``Base`` in
+    :mod:`~basiclife.BasicTermASL_ME`.
+    """
+    while space.bases:
+        space = space.bases[0]
+    return space
+
+
+def combine_results(results):
+    """Combine the results of model point chunks
+
+    Concatenates the DataFrames of :data:`PV_RESULTS` and
+    sums the DataFrames of :data:`SUM_RESULTS` by their index.
+    The results for time indexes beyond the projection length of
+    a chunk are treated as 0.
+    If ``results`` is empty, such as when there are no model points,
+    the combined results are empty DataFrames.
+
+    Args:
+        results: Iterable of dicts keyed with the names of the result Cells.
+    """
+    pvs = {name: [] for name in PV_RESULTS}
+    sums = dict.fromkeys(SUM_RESULTS)
+
+    for result in results:
+        for name in PV_RESULTS:
+            pvs[name].append(result[name])
+        for name in SUM_RESULTS:
+            if sums[name] is None:
+                sums[name] = result[name]
+            else:
+                sums[name] = sums[name].add(result[name], fill_value=0)
+
+    combined = {name: pd.concat(pvs[name]) if pvs[name] else pd.DataFrame()
+                for name in PV_RESULTS}
+    combined.update({name: pd.DataFrame() if value is None else value
+                     for name, value in sums.items()})
+    return combined
+
+
+def run_chunk(space, chunk, table_space=None, params=None):
+    """Run a space on a subset of model points
+
+    Assigns ``chunk`` to :attr:`model_point_table` and
+    returns a dict of the results of ``space``.
+    The original :attr:`model_point_table` is restored afterwards.
+    If ``params`` is given, the results are read from
+    the item space ``space[params]``, such as
+    ``Projection[1.5, 1]`` in :mod:`~cluster.BasicTerm_ME_for_Cluster`.
+
+    Args:
+        space: The space to run, such as ``Projection``.
+        chunk(:obj:`~pandas.DataFrame`): Model points in the same format as
+            :attr:`model_point_table`
+        table_space(optional): The space that defines
+            :attr:`model_point_table`.
+            Defaults to the value returned by :func:`table_space_of`.
+        params(:obj:`tuple`, optional): Arguments to ``space``
+            to select an item space.
+    """
+    if table_space is None:
+        table_space = table_space_of(space)
+
+    original = table_space.model_point_table
+    table_space.model_point_table = chunk
+    try:
+        # Item spaces are recreated after model_point_table is replaced
+        target = space if params is None else space[params]
+        return {name: getattr(target, name)()
+                for name in PV_RESULTS + SUM_RESULTS}
+    finally:
+        table_space.model_point_table = original
+
+
+def run_chunked(space, chunks, table_space=None, params=None):
+    """Run a space on model points chunk by chunk
+
+    Runs ``space`` on each chunk of model points in turn and
+    returns a dict of the combined results keyed with
+    ``'result_pv'``, ``'result_cf'`` and ``'result_pols'``.
+    ``'result_pv'`` is the concatenation of the chunks' results,
+    while ``'result_cf'`` and ``'result_pols'`` are the sums.
+    Since the values of the Cells are cleared every time
+    :attr:`model_point_table` is replaced, the peak memory
+    is bounded by the size of the largest chunk.
+
+    ``chunks`` is either an integer or an iterable of DataFrames.
+    If an integer is given, the :attr:`model_point_table` of
+    the model is split into chunks of that number of rows.
+    To run model points that do not fit in memory,
+    an iterable reading chunks lazily can be passed,
+    such as the reader returned by :func:`pandas.read_csv`
+    with ``chunksize`` specified.
+
+    Example:
+        Run :mod:`~basiclife.BasicTerm_ME` by 1000 model points::
+
+            >>> import modelx as mx
+            >>> from lifelib.runner import run_chunked
+
+            >>> model = mx.read_model("BasicTerm_ME")
+            >>> result = run_chunked(model.Projection, 1000)
+            >>> result['result_pv']
+
+    Args:
+        space: The space to run, such as ``Projection``.
+        chunks: Chunk size as :obj:`int` or iterable of
+            :obj:`~pandas.DataFrame` in the same format as
+            :attr:`model_point_table`.
+        table_space(optional): The space that defines
+            :attr:`model_point_table`.
+            Defaults to the value returned by :func:`table_space_of`.
+        params(:obj:`tuple`, optional): Arguments to ``space``
+            to select an item space.
+    """
+    if table_space is None:
+        table_space = table_space_of(space)
+
+    if isinstance(chunks, int):
+        chunks = iter_chunks(table_space.model_point_table, chunks)
+
+    return combine_results(
+        run_chunk(space, chunk, table_space, params) for chunk in chunks)
+
+
+def run_seriatim(space, point_ids=None, results=('pv_net_cf',)):
+    """Run a seriatim model on model points one by one
+
+    Runs the models that take one model point at a time
+    in the item spaces of ``space``, such as
+    :mod:`~basiclife.BasicTerm_S` and :mod:`~basiclife.BasicTerm_SE`,
+    on the model points whose IDs are ``point_ids``,
+    and returns a dict of the results keyed with the names in ``results``.
+
+    For each model point, the Cells named in ``results`` are called
+    on the item space ``space[point_id]``, and the item space is
+    deleted as soon as the values are taken, unless
+    it had existed before. Since the item spaces
+    and the values of their Cells are not kept,
+    the memory used and the time taken per model point
+    do not grow with the number of model points.
+
+    Scalar results, such as the values of ``pv_net_cf``, are combined into
+    a Series indexed by the IDs. DataFrame results, such as
+    the values of ``result_cf``, are summed by their index.
+    The values are treated as 0 for indexes beyond
+    the projection length of a model point.
+
+    Example:
+        Run :mod:`~basiclife.BasicTerm_SE` on all the model points::
+
+            >>> import modelx as mx
+            >>> from lifelib.runner import run_seriatim
+
+            >>> model = mx.read_model("BasicTerm_SE")
+            >>> result = run_seriatim(
+            ...     model.Projection, results=['pv_net_cf', 'result_cf'])
+            >>> result['pv_net_cf']
+
+    Args:
+        space: The space to run, such as ``Projection``.
+        point_ids(optional): IDs of the model points to run.
+            Defaults to the index of :attr:`model_point_table`.
+        results(optional): Names of the Cells to take the results from.
+            Defaults to ``('pv_net_cf',)``.
+    """
+    if point_ids is None:
+        point_ids = table_space_of(space).model_point_table.index
+
+    values = {name: [] for name in results}
+    sums = dict.fromkeys(results)
+    ids = []
+
+    for point_id in point_ids:
+        existed = point_id in space.itemspaces
+        item = space[point_id]
+        for name in results:
+            value = getattr(item, name)()
+            if isinstance(value, pd.DataFrame):
+                if sums[name] is None:
+                    sums[name] = value
+                else:
+                    sums[name] = sums[name].add(value, fill_value=0)
+            else:
+                values[name].append(value)
+        ids.append(point_id)
+
+        if not existed:
+            del space[point_id]
+
+    index = pd.Index(
+        ids, name=table_space_of(space).model_point_table.index.name)
+    return {name: (pd.Series(values[name], index=index, name=name)
+                   if sums[name] is None else sums[name])
+            for name in results}
+
+
+def write_mmap_table(table, path):
+    """Save a model point table as memory-mappable arrays
+
+    Saves the index and the columns of ``table``
+    in separate `.npy` files in the folder ``path``,
+    so that :func:`read_mmap_table` can load them
+    as memory-mapped arrays.
+    Columns of strings, such as ``sex``, are saved as integer codes
+    and the strings are saved in *table.json* in the folder.
+
+    Args:
+        table(:obj:`~pandas.DataFrame`): Model points to save
+        path(:obj:`str`): Path to the folder to save the files
+    """
+    os.makedirs(path, exist_ok=True)
+
+    np.save(os.path.join(path, "index.npy"), table.index.to_numpy())
+    columns = []
+    for i, name in enumerate(table.columns):
+        values = table[name].to_numpy()
+        if values.dtype == object:
+            values, labels = pd.factorize(values)
+            labels = [str(label) for label in labels]
+        else:
+            labels = None
+        np.save(os.path.join(path, "column%d.npy" % i), values)
+        columns.append({"name": name, "labels": labels})
+
+    with open(os.path.join(path, "table.json"), "w") as f:
+        json.dump({"index": table.index.name, "columns": columns}, f)
+
+
+def read_mmap_table(path):
+    """Load a model point table saved by :func:`write_mmap_table`
+
+    Returns a DataFrame whose index and numeric and date columns are
+    backed by read-only memory-mapped arrays.
+    Multiple processes reading the same files share the data
+    through the operating system's page cache
+    instead of each holding its own copy.
+    Columns of strings are reconstructed in memory
+    from the integer codes.
+
+    Args:
+        path(:obj:`str`): Path to the folder the files are saved in
+    """
+    with open(os.path.join(path, "table.json")) as f:
+        meta = json.load(f)
+
+    def load(filename):
+        # np.asarray returns a plain ndarray viewing the memory map
+        return np.asarray(
+            np.load(os.path.join(path, filename), mmap_mode="r"))
+
+    data = {}
+    for i, column in enumerate(meta["columns"]):
+        values = load("column%d.npy" % i)
+        if column["labels"] is not None:
+            values = np.asarray(column["labels"], dtype=object)[values]
+        data[column["name"]] = values
+
+    index = pd.Index(load("index.npy"), name=meta["index"], copy=False)
+    return pd.DataFrame(data, index=index, copy=False)
+
+
+# Worker process state set by _init_worker
+_worker = {}
+
+
+def _init_worker(path, space, params, cache, mmap_path):
+    if cache:
+        model = lifelib.cache.read_model(path)
+    else:
+        model = mx.read_model(path)
+
+    _worker['space'] = model.spaces[space]
+    _worker['params'] = params
+
+    if mmap_path is not None:
+        # update_pandas releases the table read from the source file
+        model.update_pandas(
+            table_space_of(_worker['space']).model_point_table,
+            read_mmap_table(mmap_path))
+
+
+def _worker_table_len():
+    return len(table_space_of(_worker['space']).model_point_table)
+
+
+def _run_rows(rows):
+    space = _worker['space']
+    table = table_space_of(space).model_point_table
+    return run_chunk(space, table.iloc[rows[0]:rows[1]],
+                     params=_worker['params'])
+
+
+def _run_table(chunk):
+    return run_chunk(_worker['space'], chunk, params=_worker['params'])
+
+
+def run_parallel(path, processes=None, chunks=None,
+                 space='Projection', params=None,
+                 cache=False, mmap_path=None):
+    """Run a model on model point shards in multiple processes
+
+    Starts ``processes`` worker processes, each of which reads
+    its own instance of the model saved in ``path``,
+    and distributes shards of model points to the workers.
+    The results of the shards are combined in the order of
+    the shards as in :func:`run_chunked`, so the results do not depend
+    on the order in which the shards complete.
+
+    ``chunks`` specifies the shards. If omitted,
+    :attr:`model_point_table` of the model is split into ``processes``
+    shards of about the same size. If an integer is given,
+    :attr:`model_point_table` is split into shards of that number of rows.
+    In these cases, the workers take the shards out of their own
+    :attr:`model_point_table`, so no model points are passed
+    between the processes.
+    Otherwise, ``chunks`` should be an iterable of DataFrames
+    in the same format as :attr:`model_point_table`,
+    and each DataFrame is passed to a worker.
+
+    Each worker holds the entire :attr:`model_point_table` of its model.
+    To reduce the memory used by the workers, save the model points
+    by :func:`write_mmap_table` and pass the folder as ``mmap_path``.
+    The workers then replace :attr:`model_point_table`
+    with the memory-mapped table read by :func:`read_mmap_table`,
+    and share the same data in memory.
+    If ``cache`` is ``True``, the workers read the model by
+    :func:`lifelib.cache.read_model` to skip parsing Excel input files.
+
+    Example:
+        Run :mod:`~basiclife.BasicTerm_ME` in 8 processes::
+
+            >>> from lifelib.runner import run_parallel
+
+            >>> if __name__ == "__main__":
+            ...     result = run_parallel("BasicTerm_ME", processes=8)
+
+        Share the model points of :mod:`~savings.CashValue_ME`
+        among the workers::
+
+            >>> import modelx as mx
+            >>> from lifelib.runner import write_mmap_table
+
+            >>> model = mx.read_model("CashValue_ME")
+            >>> write_mmap_table(model.Projection.model_point_table, "mp")
+            >>> model.close()
+
+            >>> if __name__ == "__main__":
+            ...     result = run_parallel(
+            ...         "CashValue_ME", processes=8, cache=True, mmap_path="mp")
+
+    Args:
+        path(:obj:`str`): Path to the model folder.
+        processes(:obj:`int`, optional): The number of worker processes.
+            Defaults to the number of CPUs.
+        chunks(optional): Shard size as :obj:`int` or iterable of
+            :obj:`~pandas.DataFrame`.
+        space(:obj:`str`, optional): The name of the space to run.
+            Defaults to ``'Projection'``.
+        params(:obj:`tuple`, optional): Arguments to the space
+            to select an item space.
+        cache(:obj:`bool`, optional): Whether to read the model
+            using the cache of Excel input files. Defaults to ``False``.
+        mmap_path(:obj:`str`, optional): Path to the folder
+            the model points are saved in by :func:`write_mmap_table`.
+    """
+    if processes is None:
+        processes = os.cpu_count()
+
+    with ProcessPoolExecutor(max_workers=processes,
+                             initializer=_init_worker,
+                             initargs=(path, space, params,
+                                       cache, mmap_path)) as executor:
+
+        if chunks is None or isinstance(chunks, int):
+            size = executor.submit(_worker_table_len).result()
+            if chunks is None:
+                chunks = max(math.ceil(size / processes), 1)
+            rows = [(start, start + chunks)
+                    for start in range(0, size, chunks)]
+            results = executor.map(_run_rows, rows)
+        else:
+            results = executor.map(_run_table, chunks)
+
+        return combine_results(results)
@@ -0,0 +1,164 @@
+"""Step grid selection for adjustable step length models
+
+In :mod:`~basiclife.BasicTermASL_ME`, the projection steps are
+monthly for the first :attr:`~basiclife.BasicTermASL_ME.Base.monthly_steps`
+steps and :attr:`~basiclife.BasicTermASL_ME.Base.coarse_months`
+months long after that.
+Coarser steps reduce the number of steps to calculate,
+at the cost of approximating the cashflows within each step.
+
+:func:`step_errors` runs the model on candidate step grids and
+measures the errors in :func:`~basiclife.BasicTermASL_ME.Base.pv_net_cf`
+against a run with monthly steps only.
+:func:`choose_steps` chooses the grid with the fewest steps
+whose error is within a given tolerance.
+
+Example:
+    Choose the step grid on 500 model points and
+    apply it to the model::
+
+        >>> import modelx as mx
+        >>> from lifelib.steps import choose_steps
+
+        >>> model = mx.read_model("BasicTermASL_ME")
+        >>> table = model.Base.model_point_table
+        >>> grid, errors = choose_steps(
+        ...     model.Projection, 0.005, table=table.sample(500, random_state=0))
+
+        >>> grid
+        (0, 6)
+"""
+import pandas as pd
+
+from lifelib.runner import table_space_of
+
+#: Candidate step grids as pairs of
+#: :attr:`~basiclife.BasicTermASL_ME.Base.monthly_steps` and
+#: :attr:`~basiclife.BasicTermASL_ME.Base.coarse_months`.
+CANDIDATES = (
+    (0, 12), (12, 12), (24, 12), (60, 12),
+    (0, 6), (12, 6), (24, 6), (60, 6),
+    (0, 3), (12, 3), (24, 3), (60, 3)
+)
+
+
+def set_steps(space, monthly_steps, coarse_months):
+    """Set the step grid of a model
+
+    Assigns ``monthly_steps`` and ``coarse_months`` to
+    :attr:`~basiclife.BasicTermASL_ME.Base.monthly_steps` and
+    :attr:`~basiclife.BasicTermASL_ME.Base.coarse_months`
+    in the base space of ``space``.
+    """
+    base = table_space_of(space)
+    base.monthly_steps = monthly_steps
+    base.coarse_months = coarse_months
+
+
+def monthly_grid(space):
+    """Return the step grid with monthly steps only
+
+    Returns the pair of ``monthly_steps`` and ``coarse_months``
+    such that all the steps covered by
+    :func:`~basiclife.BasicTermASL_ME.Base.step_calendar`
+    of ``space`` are monthly.
+    """
+    return int(max(space.proj_len())) + 12, 12
+
+
+def step_errors(space, candidates=CANDIDATES, table=None):
+    """Measure the errors of step grids
+
+    Runs ``space`` on each of the step grids in ``candidates`` and
+    on the grid returned by :func:`monthly_grid`, and
+    returns a DataFrame indexed by ``monthly_steps`` and ``coarse_months``
+    with the following columns:
+
+    * ``steps``: The number of steps,
+      i.e. :func:`~basiclife.BasicTermASL_ME.Base.max_proj_len`
+    * ``pv_net_cf``: The total of
+      :func:`~basiclife.BasicTermASL_ME.Base.pv_net_cf`
+    * ``error``: The absolute difference of ``pv_net_cf`` from
+      that of the monthly grid, relative to the latter
+    * ``max_abs_error``: The maximum absolute difference of
+      :func:`~basiclife.BasicTermASL_ME.Base.pv_net_cf`
+      from the monthly grid by model point
+
+    The rows are sorted by ``steps``, and the last row is
+    the monthly grid. The original grid and
+    :attr:`~basiclife.BasicTermASL_ME.Base.model_point_table` are restored
+    afterwards.
+
+    Args:
+        space: The space to run, such as ``Projection``.
+        candidates(optional): Pairs of ``monthly_steps`` and
+            ``coarse_months``. Defaults to :data:`CANDIDATES`.
+        table(:obj:`~pandas.DataFrame`, optional): Model points to run
+            in place of :attr:`~basiclife.BasicTermASL_ME.Base.model_point_table`,
+            such as a sample of it.
+    """
+    base = table_space_of(space)
+    original = (base.monthly_steps, base.coarse_months,
+                base.model_point_table)
+
+    try:
+        if table is not None:
+            base.model_point_table = table
+
+        monthly = monthly_grid(space)
+        set_steps(space, *monthly)
+        expected = space.pv_net_cf()
+
+        rows = []
+        for grid in list(candidates) + [monthly]:
+            set_steps(space, *grid)
+            actual = space.pv_net_cf() if grid != monthly else expected
+            rows.append(list(grid) + [
+                space.max_proj_len(),
+                actual.sum(),
+                abs(actual.sum() - expected.sum()) / abs(expected.sum()),
+                abs(actual - expected).max()])
+    finally:
+        base.monthly_steps, base.coarse_months = original[:2]
+        if table is not None:
+            base.model_point_table = original[2]
+
+    result = pd.DataFrame(
+        rows, columns=['monthly_steps', 'coarse_months', 'steps',
+                       'pv_net_cf', 'error', 'max_abs_error'])
+    return result.sort_values('steps', kind='stable').set_index(
+        ['monthly_steps', 'coarse_months'])
+
+
+def choose_steps(space, tol, candidates=CANDIDATES, table=None, apply=True):
+    """Choose the coarsest step grid within a tolerance
+
+    Measures the errors of ``candidates`` by :func:`step_errors`
+    and chooses the grid with the fewest steps among those
+    whose ``error`` is not greater than ``tol``.
+    The grid returned by :func:`monthly_grid` is chosen
+    if no candidate is within the tolerance.
+
+    Returns a tuple of the chosen pair of ``monthly_steps`` and
+    ``coarse_months``, and the DataFrame
+    returned by :func:`step_errors` to report the errors.
+
+    Args:
+        space: The space to run, such as ``Projection``.
+        tol(:obj:`float`): Tolerance on the relative error of the total of
+            :func:`~basiclife.BasicTermASL_ME.Base.pv_net_cf`
+        candidates(optional): Pairs of ``monthly_steps`` and
+            ``coarse_months``. Defaults to :data:`CANDIDATES`.
+        table(:obj:`~pandas.DataFrame`, optional): Model points to
+            choose the grid on, such as a sample of
+            :attr:`~basiclife.BasicTermASL_ME.Base.model_point_table`.
+        apply(:obj:`bool`, optional): Whether to set the chosen grid
+            to the model by :func:`set_steps`. Defaults to ``True``.
+    """
+    errors = step_errors(space, candidates, table)
+    grid = errors.index[errors['error'] <= tol][0]
+
+    if apply:
+        set_steps(space, *grid)
+
+    return grid, errors
@@ -0,0 +1,316 @@
+import os.path
+
+import modelx as mx
+import numpy as np
+import pandas as pd
+import pytest
+
+from lifelib._dirs import TEMPLATES
+
+libpath = TEMPLATES['basiclife']
+
+
+@pytest.fixture(scope="module")
+def basicterm_me():
+    model = mx.read_model(os.path.join(libpath, 'BasicTerm_ME'))
+    yield model.Projection
+    model.close()
+
+
+@pytest.mark.parametrize("engine", ["array", "stream"])
+def test_basicterm_me_engine(basicterm_me, engine):
+    """Check all engines give the same results as the default"""
+
+    proj = basicterm_me
+    results = ['result_cf', 'result_pv', 'result_pols']
+
+    proj.engine = "cells"
+    expected = [getattr(proj, name)() for name in results]
+
+    proj.engine = engine
+    actual = [getattr(proj, name)() for name in results]
+    proj.engine = "cells"
+
+    for a, e in zip(actual, expected):
+        pd.testing.assert_frame_equal(a, e)
+
+
+def _lapse_rate_func():
+    return lambda dur: np.maximum(0.2 - 0.05 * dur, 0.01)
+
+
+def _mort_rate_func():
+    lookup, table = table_lookup(), mort_table_array()
+    return lambda x, dur: 2 * lookup(table, x, np.minimum(dur, 3))
+
+
+def _commission_rate_func():
+    return lambda dur: np.where(dur < 2, 0.5, 0.0)
+
+
+@pytest.mark.parametrize("engine", ["array", "stream"])
+def test_basicterm_me_engine_assumptions(basicterm_me, engine):
+    """Check changes to the assumptions are reflected in all engines"""
+
+    proj = basicterm_me
+    funcs = {'lapse_rate_func': _lapse_rate_func,
+             'mort_rate_func': _mort_rate_func,
+             'commission_rate_func': _commission_rate_func}
+    originals = {name: proj.cells[name].formula for name in funcs}
+    default = proj.result_pv()
+
+    try:
+        for name, func in funcs.items():
+            proj.cells[name].formula = func
+
+        proj.engine = "cells"
+        expected = proj.result_pv()
+        proj.engine = engine
+        actual = proj.result_pv()
+    finally:
+        proj.engine = "cells"
+        for name, formula in originals.items():
+            proj.cells[name].formula = formula
+
+    assert not np.allclose(expected.values, default.values)
+    pd.testing.assert_frame_equal(actual, expected)
+    pd.testing.assert_frame_equal(proj.result_pv(), default)
+
+
+def test_basicterm_me_mort_rate(basicterm_me):
+    """Check mort_rate gives the same rates as mort_table_reindexed"""
+
+    proj = basicterm_me
+    for t in range(0, proj.max_proj_len(), 12):
+        mi = pd.MultiIndex.from_arrays(
+            [proj.age(t), np.minimum(proj.duration(t), 5)])
+        expected = proj.mort_table_reindexed().reindex(
+            mi, fill_value=0).set_axis(proj.model_point().index)
+
+        pd.testing.assert_series_equal(
+            proj.mort_rate(t), expected, check_names=False)
+
+
+def test_basicterm_me_premium_pp(basicterm_me):
+    """Check premium_pp gives the same premiums as reindexing premium_table"""
+
+    proj = basicterm_me
+    mi = pd.MultiIndex.from_arrays([proj.age_at_entry(), proj.policy_term()])
+    rates = proj.premium_table.reindex(mi).set_axis(proj.model_point().index)
+
+    pd.testing.assert_series_equal(
+        proj.premium_pp(), np.around(proj.sum_assured() * rates, 2))
+
+
+def test_basicterm_se_premium_pp():
+    """Check premium_pp looks up premium_table within its bounds"""
+
+    model = mx.read_model(os.path.join(libpath, 'BasicTerm_SE'))
+    proj = model.Projection
+
+    for i in (1, 2, 3):
+        item = proj[i]
+        assert item.premium_pp() == round(
+            item.sum_assured()
+            * proj.premium_table[item.age_at_entry(), item.policy_term()], 2)
+
+    # Pairs out of premium_table_array result in NaN instead of
+    # an IndexError or an element counted from the end of the array.
+    table = proj.model_point_table.copy()
+    table.loc[1, 'age_at_entry'] = 70
+    table.loc[2, 'policy_term'] = -10
+    proj.model_point_table = table
+
+    assert np.isnan(proj[1].premium_pp())
+    assert np.isnan(proj[2].premium_pp())
+
+    model.close()
+
+
+def test_basicterm_se_engine():
+    """Check the scalar engine gives the same present values as the cells"""
+
+    model = mx.read_model(os.path.join(libpath, 'BasicTerm_SE'))
+    proj = model.Projection
+    point_ids = list(range(1, 101)) + [581]
+
+    expected = [proj[i].result_pv() for i in point_ids]
+
+    proj.engine = "scalar"
+    for i, e in zip(point_ids, expected):
+        pd.testing.assert_frame_equal(proj[i].result_pv(), e)
+        assert len(proj[i].pols_if_at) == 0
+
+    model.close()
+
+
+def _se_lapse_rate_func():
+    return lambda dur: max(0.2 - 0.05 * dur, 0.01)
+
+
+def _se_mort_rate_func():
+    lookup, table = table_lookup(), mort_table_array()
+    return lambda x, dur: 2 * lookup(table, x, min(3, dur))
+
+
+def _se_commission_rate_func():
+    return lambda dur: 0.5 if dur < 2 else 0
+
+
+def test_basicterm_se_engine_assumptions():
+    """Check changes to the assumptions are reflected in the scalar engine"""
+
+    model = mx.read_model(os.path.join(libpath, 'BasicTerm_SE'))
+    proj = model.Projection
+    point_ids = [1, 2, 3, 581]
+    default = [proj[i].result_pv() for i in point_ids]
+
+    proj.lapse_rate_func.formula = _se_lapse_rate_func
+    proj.mort_rate_func.formula = _se_mort_rate_func
+    proj.commission_rate_func.formula = _se_commission_rate_func
+    expected = [proj[i].result_pv() for i in point_ids]
+
+    proj.engine = "scalar"
+    for i, d, e in zip(point_ids, default, expected):
+        assert not np.allclose(e.values, d.values)
+        pd.testing.assert_frame_equal(proj[i].result_pv(), e)
+
+    model.close()
+
+
+@pytest.fixture(scope="module")
+def basicterm_asl():
+    model = mx.read_model(os.path.join(libpath, 'BasicTermASL_ME'))
+    yield model.Projection
+    model.close()
+
+
+@pytest.mark.parametrize("monthly", [False, True])
+def test_basicterm_asl_step_calendar(basicterm_asl, monthly):
+    """Check step_calendar against dates calculated step by step"""
+
+    proj = basicterm_asl
+    offset = proj.offset.formula
+    if monthly:
+        proj.offset.formula = lambda i: pd.offsets.MonthEnd(1)
+
+    try:
+        cal = proj.step_calendar()
+        assert cal["months_"].iat[-1] >= max(proj.proj_len()) + 12
+
+        date = pd.Timestamp(proj.date_init)
+        months = 0
+        for i in range(len(cal) + 3):
+            assert proj.date_(i) == date
+            assert proj.months_(i) == proj.step_to_month(i) == months
+            step = proj.months_in_step(i)
+            assert proj.month_to_step(months) == i
+            assert proj.month_to_step(months + 1) == i + 1
+            date += proj.offset(i)
+            months += step
+
+        if monthly:
+            assert proj.max_proj_len() == max(proj.proj_len())
+    finally:
+        proj.offset.formula = offset
+
+
+@pytest.mark.parametrize("freq_id", ["ANV", "PREM"])
+def test_basicterm_asl_anniversary(basicterm_asl, freq_id):
+    """Check anniversaries against Period based calculation"""
+
+    proj = basicterm_asl
+    iss = proj.issue_date()
+    freq = 1 if freq_id == 'ANV' else proj.payment_freq()
+
+    for i in range(proj.max_proj_len()):
+        date = proj.date_(i)
+        diff_m = (date.year - iss.dt.year) * 12 + date.month - iss.dt.month
+        offset_m = (12 // freq) - (diff_m % (12 // freq))
+        m = (date.to_period('M') + offset_m).astype('Period[M]')
+        d = np.minimum(iss.dt.day, m.dt.days_in_month)
+        anv = (m.dt.to_timestamp().dt.to_period('D') - 1 + d).dt.to_timestamp()
+
+        stub_m = (anv.dt.day - 1) / anv.dt.days_in_month
+        last = (offset_m - 1 + stub_m).mask(
+            proj.date_(i + 1) < anv, proj.months_in_step(i))
+
+        pd.testing.assert_series_equal(
+            proj.next_anniversary(i, freq_id), anv, check_names=False)
+        pd.testing.assert_series_equal(
+            proj.last_part(i, freq_id), last, check_names=False)
+        assert (proj.duration_m(i) == diff_m).all()
+
+
+def test_basicterm_asl_shared_pricing(basicterm_asl):
+    """Check Pricing shares the intermediates of Projection"""
+
+    proj = basicterm_asl
+    pricing = proj.model.Pricing
+
+    assert pricing.step_calendar() is proj.step_calendar()
+    assert pricing.mort_table_array() is proj.mort_table_array()
+
+    # A calendar longer than Projection's is taken by the months
+    months = proj.step_calendar()["months_"].iat[-1] + 24
+    cal = pricing.step_calendar(months)
+    assert cal["months_"].iat[-1] >= months
+    pd.testing.assert_frame_equal(
+        cal.iloc[:len(proj.step_calendar())], proj.step_calendar())
+
+
+def test_basicterm_asl_premium_arrays(basicterm_asl):
+    """Check 3D premium timing arrays against step by step calculation"""
+
+    proj = basicterm_asl
+    freq = proj.payment_freq()
+    interval = 12 // freq
+
+    assert proj.check_pay_count()
+
+    for i in range(proj.max_proj_len()):
+        paid_next = (proj.duration_m(i+1) % 12) // interval + 1
+        paid_last = (proj.duration_m(i) % 12) // interval + 1
+        same_year = proj.duration_y(i) == proj.duration_y(i+1)
+
+        count_last = proj.is_paying(i) * (
+            paid_next.where(same_year, freq) - paid_last)
+        count_next = proj.is_paying(i+1) * paid_next.where(~same_year, 0)
+
+        lag_last = (proj.last_part(i, 'PREM')
+                    + np.maximum(count_last - 1, 0) * interval / 2)
+        lag_next = np.maximum(count_next - 1, 0) * interval / 2
+
+        disc_last = (1 + proj.disc_rate(i))**(
+            -(proj.months_(i) + lag_last) / 12)
+        disc_next = (1 + proj.disc_rate(i))**(
+            -(proj.months_(i) + proj.last_part(i) + lag_next) / 12)
+
+        for k, j in enumerate(['LAST', 'NEXT']):
+            expected = [count_last, count_next][k]
+            assert (proj.pay_count(i, j) == expected).all()
+            assert (proj.pay_count_array()[:, i, k] == expected).all()
+
+            np.testing.assert_array_equal(
+                proj.payment_lag(i, j), [lag_last, lag_next][k])
+            np.testing.assert_array_equal(
+                proj.disc_factors_prem(j)[:, i], [disc_last, disc_next][k])
+
+
+def test_basicterm_asl_engine(basicterm_asl):
+    """Check the array engine gives the same results as the cells"""
+
+    model = basicterm_asl.model
+    expected = [model.Projection.result_pv(), model.Projection.pv_pols_if(),
+                model.Pricing.premium_pp()]
+
+    model.Base.engine = "array"
+    try:
+        actual = [model.Projection.result_pv(), model.Projection.pv_pols_if(),
+                  model.Pricing.premium_pp()]
+    finally:
+        model.Base.engine = "cells"
+
+    pd.testing.assert_frame_equal(actual[0], expected[0], check_exact=True)
+    np.testing.assert_array_equal(actual[1], expected[1])
+    pd.testing.assert_series_equal(actual[2], expected[2], check_exact=True)
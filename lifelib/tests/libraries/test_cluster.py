@@ -0,0 +1,28 @@
+import itertools
+import os.path
+
+import modelx as mx
+import pandas as pd
+
+from lifelib._dirs import TEMPLATES
+
+libpath = TEMPLATES['cluster']
+
+
+def test_result_pv_sens():
+    """Check result_pv_sens matches result_pv of the dynamic spaces"""
+
+    model = mx.read_model(os.path.join(libpath, 'BasicTerm_ME_for_Cluster'))
+    proj = model.Projection
+    proj.model_point_table = proj.model_point_table.iloc[:1000]
+
+    lapse_rate_mults, mort_rate_mults = (0.5, 1, 1.5), (0.9, 1.2)
+    actual = proj.result_pv_sens(lapse_rate_mults, mort_rate_mults)
+
+    expected = pd.concat(
+        {key: proj[key].result_pv() for key
+         in itertools.product(lapse_rate_mults, mort_rate_mults)},
+        names=["lapse_rate_mult", "mort_rate_mult"])
+
+    pd.testing.assert_frame_equal(actual, expected)
+    model.close()
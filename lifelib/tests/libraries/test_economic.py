@@ -0,0 +1,27 @@
+import os.path
+
+import modelx as mx
+import numpy as np
+
+from lifelib._dirs import TEMPLATES
+
+libpath = TEMPLATES['economic']
+
+
+def test_hullwhite_scen_offset():
+    """Check random numbers of each scenario do not depend on the others"""
+
+    model = mx.read_model(os.path.join(libpath, 'BasicHullWhite'))
+    hw = model.HullWhite
+    hw.scen_size = 20
+    expected = hw.std_norm_rand(hw.seed1)
+
+    hw.scen_offset, hw.scen_size = 5, 10
+    np.testing.assert_array_equal(hw.std_norm_rand(hw.seed1), expected[5:15])
+
+    children = np.random.SeedSequence(hw.seed2).spawn(15)
+    np.testing.assert_array_equal(
+        hw.std_norm_rand(hw.seed2)[0],
+        np.random.default_rng(children[5]).standard_normal(hw.step_size))
+
+    model.close()
@@ -0,0 +1,214 @@
+import os.path
+
+import modelx as mx
+import numpy as np
+import pandas as pd
+import pytest
+
+from lifelib._dirs import TEMPLATES
+
+libpath = TEMPLATES['savings']
+
+
+@pytest.fixture(scope="module")
+def cashvalue_me():
+    model = mx.read_model(os.path.join(libpath, 'CashValue_ME'))
+    yield model.Projection
+    model.close()
+
+
+def test_cashvalue_me_mort_rate(cashvalue_me):
+    """Check mort_rate gives the same rates as mort_table_reindexed"""
+
+    proj = cashvalue_me
+    for t in range(0, proj.max_proj_len(), 12):
+        mi = pd.MultiIndex.from_arrays(
+            [proj.age(t), np.minimum(proj.duration(t), 5)])
+        expected = proj.mort_table_reindexed().reindex(
+            mi, fill_value=0).set_axis(proj.model_point().index)
+
+        pd.testing.assert_series_equal(
+            proj.mort_rate(t), expected, check_names=False)
+
+
+@pytest.mark.parametrize("engine", ["stream"])
+def test_cashvalue_me_engine(cashvalue_me, engine):
+    """Check all engines give the same results as the default"""
+
+    proj = cashvalue_me
+    results = ['result_cf', 'result_pv', 'result_pols']
+
+    proj.engine = "cells"
+    expected = [getattr(proj, name)() for name in results]
+
+    proj.engine = engine
+    actual = [getattr(proj, name)() for name in results]
+    proj.engine = "cells"
+
+    for a, e in zip(actual, expected):
+        pd.testing.assert_frame_equal(a, e)
+
+
+def _lapse_rate_func():
+    return lambda dur: np.maximum(0.2 - 0.05 * dur, 0.01)
+
+
+def _mort_rate_func():
+    lookup, table = table_lookup(), mort_table_array()
+    return lambda x, dur: 2 * lookup(table, x, np.minimum(dur, 3))
+
+
+def _coi_rate_func():
+    return lambda mort_mth: 1.5 * mort_mth
+
+
+def _commission_rate_func():
+    return lambda dur: np.where(dur < 2, 0.1, 0.02)
+
+
+@pytest.mark.parametrize("engine", ["stream"])
+def test_cashvalue_me_engine_assumptions(cashvalue_me, engine):
+    """Check changes to the assumptions are reflected in all engines"""
+
+    proj = cashvalue_me
+    funcs = {'lapse_rate_func': _lapse_rate_func,
+             'mort_rate_func': _mort_rate_func,
+             'coi_rate_func': _coi_rate_func,
+             'commission_rate_func': _commission_rate_func}
+    originals = {name: proj.cells[name].formula for name in funcs}
+    default = proj.result_pv()
+
+    try:
+        for name, func in funcs.items():
+            proj.cells[name].formula = func
+
+        proj.engine = "cells"
+        expected = proj.result_pv()
+        proj.engine = engine
+        actual = proj.result_pv()
+    finally:
+        proj.engine = "cells"
+        for name, formula in originals.items():
+            proj.cells[name].formula = formula
+
+    assert not np.allclose(expected.values, default.values)
+    pd.testing.assert_frame_equal(actual, expected)
+    pd.testing.assert_frame_equal(proj.result_pv(), default)
+
+
+def test_cashvalue_se_engine():
+    """Check the scalar engine gives the same present values as the cells"""
+
+    model = mx.read_model(os.path.join(libpath, 'CashValue_SE'))
+    proj = model.Projection
+    point_ids = proj.model_point_table.index
+
+    expected = [proj[i].result_pv() for i in point_ids]
+
+    proj.engine = "scalar"
+    for i, e in zip(point_ids, expected):
+        pd.testing.assert_frame_equal(proj[i].result_pv(), e)
+        assert len(proj[i].av_pp_at) == 0
+
+    model.close()
+
+
+def _se_lapse_rate_func():
+    return lambda dur: max(0.2 - 0.05 * dur, 0.01)
+
+
+def _se_mort_rate_func():
+    lookup, table = table_lookup(), mort_table_array()
+    return lambda x, dur: 2 * lookup(table, x, max(min(3, dur), 0))
+
+
+def _se_coi_rate_func():
+    return lambda mort_mth: 1.5 * mort_mth
+
+
+def _se_commission_rate_func():
+    return lambda dur: 0.1 if dur < 2 else 0.02
+
+
+def test_cashvalue_se_engine_assumptions():
+    """Check changes to the assumptions are reflected in the scalar engine"""
+
+    model = mx.read_model(os.path.join(libpath, 'CashValue_SE'))
+    proj = model.Projection
+    point_ids = proj.model_point_table.index
+    default = [proj[i].result_pv() for i in point_ids]
+
+    proj.lapse_rate_func.formula = _se_lapse_rate_func
+    proj.mort_rate_func.formula = _se_mort_rate_func
+    proj.coi_rate_func.formula = _se_coi_rate_func
+    proj.commission_rate_func.formula = _se_commission_rate_func
+    expected = [proj[i].result_pv() for i in point_ids]
+
+    proj.engine = "scalar"
+    for i, d, e in zip(point_ids, default, expected):
+        assert not np.allclose(e.values, d.values)
+        pd.testing.assert_frame_equal(proj[i].result_pv(), e)
+
+    model.close()
+
+
+@pytest.mark.parametrize("sim_id", [1, 4, 5])
+def test_cashvalue_ex2_engine(sim_id):
+    """Check the broadcast engine gives the same results as the cells"""
+
+    model = mx.read_model(os.path.join(libpath, 'CashValue_ME_EX2'))
+    proj = model.Projection
+    proj.scen_size = 100
+    proj.model_point_table = proj.model_point_moneyness
+
+    expected = [proj[sim_id].result_pv(), proj[sim_id].monte_carlo()]
+
+    proj.engine = "broadcast"
+    actual = [proj[sim_id].result_pv(), proj[sim_id].monte_carlo()]
+    assert len(proj[sim_id].av_pp_at) == 0
+    assert len(proj[sim_id].model_point) == 0
+
+    for a, e in zip(actual, expected):
+        pd.testing.assert_frame_equal(a, e, rtol=1e-10)
+
+    model.close()
+
+
+def test_cashvalue_ex2_scen_offset():
+    """Check a subset of scenarios gives the same results as all of them"""
+
+    model = mx.read_model(os.path.join(libpath, 'CashValue_ME_EX2'))
+    proj = model.Projection
+    proj.scen_size = 30
+    proj.model_point_table = proj.model_point_moneyness
+    expected = proj[1].result_pv()
+
+    proj.scen_offset, proj.scen_size = 10, 12
+    actual = proj[1].result_pv()
+    assert list(actual.index.unique('scen_id')) == list(range(11, 23))
+    pd.testing.assert_frame_equal(actual, expected.loc[actual.index])
+
+    model.close()
+
+
+def test_cashvalue_ex2_sobol_model_points():
+    """Check Sobol scenarios of a model point do not depend on the others"""
+
+    model = mx.read_model(os.path.join(libpath, 'CashValue_ME_EX2'))
+    proj = model.Projection
+    proj.scen_method, proj.sobol_size, proj.scen_size = "sobol", 16, 16
+    table = proj.model_point_moneyness
+    proj.model_point_table = table
+    expected = proj[1].result_pv().loc[1]
+
+    longer = table.iloc[[0]].assign(policy_term=20)
+    longer.index = pd.Index([len(table) + 1], name=table.index.name)
+    proj.model_point_table = pd.concat([table, longer])
+    assert proj.max_proj_len_ext() > 121
+    pd.testing.assert_frame_equal(proj[1].result_pv().loc[1], expected)
+
+    proj.sobol_dim = 200
+    with pytest.raises(mx.core.errors.FormulaError):
+        proj[1].result_pv()
+
+    model.close()
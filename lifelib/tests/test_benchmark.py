@@ -0,0 +1,44 @@
+import json
+
+import pandas as pd
+import pytest
+
+from lifelib.benchmark import (
+    synthetic_table, run_benchmarks, load_results, compare_results)
+
+
+def test_synthetic_table():
+
+    table = pd.DataFrame({'x': [1, 2, 3], 'y': ['a', 'b', 'c']},
+                         index=pd.Index([10, 20, 30], name='point_id'))
+
+    result = synthetic_table(table, 100, seed=1)
+    assert len(result) == 100
+    assert list(result.index) == list(range(1, 101))
+    assert result.index.name == 'point_id'
+    assert set(result['x']) <= {1, 2, 3}
+    assert (result['y'] == result['x'].map({1: 'a', 2: 'b', 3: 'c'})).all()
+
+    pd.testing.assert_frame_equal(result, synthetic_table(table, 100, seed=1))
+
+
+def test_run_benchmarks(tmp_path):
+
+    output = str(tmp_path / "bench.json")
+    result = run_benchmarks(['BasicTerm_S', 'BasicTerm_M'], sizes=[10],
+                            output=output)
+
+    with open(output) as f:
+        assert json.load(f) == result
+
+    s, m = result['results']
+    assert s['pv_net_cf'] == pytest.approx(m['pv_net_cf'])
+    for r in (s, m):
+        assert r['wall_time'] > 0
+        assert r['cell_times']['Projection.pv_net_cf'] > 0
+
+    df = load_results(output)
+    assert list(df.index) == [('BasicTerm_S', 10), ('BasicTerm_M', 10)]
+
+    comp = compare_results(output, output)
+    assert (comp['wall_time_ratio'] == 1).all()
@@ -0,0 +1,121 @@
+import os
+import os.path
+from concurrent.futures import ProcessPoolExecutor
+
+import modelx as mx
+import pandas as pd
+
+from lifelib._dirs import TEMPLATES
+from lifelib import cache
+from lifelib.cache import read_excel, read_model
+
+
+def test_read_excel(tmp_path):
+
+    src = str(tmp_path / "table.xlsx")
+    cache_dir = str(tmp_path / "cache")
+
+    df = pd.DataFrame({'x': [1, 2, 3]}, index=pd.Index([1, 2, 3], name='id'))
+    df.to_excel(src)
+
+    first = read_excel(src, cache_dir=cache_dir, index_col=0)
+    assert len(os.listdir(cache_dir)) == 1
+    second = read_excel(src, cache_dir=cache_dir, index_col=0)
+    pd.testing.assert_frame_equal(first, df)
+    pd.testing.assert_frame_equal(second, df)
+
+    # Modifying the source invalidates the cache
+    df['x'] = [4, 5, 6]
+    df.to_excel(src)
+
+    third = read_excel(src, cache_dir=cache_dir, index_col=0)
+    pd.testing.assert_frame_equal(third, df)
+    assert len(os.listdir(cache_dir)) == 1
+
+
+def test_read_excel_sheets(tmp_path, monkeypatch):
+    """Check tables read from different sheets are cached separately"""
+
+    src = str(tmp_path / "table.xlsx")
+    cache_dir = str(tmp_path / "cache")
+
+    dfs = {name: pd.DataFrame({'x': [i, i + 1]}, index=pd.Index([1, 2], name='id'))
+           for i, name in enumerate(['A', 'B'])}
+    with pd.ExcelWriter(src) as writer:
+        for name, df in dfs.items():
+            df.to_excel(writer, sheet_name=name)
+
+    calls = []
+    original = cache._read_excel
+
+    def counted_read_excel(*args, **kwargs):
+        calls.append(kwargs['sheet_name'])
+        return original(*args, **kwargs)
+
+    for name in dfs:
+        read_excel(src, cache_dir=cache_dir, sheet_name=name, index_col=0)
+
+    monkeypatch.setattr(cache, '_read_excel', counted_read_excel)
+    for name, df in dfs.items():
+        pd.testing.assert_frame_equal(
+            read_excel(src, cache_dir=cache_dir, sheet_name=name, index_col=0),
+            df)
+
+    assert calls == []
+    assert len(os.listdir(cache_dir)) == 2
+
+
+def test_read_excel_broken(tmp_path):
+    """Check a cache file that cannot be read is replaced"""
+
+    src = str(tmp_path / "table.xlsx")
+    cache_dir = str(tmp_path / "cache")
+
+    df = pd.DataFrame({'x': [1, 2, 3]}, index=pd.Index([1, 2, 3], name='id'))
+    df.to_excel(src)
+
+    cached = cache.cache_path(src, cache_dir, index_col=0)
+    os.makedirs(cache_dir)
+    with open(cached, "wb") as f:
+        f.write(b"\x80\x04")
+
+    pd.testing.assert_frame_equal(
+        read_excel(src, cache_dir=cache_dir, index_col=0), df)
+    pd.testing.assert_frame_equal(pd.read_pickle(cached), df)
+    assert os.listdir(cache_dir) == [os.path.basename(cached)]
+
+
+def test_read_excel_processes(tmp_path):
+    """Check processes can read the same file through a cold cache"""
+
+    src = str(tmp_path / "table.xlsx")
+    cache_dir = str(tmp_path / "cache")
+
+    df = pd.DataFrame({'x': range(1000)}, index=pd.Index(range(1000), name='id'))
+    df.to_excel(src)
+
+    with ProcessPoolExecutor(max_workers=8) as executor:
+        futures = [executor.submit(read_excel, src, cache_dir, index_col=0)
+                   for _ in range(16)]
+        for future in futures:
+            pd.testing.assert_frame_equal(future.result(), df)
+
+    assert len(os.listdir(cache_dir)) == 1
+
+
+def test_read_model(tmp_path):
+
+    path = os.path.join(TEMPLATES['basiclife'], 'BasicTerm_ME')
+    cache_dir = str(tmp_path)
+
+    model = mx.read_model(path)
+    expected = model.Projection.result_pv()
+    model.close()
+
+    for _ in range(2):
+        model = read_model(path, cache_dir=cache_dir)
+        pd.testing.assert_frame_equal(model.Projection.result_pv(), expected)
+        model.close()
+
+    assert os.listdir(cache_dir)
+    assert pd.read_excel is cache._read_excel
@@ -0,0 +1,61 @@
+import os.path
+
+import modelx as mx
+import numpy as np
+import pandas as pd
+import pytest
+
+from lifelib._dirs import TEMPLATES
+from lifelib.export import write_cells, read_cells, column_name
+
+libpath = TEMPLATES['basiclife']
+
+
+@pytest.fixture(scope="module")
+def basicterm_asl():
+    model = mx.read_model(os.path.join(libpath, 'BasicTermASL_ME'))
+    model.Base.model_point_table = model.Base.model_point_table.iloc[:30]
+    yield model.Projection
+    model.close()
+
+
+@pytest.mark.parametrize("ext", [".csv", ".parquet", ".arrow"])
+def test_write_cells(basicterm_asl, tmp_path, ext):
+
+    if ext != ".csv":
+        pytest.importorskip("pyarrow")
+
+    proj = basicterm_asl
+    cells = ["premiums", "claims", ("pay_count", "LAST")]
+    path = str(tmp_path / ("cells" + ext))
+
+    rows = write_cells(path, proj, cells, chunks=7)
+    result = read_cells(path)
+
+    assert rows == len(result)
+    assert list(result.columns) == [
+        "policy_id", "step", "premiums", "claims", "pay_count_LAST"]
+    assert column_name(("pay_count", "LAST")) == "pay_count_LAST"
+
+    # Each chunk is projected for its own length, and
+    # the values beyond the length are 0.
+    for c in cells:
+        name, j = (c, None) if isinstance(c, str) else c
+        expected = proj.result_cells(name, j=j).stack()
+        expected.index.names = ["policy_id", "step"]
+
+        actual = result.set_index(["policy_id", "step"])[column_name(c)]
+        expected, actual = expected.align(actual, fill_value=0)
+        np.testing.assert_allclose(actual, expected)
+
+    pd.testing.assert_frame_equal(read_cells(path, columns=["step"]),
+                                  result[["step"]])
+
+    # A row group or a record batch is written per chunk
+    if ext == ".parquet":
+        import pyarrow.parquet
+        assert pyarrow.parquet.ParquetFile(path).num_row_groups == 5
+    elif ext == ".arrow":
+        import pyarrow.ipc
+        with pyarrow.ipc.open_file(path) as reader:
+            assert reader.num_record_batches == 5
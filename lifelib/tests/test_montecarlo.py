@@ -0,0 +1,187 @@
+import logging
+import os.path
+
+import modelx as mx
+import numpy as np
+import pandas as pd
+import pytest
+
+from lifelib._dirs import TEMPLATES
+from lifelib.montecarlo import run_batches, run_until, OPTION_PUT
+
+libpath = TEMPLATES['savings']
+
+
+@pytest.fixture(scope="module")
+def cashvalue_ex4():
+    model = mx.read_model(os.path.join(libpath, 'CashValue_ME_EX4'))
+    yield model.Projection
+    model.close()
+
+
+def test_std_norm_rand_offset(cashvalue_ex4):
+    """Check random numbers of each scenario do not depend on the batch"""
+
+    proj = cashvalue_ex4
+    proj.scen_size = 50
+    expected = proj.std_norm_rand()
+
+    try:
+        proj.scen_size, proj.scen_offset = 7, 31
+        np.testing.assert_array_equal(proj.std_norm_rand(), expected[31:38])
+        assert list(proj.scen_index()) == list(range(32, 39))
+
+        gen = np.random.default_rng(np.random.SeedSequence(1234, spawn_key=(32,)))
+        np.testing.assert_array_equal(
+            proj.std_norm_rand()[0], gen.standard_normal(proj.max_proj_len()))
+    finally:
+        proj.scen_size, proj.scen_offset = 1000, 0
+
+
+def test_run_batches(cashvalue_ex4):
+    """Check the results are the same regardless of the batch size"""
+
+    proj = cashvalue_ex4
+    expected = run_batches(proj, 40, 40)
+
+    for batch_size in (7, 16):
+        actual = run_batches(proj, 40, batch_size)
+        assert actual.count == 40
+        pd.testing.assert_frame_equal(
+            actual.result(), expected.result(), check_exact=True)
+        pd.testing.assert_frame_equal(
+            actual.total(), expected.total(), check_exact=True)
+
+    assert (proj.scen_offset, proj.scen_size) == (0, 1000)
+
+    # Compare with all the scenarios run at once
+    proj.scen_size = 40
+    try:
+        values = proj.pv_net_cf().reshape(len(proj.model_point_table_ext()), -1)
+    finally:
+        proj.scen_size = 1000
+
+    result = expected.result()['pv_net_cf']
+    np.testing.assert_allclose(result['mean'], values.mean(axis=1))
+    np.testing.assert_allclose(
+        result['std_err'], values.std(axis=1, ddof=1) / np.sqrt(40),
+        atol=1e-6)
+
+
+def test_scen_method(cashvalue_ex4):
+    """Check antithetic pairs and Sobol blocks do not depend on the batch"""
+
+    proj = cashvalue_ex4
+    proj.scen_size, proj.sobol_size = 32, 16
+    try:
+        proj.scen_method = "antithetic"
+        rnd = proj.std_norm_rand()
+        np.testing.assert_array_equal(rnd[1::2], -rnd[::2])
+        assert proj.scen_block_size() == 2
+
+        proj.scen_method = "sobol"
+        expected = proj.std_norm_rand()
+        assert proj.scen_block_size() == 16
+        np.testing.assert_allclose(expected.mean(), 0, atol=0.01)
+        np.testing.assert_allclose(expected.std(), 1, atol=0.01)
+
+        proj.scen_offset, proj.scen_size = 10, 12
+        np.testing.assert_array_equal(proj.std_norm_rand(), expected[10:22])
+        proj.scen_offset = 0
+
+        with pytest.raises(ValueError):
+            run_batches(proj, 32, 8)
+
+        pd.testing.assert_frame_equal(
+            run_batches(proj, 32, 16).result(),
+            run_batches(proj, 32, 32).result(), check_exact=True)
+
+    finally:
+        proj.scen_method = "plain"
+        proj.scen_size, proj.scen_offset, proj.sobol_size = 1000, 0, 256
+
+
+def test_control_variate(cashvalue_ex4):
+    """Check the control variate against its closed-form values"""
+
+    proj = cashvalue_ex4
+    expected = proj.option_put_value()
+    stats = run_batches(proj, 200, 100, outputs=['option_put_payoff'])
+    mean, std_err = stats.estimate('option_put_payoff')
+    assert (abs(mean - expected) <= 4 * std_err).all()
+
+    # The control variate reproduces its own expected values exactly
+    stats = run_batches(proj, 200, 100, outputs=['option_put_payoff'],
+                        control=OPTION_PUT)
+    mean, std_err = stats.estimate('option_put_payoff')
+    np.testing.assert_allclose(mean, expected)
+    np.testing.assert_allclose(std_err, 0, atol=1e-6)
+
+
+def test_run_batches_item_space():
+    """Check run_batches on an item space of CashValue_ME_EX2"""
+
+    model = mx.read_model(os.path.join(libpath, 'CashValue_ME_EX2'))
+    proj = model.Projection
+    proj.model_point_table = proj.model_point_moneyness
+    proj.scen_size = 20
+    expected = proj[5].monte_carlo()
+
+    proj.scen_method = "antithetic"
+    stats = run_batches(proj, 40, 20, params=(5,), control=OPTION_PUT,
+                        outputs=[('pv_claims_over_av', 'DEATH')])
+    assert stats.blocks == 20
+    assert proj.scen_size == 20
+
+    proj.scen_method = "plain"
+    stats = run_batches(proj, 20, 10, params=(5,),
+                        outputs=[('pv_claims_over_av', 'DEATH')])
+    np.testing.assert_allclose(
+        stats.estimate('pv_claims_over_av_DEATH')[0], expected['GMDB'])
+
+    model.close()
+
+
+def test_run_until(cashvalue_ex4, caplog):
+    """Check run_until stops at the tolerance or at the cap"""
+
+    proj = cashvalue_ex4
+    with caplog.at_level(logging.INFO, logger='lifelib.montecarlo'):
+        stats = run_until(proj, 1e-9, 60, 20, min_blocks=1)
+    assert not stats.converged
+    assert stats.count == 60
+    assert list(stats.trace.index) == [20, 40, 60]
+    assert len(caplog.records) == 3
+
+    errors = stats.trace.xs('error', axis=1, level=1)
+    tol = errors.max(axis=1).iloc[1]
+    stats = run_until(proj, tol, 60, 20, min_blocks=1)
+    assert stats.converged
+    assert stats.count == 40
+
+    pd.testing.assert_frame_equal(
+        stats.result(), run_batches(proj, 40, 40).result(), check_exact=True)
+    assert (proj.scen_offset, proj.scen_size) == (0, 1000)
+
+    # The errors are not checked before min_blocks
+    stats = run_until(proj, 1, 60, 20, min_blocks=50)
+    assert stats.converged
+    assert stats.count == 60
+
+
+def test_run_until_cap(cashvalue_ex4):
+    """Check the statistics are returned for zero or short caps"""
+
+    proj = cashvalue_ex4
+    stats = run_batches(proj, 0, 20)
+    assert stats.count == 0
+    assert len(stats.result()) == len(proj.model_point_table_ext())
+
+    with pytest.raises(ValueError):
+        run_until(proj, 1e-9, 0, 20)
+
+    stats = run_until(proj, 1e-9, 10, 20, min_blocks=1)
+    assert not stats.converged
+    assert stats.count == 10
+    assert list(stats.trace.index) == [10]
+    assert (proj.scen_offset, proj.scen_size) == (0, 1000)
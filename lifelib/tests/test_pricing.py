@@ -0,0 +1,97 @@
+import os.path
+
+import modelx as mx
+import pandas as pd
+import pytest
+
+from lifelib._dirs import TEMPLATES
+from lifelib.pricing import PricingService
+
+libpath = TEMPLATES['basiclife']
+
+
+@pytest.fixture(scope="module")
+def basicterm_asl():
+    model = mx.read_model(os.path.join(libpath, 'BasicTermASL_ME'))
+    yield model
+    model.close()
+
+
+def test_pricing_service(basicterm_asl):
+    """Check premiums of batches are the same as those of all model points"""
+
+    model = basicterm_asl
+    table = model.Pricing.model_point_table
+    expected = model.Pricing.premium_pp()
+
+    service = PricingService(model)
+    for seed, size in enumerate([1, 5, 20, 5]):
+        batch = table.sample(size, random_state=seed)
+        pd.testing.assert_series_equal(
+            service.price(batch), expected[batch.index], check_exact=True)
+
+    # The values read from Projection are kept between the batches
+    assert len(model.Projection.disc_rate) >= model.Pricing.max_proj_len()
+    service.close()
+
+    assert model.Pricing.model_point_table is table
+    assert model.Pricing.engine == "cells"
+    pd.testing.assert_series_equal(model.Pricing.premium_pp(), expected)
+
+
+def test_pricing_service_records(basicterm_asl):
+    """Check model points can be given as dicts"""
+
+    table = basicterm_asl.Pricing.model_point_table.iloc[:3]
+    service = PricingService(basicterm_asl)
+    try:
+        result = service.price(
+            table.drop(columns=['policy_count', 'issue_date']).to_dict('records'))
+        assert list(result.index) == [1, 2, 3]
+        assert list(result) == list(service.price(table))
+
+        with pytest.raises(ValueError):
+            service.price([{"age_at_entry": 30, "policy_term": 10}])
+    finally:
+        service.close()
+
+
+def test_pricing_service_close(basicterm_asl):
+    """Check Pricing inherits the model points from Base after close"""
+
+    model = basicterm_asl
+    table = model.Base.model_point_table
+    service = PricingService(model)
+    service.price(table.iloc[:5])
+    service.close()
+
+    try:
+        model.Base.model_point_table = table.iloc[:50]
+        assert model.Pricing.model_point_table is model.Base.model_point_table
+        actual = model.Projection.result_pv()
+    finally:
+        model.Base.model_point_table = table
+
+    fresh = mx.read_model(os.path.join(libpath, 'BasicTermASL_ME'))
+    try:
+        fresh.Base.model_point_table = table.iloc[:50]
+        pd.testing.assert_frame_equal(actual, fresh.Projection.result_pv())
+    finally:
+        fresh.close()
+
+
+def test_pricing_service_close_override(basicterm_asl):
+    """Check close keeps a ref that Pricing overrides with an equal value"""
+
+    model = basicterm_asl
+    model.Pricing.engine = model.Base.engine    # Overridden by the same object
+    try:
+        service = PricingService(model)
+        service.price(model.Base.model_point_table.iloc[:2])
+        service.close()
+
+        model.Base.engine = "array"
+        assert model.Pricing.engine == "cells"
+    finally:
+        model.Base.engine = "cells"
+        del model.Pricing.engine
@@ -0,0 +1,128 @@
+import os.path
+
+import modelx as mx
+import pandas as pd
+import pytest
+
+from lifelib._dirs import TEMPLATES
+from lifelib.runner import (
+    iter_chunks, combine_results, run_chunked, run_parallel, run_seriatim,
+    write_mmap_table, read_mmap_table)
+
+models = [
+    ('basiclife', 'BasicTerm_ME'),
+    ('basiclife', 'BasicTermASL_ME'),
+    ('savings', 'CashValue_ME')
+]
+
+
+@pytest.fixture(params=models, ids=[name for _, name in models])
+def model(request):
+    library, name = request.param
+    model = mx.read_model(os.path.join(TEMPLATES[library], name))
+    yield model
+    model.close()
+
+
+def test_iter_chunks():
+    table = pd.DataFrame({'x': range(10)})
+    chunks = list(iter_chunks(table, 4))
+
+    assert [len(c) for c in chunks] == [4, 4, 2]
+    pd.testing.assert_frame_equal(pd.concat(chunks), table)
+
+
+def test_combine_results_empty():
+    actual = combine_results([])
+
+    assert list(actual) == ['result_pv', 'result_cf', 'result_pols']
+    assert all(value.empty for value in actual.values())
+
+
+def test_mmap_table(tmp_path, model):
+
+    proj = model.Projection
+    space = proj.bases[0] if proj.bases else proj
+    table = space.model_point_table
+    write_mmap_table(table, str(tmp_path))
+
+    pd.testing.assert_frame_equal(read_mmap_table(str(tmp_path)), table)
+
+
+def test_run_chunked(model):
+
+    proj = model.Projection
+    space = proj.bases[0] if proj.bases else proj
+    space.model_point_table = space.model_point_table.iloc[:300]
+    table = proj.model_point_table
+
+    expected = {name: getattr(proj, name)()
+                for name in ['result_pv', 'result_cf', 'result_pols']}
+    actual = run_chunked(proj, 120)
+
+    pd.testing.assert_frame_equal(actual['result_pv'], expected['result_pv'])
+    for name in ['result_cf', 'result_pols']:
+        pd.testing.assert_frame_equal(
+            actual[name], expected[name], check_dtype=False)
+
+    assert proj.model_point_table is table
+
+
+@pytest.mark.parametrize("library, model_name, params, mmap", [
+    ('basiclife', 'BasicTerm_ME', None, False),
+    ('basiclife', 'BasicTerm_ME', None, True),
+    ('cluster', 'BasicTerm_ME_for_Cluster', (1.5, 1), False)
+])
+def test_run_parallel(tmp_path, library, model_name, params, mmap):
+
+    path = os.path.join(TEMPLATES[library], model_name)
+    model = mx.read_model(path)
+    proj = model.Projection if params is None else model.Projection[params]
+    expected = {name: getattr(proj, name)()
+                for name in ['result_pv', 'result_cf', 'result_pols']}
+    if mmap:
+        mmap_path = str(tmp_path / "mp")
+        write_mmap_table(model.Projection.model_point_table, mmap_path)
+    else:
+        mmap_path = None
+    model.close()
+
+    actual = run_parallel(path, processes=2, chunks=3000, params=params,
+                          mmap_path=mmap_path)
+
+    pd.testing.assert_frame_equal(actual['result_pv'], expected['result_pv'])
+    for name in ['result_cf', 'result_pols']:
+        pd.testing.assert_frame_equal(
+            actual[name], expected[name], check_dtype=False)
+
+
+def test_run_seriatim():
+
+    libpath = TEMPLATES['basiclife']
+    se = mx.read_model(os.path.join(libpath, 'BasicTerm_SE'))
+    me = mx.read_model(os.path.join(libpath, 'BasicTerm_ME'))
+
+    # 581 is future new business issued at age 20
+    point_ids = list(range(1, 31)) + [581]
+    existing = se.Projection[2]
+
+    result = run_seriatim(se.Projection, point_ids,
+                          results=['pv_net_cf', 'result_cf'])
+
+    assert list(se.Projection.itemspaces) == [2]
+    assert se.Projection[2] is existing
+
+    expected = pd.Series(me.Projection.pv_net_cf(),
+                         index=me.Projection.model_point().index)
+    pd.testing.assert_series_equal(
+        result['pv_net_cf'], expected[point_ids],
+        check_names=False, check_index_type=False)
+
+    cf = result['result_cf']
+    assert len(cf) == max(se.Projection[i].proj_len() for i in point_ids)
+    assert cf['Net Cashflow'].sum() == pytest.approx(sum(
+        se.Projection[i].result_cf()['Net Cashflow'].sum()
+        for i in point_ids))
+
+    se.close()
+    me.close()
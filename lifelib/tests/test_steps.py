@@ -0,0 +1,59 @@
+import os.path
+
+import modelx as mx
+import pandas as pd
+import pytest
+
+from lifelib._dirs import TEMPLATES
+from lifelib.steps import step_errors, choose_steps, monthly_grid
+
+
+@pytest.fixture(scope="module")
+def model():
+    model = mx.read_model(
+        os.path.join(TEMPLATES['basiclife'], 'BasicTermASL_ME'))
+    yield model
+    model.close()
+
+
+def test_step_errors(model):
+
+    base, proj = model.Base, model.Projection
+    table = base.model_point_table
+    sample = table.sample(100, random_state=0)
+
+    errors = step_errors(proj, [(0, 12), (60, 12), (0, 3)], table=sample)
+
+    # The original grid and model points are restored
+    assert (base.monthly_steps, base.coarse_months) == (60, 12)
+    assert base.model_point_table is table
+
+    assert list(errors.index) == [(0, 12), (60, 12), (0, 3),
+                                  (int(max(proj.proj_len())) + 12, 12)]
+    assert errors['steps'].is_monotonic_increasing
+    assert errors['error'].iat[-1] == 0
+    assert errors.loc[(0, 3), 'error'] < errors.loc[(0, 12), 'error']
+
+
+def test_choose_steps(model):
+
+    base, proj = model.Base, model.Projection
+    sample = base.model_point_table.sample(100, random_state=0)
+    candidates = [(0, 12), (0, 6), (0, 3)]
+
+    grid, errors = choose_steps(proj, 1, candidates, sample, apply=False)
+    assert grid == (0, 12)
+    assert (base.monthly_steps, base.coarse_months) == (60, 12)
+
+    grid, errors = choose_steps(proj, 0.003, candidates, sample)
+    assert errors.loc[grid, 'error'] <= 0.003
+    assert all(errors.loc[g, 'error'] > 0.003
+               for g in errors.index if errors.loc[g, 'steps']
+               < errors.loc[grid, 'steps'])
+    assert (base.monthly_steps, base.coarse_months) == grid
+    assert proj.offset(0) == pd.offsets.MonthEnd(grid[1])
+
+    grid, _ = choose_steps(proj, 0, candidates, sample)
+    assert grid == monthly_grid(proj)
+    assert all(proj.months_in_step(i) == 1
+               for i in range(proj.max_proj_len()))